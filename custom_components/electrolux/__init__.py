@@ -207,15 +207,25 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
                 coordinator.renew_task.get_name(),
             )
 
+            # Refresh the token ahead of expiry so requests don't wait on it
+            coordinator.token_refresh_task = entry.async_create_background_task(
+                hass,
+                coordinator.api.keep_token_fresh(),
+                name=f"Electrolux token refresh - {entry.title}",
+            )
+
             # Bind task cleanup to entry lifecycle - ensures tasks are cancelled when entry is unloaded/reloaded
             def cleanup_tasks():
-                _LOGGER.debug("async_setup_entry cleanup_tasks called - cancelling websocket tasks")
+                _LOGGER.debug("async_setup_entry cleanup_tasks called - cancelling websocket and token refresh tasks")
                 if coordinator.listen_task:
                     coordinator.listen_task.cancel()
                     _LOGGER.debug("Websocket listen task cancelled")
                 if coordinator.renew_task:
                     coordinator.renew_task.cancel()
                     _LOGGER.debug("Websocket renewal task cancelled")
+                if coordinator.token_refresh_task:
+                    coordinator.token_refresh_task.cancel()
+                    _LOGGER.debug("Token refresh task cancelled")
 
             entry.async_on_unload(cleanup_tasks)
             _LOGGER.debug("Cleanup handlers registered")
@@ -236,6 +246,8 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     async def _close_coordinator(event):
         """Close coordinator resources on HA shutdown."""
         _LOGGER.debug("async_setup_entry HA shutdown cleanup starting")
+        if coordinator.token_refresh_task:
+            coordinator.token_refresh_task.cancel()
         try:
             await coordinator.close_websocket()
             _LOGGER.debug("async_setup_entry websocket closed successfully during shutdown")
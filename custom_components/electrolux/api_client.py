@@ -532,6 +532,10 @@ class ElectroluxApiClient:
         # Use the ApplianceClient's send_command method
         return await self._handle_api_call(self._client.send_command(appliance_id, command))
 
+    async def keep_token_fresh(self) -> None:
+        """Refresh the token before it expires until cancelled; run as a background task."""
+        await self._token_manager.run_background_refresh()
+
     async def close(self):
         """Decisive cleanup of resources."""
         # 1. Stop the SSE stream
@@ -39,6 +39,9 @@ AUTH_ERROR_PHRASES = (
     "authentication required",
 )
 
+# One C-level scan over the message instead of a substring test per phrase.
+_AUTH_ERROR_PHRASE = re.compile("|".join(re.escape(phrase) for phrase in AUTH_ERROR_PHRASES))
+
 # Wording around an expired token varies ("token expired", "token has
 # expired", "access token is expired"), so match the pair rather than a phrase.
 _EXPIRED_TOKEN = re.compile(r"\btoken\b.{0,24}?\bexpired\b|\bexpired\b.{0,24}?\btoken\b")
@@ -84,4 +87,4 @@ def is_auth_error(ex: BaseException, *, auth_statuses: tuple[int, ...] = AUTH_ST
     message = str(ex).lower()
     if _EXPIRED_TOKEN.search(message):
         return True
-    return any(phrase in message for phrase in AUTH_ERROR_PHRASES)
+    return _AUTH_ERROR_PHRASE.search(message) is not None
@@ -43,6 +43,7 @@ CONF_TOKEN_EXPIRES_AT = "token_expires_at"
 
 # Token validity
 ACCESS_TOKEN_VALIDITY_SECONDS = 43200  # 12 hours
+TOKEN_REFRESH_BUFFER_SECONDS = 900  # Refresh proactively once less than 15 minutes remain
 
 # Defaults
 DEFAULT_WEBSOCKET_RENEWAL_DELAY = 7200  # 2 hours - balance between connection stability and rate limiting
@@ -121,6 +121,7 @@ class ElectroluxCoordinator(DataUpdateCoordinator):
         self.platforms: list[str] = []
         self.renew_task: asyncio.Task | None = None
         self.listen_task: asyncio.Task | None = None
+        self.token_refresh_task: asyncio.Task | None = None
         self.renew_interval = renew_interval
         self._deferred_tasks: set = set()  # Track deferred update tasks
         self._deferred_tasks_by_appliance: dict[str, asyncio.Task] = {}  # Track deferred tasks by appliance
@@ -29,6 +29,20 @@ from .util import ElectroluxApiClient
 
 _LOGGER: logging.Logger = logging.getLogger(__package__)
 
+# Capability keys holding per-program "values", in lookup order:
+# ovens/dishwashers/washers, dryers, then the alternative location
+_PROGRAM_CAPABILITY_ROOTS = (
+    "program",
+    "userSelections/programUID",
+    "cyclePersonalization/programUID",
+)
+
+# Upper bound on (program, constraint) entries kept per entity
+_CONSTRAINTS_CACHE_SIZE = 16
+
+# Entities whose program support also depends on the food probe being inserted
+_FOOD_PROBE_TEMPERATURE_ATTRS = frozenset({"targetFoodProbeTemperatureC", "targetFoodProbeTemperatureF"})
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -164,6 +178,8 @@ class ElectroluxEntity(CoordinatorEntity):
         self.entity_attr = entity_attr
         self.entity_type = entity_type
         self.entity_source = entity_source
+        # Nested sources (e.g. "userSelections/values") are walked on every value read
+        self._source_path: tuple[str, ...] = tuple(entity_source.split("/")) if entity_source else ()
         self.config_entry = config_entry
         self.pnc_id = pnc_id
         self.unit = unit
@@ -188,7 +204,25 @@ class ElectroluxEntity(CoordinatorEntity):
                 program_key = cycle_personalization.get("programUID")
         self._program_cache_key: str | None = program_key
         self._is_supported_cache: bool | None = None
-        self._constraints_cache: dict[str, Any] = {}
+        # Performance cache: program-only support results per program, valid for
+        # the capabilities mapping they were computed from
+        self._supported_by_program: dict[str, bool] = {}
+        self._supported_source: Any = None
+        # Performance cache: per-program constraints, valid for the capabilities
+        # mapping they were read from
+        self._constraints_cache: dict[tuple[str, str], Any] = {}
+        self._constraints_source: Any = None
+
+        # Performance cache: per-program capability lookups, valid only for the
+        # capabilities mapping they were read from (dropped when it is replaced)
+        self._program_caps_cache: dict[str, dict] = {}
+        self._program_caps_source: Any = None
+        self._program_caps_values: tuple[dict, ...] = ()
+        # Performance cache: triggers whose action targets this entity, valid for
+        # the capabilities mapping and entity_attr they were collected for
+        self._entity_triggers: list[tuple[str, dict]] = []
+        self._triggers_source: Any = None
+        self._triggers_attr: str | None = None
 
         # Set entity_key for consistent FRIENDLY_NAMES lookup
         # Strip any 'fppn' prefix (with or without underscore) and make case-insensitive for robust matching
@@ -291,7 +325,8 @@ class ElectroluxEntity(CoordinatorEntity):
         else:
             self._reported_state_cache = {}
 
-        # Performance: Invalidate program caches if program changed
+        # Performance: Invalidate the support cache if program changed
+        # (constraints are keyed by program and need no flush)
         # Check multiple locations where program might be stored
         current_program = self._reported_state_cache.get("program")
         if not current_program:
@@ -305,8 +340,12 @@ class ElectroluxEntity(CoordinatorEntity):
 
         if current_program != self._program_cache_key:
             self._program_cache_key = current_program
-            self._is_supported_cache = None
-            self._constraints_cache.clear()
+            # Reuse a stored result only while the capabilities payload is unchanged
+            capabilities = getattr(getattr(appliance, "data", None), "capabilities", None)
+            if current_program and capabilities is self._supported_source:
+                self._is_supported_cache = self._supported_by_program.get(current_program)
+            else:
+                self._is_supported_cache = None
 
         self.async_write_ha_state()
 
@@ -316,8 +355,9 @@ class ElectroluxEntity(CoordinatorEntity):
         Used for the evaluation of state_mapping one property to another.
         """
         if "/" in path:
-            if self.reported_state.get(path, None):
-                return self.reported_state.get(path)
+            # Some payloads report nested attributes under a flat "source/attr" key
+            if value := self.reported_state.get(path):
+                return value
             source, attr = path.split("/")
             return self.reported_state.get(source, {}).get(attr, None)
         return self.reported_state.get(path, None)
@@ -385,7 +425,7 @@ class ElectroluxEntity(CoordinatorEntity):
                     # Multi-level source path — navigate to the innermost dict
                     r_target: dict[str, Any] = reported
                     c_target: dict[str, Any] = self._reported_state_cache
-                    for part in self.entity_source.split("/"):
+                    for part in self._source_path:
                         if not isinstance(r_target.get(part), dict):
                             r_target[part] = {}
                         r_target = r_target[part]
@@ -924,9 +964,8 @@ class ElectroluxEntity(CoordinatorEntity):
             # Handle nested paths (e.g., userSelections/values)
             if value is None and self.entity_source:
                 if "/" in self.entity_source:
-                    parts = self.entity_source.split("/")
                     category: dict[str, Any] | None = self.reported_state
-                    for part in parts:
+                    for part in self._source_path:
                         if isinstance(category, dict):
                             category = category.get(part, None)
                         else:
@@ -1044,20 +1083,25 @@ class ElectroluxEntity(CoordinatorEntity):
 
         capabilities = appliance_data.capabilities
 
-        # Try "program" location first (ovens, dishwashers, washers)
-        program_caps = capabilities.get("program", {}).get("values", {}).get(current_program, {})
-        if program_caps:
-            return program_caps
+        # Performance: each entity repeats this walk for every constraint lookup
+        if capabilities is not self._program_caps_source:
+            self._program_caps_source = capabilities
+            self._program_caps_cache.clear()
+            # Resolve the program roots this appliance actually advertises once,
+            # so later lookups skip the locations it does not use
+            self._program_caps_values = tuple(
+                values for root in _PROGRAM_CAPABILITY_ROOTS if (values := capabilities.get(root, {}).get("values", {}))
+            )
+        elif current_program in self._program_caps_cache:
+            return self._program_caps_cache[current_program]
 
-        # Try "userSelections/programUID" location (dryers)
-        program_caps = capabilities.get("userSelections/programUID", {}).get("values", {}).get(current_program, {})
-        if program_caps:
-            return program_caps
+        program_caps: dict = {}
+        for values in self._program_caps_values:
+            program_caps = values.get(current_program, {})
+            if program_caps:
+                break
 
-        # Try "cyclePersonalization/programUID" location (alternative)
-        program_caps = (
-            capabilities.get("cyclePersonalization/programUID", {}).get("values", {}).get(current_program, {})
-        )
+        self._program_caps_cache[current_program] = program_caps
         return program_caps
 
     def _get_current_program_name(self) -> str | None:
@@ -1096,19 +1140,37 @@ class ElectroluxEntity(CoordinatorEntity):
         """Check if the entity is supported by the current program.
 
         Performance: Cache the result since this is called 5+ times per render
-        with expensive capability traversal. Invalidated when program changes.
+        with expensive capability traversal. Invalidated when program changes;
+        results that depend only on the program and the capabilities payload are
+        also kept per program, so switching back to a program reuses them.
         """
         # Return cached result if available (invalidated on program change)
         if self._is_supported_cache is not None:
             return self._is_supported_cache
 
-        # Compute support status
+        supported = self._compute_supported_by_program()
+        self._is_supported_cache = supported
+
+        # Trigger conditions and the food probe read live state, so those
+        # results are only valid until the next program change
+        if self._entity_triggers or self.entity_attr in _FOOD_PROBE_TEMPERATURE_ATTRS:
+            return supported
+        if not (program := self._get_current_program_name()):
+            return supported
+        capabilities = getattr(getattr(self.get_appliance, "data", None), "capabilities", None)
+        if capabilities is not self._supported_source:
+            self._supported_source = capabilities
+            self._supported_by_program.clear()
+        self._supported_by_program[program] = supported
+        return supported
+
+    def _compute_supported_by_program(self) -> bool:
+        """Evaluate program support for the entity without consulting the caches."""
         if self.entity_attr in [
             "program",
             "programUID",  # Always support programUID (entity_attr without source prefix)
             "userSelections/programUID",
         ]:
-            self._is_supported_cache = True
             return True
 
         # Get current program from various possible locations
@@ -1126,13 +1188,11 @@ class ElectroluxEntity(CoordinatorEntity):
                 current_program = cycle_personalization.get("programUID")
 
         if not current_program:
-            self._is_supported_cache = True
             return True  # If no program found, assume supported
 
         # Get program-specific capabilities from the correct location
         program_caps = self._get_program_capabilities(current_program)
         if not program_caps:
-            self._is_supported_cache = True
             return True  # If no program caps found, assume supported
 
         # Build the full capability path (entity_source/entity_attr)
@@ -1170,9 +1230,7 @@ class ElectroluxEntity(CoordinatorEntity):
         if not entity_found:
             # Special check for targetDuration: always available regardless of program
             if self.entity_attr == "targetDuration":
-                self._is_supported_cache = True
                 return True
-            self._is_supported_cache = False
             return False
 
         # Get the entity capability definition (try full path first, then just attr)
@@ -1194,56 +1252,59 @@ class ElectroluxEntity(CoordinatorEntity):
 
         # Process triggers that affect this entity
         if not (hasattr(self.get_appliance, "data") and self.get_appliance.data):
-            self._is_supported_cache = not disabled
             return not disabled
         if not (hasattr(self.get_appliance.data, "capabilities") and self.get_appliance.data.capabilities):
-            self._is_supported_cache = not disabled
             return not disabled
 
         all_capabilities = self.get_appliance.data.capabilities
-        for cap_name, cap_def in all_capabilities.items():
-            if isinstance(cap_def, dict) and "triggers" in cap_def:
-                for trigger in cap_def["triggers"]:
-                    if isinstance(trigger, dict) and "action" in trigger:
-                        action = trigger["action"]
-                        # Check if this trigger affects our entity
-                        if self.entity_attr in action:
-                            # Check if the condition is met
-                            if self._evaluate_trigger_condition(trigger.get("condition", {}), cap_name):
-                                # Apply the action
-                                entity_action = action[self.entity_attr]
-                                if isinstance(entity_action, dict) and "disabled" in entity_action:
-                                    disabled = entity_action["disabled"]
-                                    _LOGGER.debug(
-                                        "Trigger applied to %s: disabled=%s (trigger from %s)",
-                                        self.entity_attr,
-                                        disabled,
-                                        cap_name,
-                                    )
+        for cap_name, trigger in self._get_entity_triggers(all_capabilities):
+            # Check if the condition is met
+            if self._evaluate_trigger_condition(trigger.get("condition", {}), cap_name):
+                # Apply the action
+                entity_action = trigger["action"][self.entity_attr]
+                if isinstance(entity_action, dict) and "disabled" in entity_action:
+                    disabled = entity_action["disabled"]
+                    _LOGGER.debug(
+                        "Trigger applied to %s: disabled=%s (trigger from %s)",
+                        self.entity_attr,
+                        disabled,
+                        cap_name,
+                    )
 
         # If disabled by triggers or program settings, not supported
         if disabled:
-            self._is_supported_cache = False
             return False
 
         # Special check for food probe temperature: only available if probe is inserted
-        if self.entity_attr in [
-            "targetFoodProbeTemperatureC",
-            "targetFoodProbeTemperatureF",
-        ]:
+        if self.entity_attr in _FOOD_PROBE_TEMPERATURE_ATTRS:
             food_probe_state = self.reported_state.get("foodProbeInsertionState")
             if food_probe_state == FOOD_PROBE_STATE_NOT_INSERTED:
-                self._is_supported_cache = False
                 return False
 
         # targetDuration is always available regardless of program
         if self.entity_attr == "targetDuration":
-            self._is_supported_cache = True
             return True
 
-        self._is_supported_cache = True
         return True
 
+    def _get_entity_triggers(self, capabilities: dict[str, Any]) -> list[tuple[str, dict]]:
+        """Return the (capability name, trigger) pairs whose action targets this entity.
+
+        Performance: scanning every capability for triggers is done once per
+        capabilities payload instead of on every support check.
+        """
+        if capabilities is not self._triggers_source or self.entity_attr != self._triggers_attr:
+            self._triggers_source = capabilities
+            self._triggers_attr = self.entity_attr
+            self._entity_triggers = [
+                (cap_name, trigger)
+                for cap_name, cap_def in capabilities.items()
+                if isinstance(cap_def, dict) and "triggers" in cap_def
+                for trigger in cap_def["triggers"]
+                if isinstance(trigger, dict) and "action" in trigger and self.entity_attr in trigger["action"]
+            ]
+        return self._entity_triggers
+
     def _get_program_constraint(self, key: str) -> int | float | str | bool | None:
         """Get a specific constraint (min/max/step) for the current program.
 
@@ -1251,27 +1312,24 @@ class ElectroluxEntity(CoordinatorEntity):
         since the API only provides program constraints in Celsius.
 
         Performance: Cache constraints since this is called 4+ times per render
-        (min, max, step, default). Invalidated when program changes.
+        (min, max, step, default). Entries are keyed by program, so switching
+        programs needs no flush and switching back is served from the cache;
+        replacing the capabilities mapping drops them.
         """
-        # Return cached value if available
-        if key in self._constraints_cache:
-            return self._constraints_cache[key]
-
-        # Compute constraint value
-        # Get current program from various possible locations
-        current_program = self.reported_state.get("program")
-        if not current_program:
-            user_selections = self.reported_state.get("userSelections", {})
-            if isinstance(user_selections, dict):
-                current_program = user_selections.get("programUID")
-        if not current_program:
-            cycle_personalization = self.reported_state.get("cyclePersonalization", {})
-            if isinstance(cycle_personalization, dict):
-                current_program = cycle_personalization.get("programUID")
-
+        current_program = self._get_current_program_name()
         if not current_program:
             return None
 
+        capabilities = getattr(getattr(self.get_appliance, "data", None), "capabilities", None)
+        if capabilities is not self._constraints_source:
+            self._constraints_source = capabilities
+            self._constraints_cache.clear()
+
+        # Return cached value if available
+        cache_key = (current_program, key)
+        if cache_key in self._constraints_cache:
+            return self._constraints_cache[cache_key]
+
         try:
             # Get program-specific capabilities from the correct location
             program_caps = self._get_program_capabilities(current_program)
@@ -1309,8 +1367,10 @@ class ElectroluxEntity(CoordinatorEntity):
                             counterpart_attr,
                         )
 
-            # Cache the result (cleared on program change)
-            self._constraints_cache[key] = value
+            # Cache the result, evicting the oldest entry once the cache is full
+            if len(self._constraints_cache) >= _CONSTRAINTS_CACHE_SIZE:
+                del self._constraints_cache[next(iter(self._constraints_cache))]
+            self._constraints_cache[cache_key] = value
             return value
         except AttributeError:
             return None
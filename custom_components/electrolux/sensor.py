@@ -2,6 +2,7 @@
 
 import logging
 from datetime import datetime
+from functools import lru_cache
 from typing import Any
 
 from homeassistant.components.sensor import SensorDeviceClass, SensorEntity
@@ -18,6 +19,23 @@ _LOGGER: logging.Logger = logging.getLogger(__package__)
 PARALLEL_UPDATES = 0
 
 
+@lru_cache(maxsize=256)
+def _format_state_string(value: str) -> str:
+    """Return a raw string state formatted for display ("STEAM_TANK_FULL" -> "Steam Tank Full").
+
+    Performance: sensors reformat the same few enum states on every update, so
+    the result is memoized per raw string.
+    """
+    # Normalization fix for issue #55: Convert spaced variations like "End Of Cycle"
+    # into unified snake_case format ("End_Of_Cycle") before processing spaces/titles.
+    if value.lower().replace(" ", "") == "endofcycle":
+        value = "END_OF_CYCLE"
+
+    if "_" in value:
+        value = value.replace("_", " ")
+    return value.title()
+
+
 async def async_setup_entry(
     hass: HomeAssistant,
     entry: ConfigEntry,
@@ -238,14 +256,7 @@ class ElectroluxSensor(ElectroluxEntity, SensorEntity):
                 value = mapping.get(value, value)
 
         if isinstance(value, str):
-            # Normalization fix for issue #55: Convert spaced variations like "End Of Cycle"
-            # into unified snake_case format ("End_Of_Cycle") before processing spaces/titles.
-            if value.lower().replace(" ", "") == "endofcycle":
-                value = "END_OF_CYCLE"
-
-            if "_" in value:
-                value = value.replace("_", " ")
-            value = value.title()
+            value = _format_state_string(value)
 
         if value is None:
             return None
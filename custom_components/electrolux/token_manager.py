@@ -1,6 +1,8 @@
 """Token management for the Electrolux integration."""
 
 import asyncio
+import base64
+import json
 import logging
 import time
 from collections.abc import Awaitable, Callable
@@ -21,10 +23,29 @@ from electrolux_group_developer_sdk.constants import (  # type: ignore[import-un
 )
 from homeassistant.exceptions import ConfigEntryAuthFailed
 
-from .const import ACCESS_TOKEN_VALIDITY_SECONDS
+from .const import ACCESS_TOKEN_VALIDITY_SECONDS, TOKEN_REFRESH_BUFFER_SECONDS
 
 _LOGGER: logging.Logger = logging.getLogger(__package__)
 
+# Pause before the background refresh loop retries after a failed refresh
+_BACKGROUND_REFRESH_RETRY_SECONDS = 60
+
+# Refresh cooldown after the Nth consecutive failure (index N - 1): 120s doubling up to a 300s cap
+_REFRESH_BACKOFF_SECONDS = (120, 240, 300)
+
+# Lowercased error-text markers of a permanent auth failure (bad or revoked refresh token)
+_PERMANENT_AUTH_ERROR_MARKERS = ("401", "invalid grant", "forbidden")
+
+
+def _fast_jwt_exp(token: str) -> int | None:
+    """Return the unverified 'exp' claim of a JWT by decoding only its payload segment.
+
+    Raises on anything that is not a three-part token with a JSON object payload.
+    """
+    segment = token.split(".", 2)[1]
+    payload = json.loads(base64.urlsafe_b64decode(segment + "=" * (-len(segment) % 4)))
+    return payload.get("exp")
+
 
 class ElectroluxTokenManager(TokenManager):
     """Custom token manager with extended proactive refresh buffer.
@@ -45,13 +66,15 @@ class ElectroluxTokenManager(TokenManager):
         super().__init__(access_token, refresh_token, api_key, on_token_update=on_token_update)
         self._on_token_update_with_expiry: Callable[[str, str, str, int], None] | None = None
         self._on_auth_error: Callable[[str], Awaitable[None]] | None = None
-        self._refresh_lock = asyncio.Lock()
-        self._last_failed_refresh = 0  # Track failed refresh attempts
+        self._refresh_task: asyncio.Task[bool] | None = None  # In-flight refresh shared by callers
+        self._next_allowed_refresh_at = 0  # Refresh cooldown end after a failure (0 = no cooldown)
         self._consecutive_failures = 0  # Track consecutive refresh failures for backoff
         self._marked_needs_refresh = False  # Flag to bypass cooldown if refresh needed
         self._permanent_auth_failure = False  # Set on 401/invalid-grant; stops retry loop until new creds are loaded
         self._last_log_time = 0.0  # Cache timestamp for log throttling
         self._last_log_status = ""  # Cache last logged status
+        self._decoded_for_token: str | None = None  # Access token whose 'exp' is cached
+        self._decoded_exp: int | None = None  # Cached 'exp' claim of that token
 
     def is_token_valid(self) -> bool:
         """Check token validity with 15-minute proactive refresh buffer.
@@ -68,21 +91,16 @@ class ElectroluxTokenManager(TokenManager):
             return False
 
         try:
-            payload = jwt.decode(
-                self._auth_data.access_token,
-                options={"verify_signature": False, "verify_exp": False},
-            )
-            exp = payload.get("exp")
+            exp = self._access_token_exp(self._auth_data.access_token)
             if exp is None:
                 _LOGGER.debug("[TOKEN-CHECK] Token validation failed: JWT missing 'exp' claim")
                 return False
 
             current_time = time.time()
 
-            # 900 seconds = 15 minutes proactive refresh buffer
-            # (vs SDK's default 60 seconds)
+            # 15 minutes proactive refresh buffer (vs SDK's default 60 seconds)
             time_remaining = exp - current_time
-            is_valid = time_remaining > 900
+            is_valid = time_remaining > TOKEN_REFRESH_BUFFER_SECONDS
 
             # Format time remaining as hours and minutes
             hours = int(time_remaining // 3600)
@@ -114,6 +132,28 @@ class ElectroluxTokenManager(TokenManager):
             _LOGGER.debug(f"[TOKEN-CHECK] Validation exception details: {type(e).__name__}: {e!s}")
             return False  # Force refresh if we can't decode JWT
 
+    def _access_token_exp(self, access_token: str) -> int | None:
+        """Return the 'exp' claim of the access token, decoding it only once per token.
+
+        Raises if the token cannot be decoded.
+        """
+        if access_token == self._decoded_for_token and self._decoded_exp is not None:
+            # Same token as last check: reuse its 'exp' instead of decoding the JWT again
+            return self._decoded_exp
+        try:
+            exp = _fast_jwt_exp(access_token)
+        except Exception:
+            # Not a plain JWT; let PyJWT decode it and raise the proper error
+            payload = jwt.decode(
+                access_token,
+                options={"verify_signature": False, "verify_exp": False},
+            )
+            exp = payload.get("exp")
+        if exp is not None:
+            self._decoded_for_token = access_token
+            self._decoded_exp = exp
+        return exp
+
     def set_token_update_callback_with_expiry(self, callback: Callable[[str, str, str, int], None]) -> None:
         """Set callback that includes expiration timestamp."""
         self._on_token_update_with_expiry = callback
@@ -122,150 +162,222 @@ class ElectroluxTokenManager(TokenManager):
         """Set callback for authentication errors."""
         self._on_auth_error = callback
 
-    async def refresh_token(self) -> bool:
-        """Refresh the access token with race condition protection.
+    async def refresh_token(self, *, honor_cooldown: bool = False) -> bool:
+        """Refresh the access token, sharing one in-flight refresh between callers.
 
-        This method is thread-safe and can be called concurrently from anywhere.
-        It acquires the refresh lock internally to prevent race conditions when
-        multiple API calls trigger refresh simultaneously (e.g., SDK's automatic
-        401 retry or proactive refresh from get_auth_data()).
+        This method can be called concurrently from anywhere (e.g., SDK's
+        automatic 401 retry or proactive refresh from get_auth_data()). The
+        first caller starts the refresh as a task; callers arriving while it
+        runs await the same task instead of queueing behind a lock, so they
+        all resume as soon as the single HTTP round-trip completes.
+
+        Args:
+            honor_cooldown: Keep to the failure backoff even when the token is
+                expired or expiring, instead of bypassing it for one attempt.
 
         Returns:
             bool: True if refresh succeeded, False otherwise.
         """
-        async with self._refresh_lock:
-            current_time = int(time.time())
-            _LOGGER.debug(f"[TOKEN-REFRESH] Refresh initiated at {current_time}")
-
-            # Stop immediately if credentials are known-bad (permanent 401)
-            # Only reset after user provides new credentials via reauth flow
-            if self._permanent_auth_failure:
-                _LOGGER.debug(
-                    "[TOKEN-REFRESH] Skipping refresh: permanent auth failure active. "
-                    "User must re-enter credentials via the HA notification."
-                )
-                return False
+        task = self._refresh_task
+        # Fast path: a token another caller just refreshed needs no refresh task at all
+        if task is None and not self._permanent_auth_failure and self._cached_token_is_fresh():
+            return True
+        if task is not None and task is asyncio.current_task():
+            # Re-entered from inside the refresh (e.g. its auth error callback): awaiting our own task would hang
+            _LOGGER.debug("[TOKEN-REFRESH] Refresh requested from within the running refresh, skipping")
+            return False
+        if task is None or task.done():
+            task = asyncio.create_task(self._do_refresh(honor_cooldown))
+            task.add_done_callback(self._clear_refresh_task)
+            self._refresh_task = task
+        # Shield so a cancelled caller (e.g. wait_for timeout) doesn't abort the refresh for the others
+        return await asyncio.shield(task)
 
-            # Double-check if token is still invalid (another task may have refreshed while we waited)
-            if self.is_token_valid():
-                _LOGGER.debug("[TOKEN-REFRESH] Token already fresh (refreshed by concurrent task), skipping refresh")
-                return True
-
-            # Exponential backoff based on consecutive failures
-            # Base: 60s, doubles each failure up to max 5 minutes (300s)
-            backoff_delay = min(60 * (2**self._consecutive_failures), 300)
-
-            # Check retry cooldown: don't attempt refresh if we failed recently
-            # UNLESS token is marked as needs_refresh (expired or expiring soon)
-            time_since_failure = current_time - self._last_failed_refresh
-            if time_since_failure < backoff_delay and not self._marked_needs_refresh:
-                cooldown_remaining = backoff_delay - time_since_failure
-                _LOGGER.warning(
-                    f"[TOKEN-REFRESH] Refresh on cooldown: {self._consecutive_failures} previous failures, "
-                    f"{cooldown_remaining:.0f}s remaining (backoff: {backoff_delay}s)"
-                )
-                return False
+    def _cached_token_is_fresh(self) -> bool:
+        """Return True if the cached expiry shows the current token outside the 15-minute buffer.
+
+        Unlike is_token_valid() this never decodes, logs, or marks the token for refresh.
+        """
+        auth_data = self._auth_data
+        return (
+            auth_data is not None
+            and self._decoded_exp is not None
+            and auth_data.access_token == self._decoded_for_token
+            and self._decoded_exp - time.time() > TOKEN_REFRESH_BUFFER_SECONDS
+        )
+
+    def _clear_refresh_task(self, task: asyncio.Task[bool]) -> None:
+        """Forget the finished refresh task so the next refresh starts a new one."""
+        if self._refresh_task is task:
+            self._refresh_task = None
+
+    async def _do_refresh(self, honor_cooldown: bool = False) -> bool:
+        """Perform a single token refresh; only run via refresh_token()."""
+        current_time = int(time.time())
+        _LOGGER.debug(f"[TOKEN-REFRESH] Refresh initiated at {current_time}")
+
+        # Stop immediately if credentials are known-bad (permanent 401)
+        # Only reset after user provides new credentials via reauth flow
+        if self._permanent_auth_failure:
+            _LOGGER.debug(
+                "[TOKEN-REFRESH] Skipping refresh: permanent auth failure active. "
+                "User must re-enter credentials via the HA notification."
+            )
+            return False
 
-            # If marked needs refresh, we bypass cooldown for one attempt
-            if self._marked_needs_refresh:
-                _LOGGER.debug("[TOKEN-REFRESH] Token marked needs refresh (expired/expiring), bypassing cooldown")
-                self._marked_needs_refresh = False
+        # Double-check if token is still invalid (a refresh that just finished may have replaced it)
+        if self.is_token_valid():
+            _LOGGER.debug("[TOKEN-REFRESH] Token already fresh (refreshed by concurrent task), skipping refresh")
+            return True
+
+        # Check retry cooldown: don't attempt refresh if we failed recently
+        # UNLESS token is marked as needs_refresh (expired or expiring soon) and the caller allows the bypass
+        if current_time < self._next_allowed_refresh_at and (honor_cooldown or not self._marked_needs_refresh):
+            cooldown_remaining = self._next_allowed_refresh_at - current_time
+            _LOGGER.warning(
+                f"[TOKEN-REFRESH] Refresh on cooldown: {self._consecutive_failures} previous failures, "
+                f"{cooldown_remaining:.0f}s remaining"
+            )
+            return False
+
+        # If marked needs refresh, we bypass cooldown for one attempt
+        if self._marked_needs_refresh:
+            _LOGGER.debug("[TOKEN-REFRESH] Token marked needs refresh (expired/expiring), bypassing cooldown")
+            self._marked_needs_refresh = False
+
+        _LOGGER.debug("[TOKEN-REFRESH] Preparing token refresh request")
+        auth_data = self._auth_data
+
+        if not auth_data or auth_data.refresh_token is None:
+            _LOGGER.error("[TOKEN-REFRESH] CRITICAL: Refresh token is missing, cannot refresh")
+            raise ConfigEntryAuthFailed("Missing refresh token")
+
+        payload = {REFRESH_TOKEN: auth_data.refresh_token}
+        # Redact sensitive token in logs
+        refresh_suffix = auth_data.refresh_token[-5:] if len(auth_data.refresh_token) >= 5 else "<short>"
+        _LOGGER.debug(
+            f"[TOKEN-REFRESH] Sending refresh request to {TOKEN_REFRESH_URL} (token suffix: ...{refresh_suffix})"
+        )
+
+        try:
+            _LOGGER.debug("[TOKEN-REFRESH] Making HTTP POST request to token endpoint")
+            data = await request(method=POST, url=TOKEN_REFRESH_URL, json_body=payload)
+            _LOGGER.debug("[TOKEN-REFRESH] HTTP request successful, processing response")
 
-            _LOGGER.debug("[TOKEN-REFRESH] Preparing token refresh request")
-            auth_data = self._auth_data
+            # Calculate expiration timestamp from response
+            expires_in = data.get("expiresIn", ACCESS_TOKEN_VALIDITY_SECONDS)
+            expires_at = int(time.time()) + expires_in
 
-            if not auth_data or auth_data.refresh_token is None:
-                _LOGGER.error("[TOKEN-REFRESH] CRITICAL: Refresh token is missing, cannot refresh")
-                raise ConfigEntryAuthFailed("Missing refresh token")
+            # Format expiration as hours and minutes
+            exp_hours = int(expires_in // 3600)
+            exp_minutes = int((expires_in % 3600) // 60)
 
-            payload = {REFRESH_TOKEN: auth_data.refresh_token}
-            # Redact sensitive token in logs
-            refresh_suffix = auth_data.refresh_token[-5:] if len(auth_data.refresh_token) >= 5 else "<short>"
+            _LOGGER.debug(f"[TOKEN-REFRESH] New token received: expires in {exp_hours} hours, {exp_minutes} minutes")
+            _LOGGER.debug(f"[TOKEN-REFRESH] Token expiration timestamp: {expires_at}")
+
+            # Log token rotation (suffix of new refresh token)
+            new_refresh_suffix = data.get("refreshToken", "")[-5:] if data.get("refreshToken") else "<none>"
             _LOGGER.debug(
-                f"[TOKEN-REFRESH] Sending refresh request to {TOKEN_REFRESH_URL} (token suffix: ...{refresh_suffix})"
+                f"[TOKEN-REFRESH] Token rotation: old suffix ...{refresh_suffix} -> new suffix ...{new_refresh_suffix}"
             )
 
-            try:
-                _LOGGER.debug("[TOKEN-REFRESH] Making HTTP POST request to token endpoint")
-                data = await request(method=POST, url=TOKEN_REFRESH_URL, json_body=payload)
-                _LOGGER.debug("[TOKEN-REFRESH] HTTP request successful, processing response")
-
-                # Calculate expiration timestamp from response
-                expires_in = data.get("expiresIn", ACCESS_TOKEN_VALIDITY_SECONDS)
-                expires_at = int(time.time()) + expires_in
+            # Update with new tokens
+            _LOGGER.debug("[TOKEN-REFRESH] Updating token manager with new tokens")
+            self.update_with_expiry(
+                access_token=data["accessToken"],
+                refresh_token=data["refreshToken"],
+                api_key=auth_data.api_key,
+                expires_at=expires_at,
+            )
 
-                # Format expiration as hours and minutes
-                exp_hours = int(expires_in // 3600)
-                exp_minutes = int((expires_in % 3600) // 60)
+            # Clear failed refresh counter on success
+            self._next_allowed_refresh_at = 0
+            self._consecutive_failures = 0  # Reset exponential backoff
+            self._marked_needs_refresh = False
+            self._permanent_auth_failure = False  # New creds worked — clear the latch
+            _LOGGER.info(
+                f"[TOKEN-REFRESH] Token refresh completed successfully (new token valid for {exp_hours} hours, {exp_minutes} minutes)"
+            )
+            return True
 
-                _LOGGER.debug(
-                    f"[TOKEN-REFRESH] New token received: expires in {exp_hours} hours, {exp_minutes} minutes"
-                )
-                _LOGGER.debug(f"[TOKEN-REFRESH] Token expiration timestamp: {expires_at}")
+        except Exception as e:
+            error_msg = str(e).lower()
+            _LOGGER.error(f"[TOKEN-REFRESH] Token refresh failed: {type(e).__name__}: {e}")
+            _LOGGER.debug(f"[TOKEN-REFRESH] Full error details: {error_msg}")
+            # Check for permanent token errors (401/Invalid Grant)
+            if any(marker in error_msg for marker in _PERMANENT_AUTH_ERROR_MARKERS):
+                _LOGGER.error(f"[TOKEN-REFRESH] PERMANENT AUTH ERROR detected: {error_msg}")
+                # Check for possible multiple instance issue
+                if "invalid grant" in error_msg and self._consecutive_failures == 0:
+                    _LOGGER.error(
+                        "[TOKEN-REFRESH] Refresh token became invalid unexpectedly (zero failures). "
+                        "This may indicate multiple Home Assistant instances using same credentials, "
+                        "which is NOT supported due to single-use refresh tokens."
+                    )
+                # Latch: stop all future refresh attempts until new credentials are loaded
+                self._permanent_auth_failure = True
+                self._consecutive_failures = 0
+                # Trigger reauthentication once
+                if self._on_auth_error:
+                    _LOGGER.warning(
+                        "[TOKEN-REFRESH] Triggering reauth callback due to permanent auth error "
+                        "(further refresh attempts suppressed until credentials are updated)"
+                    )
+                    await self._on_auth_error(f"Token refresh failed: {e}")
+                else:
+                    _LOGGER.warning("[TOKEN-REFRESH] No auth error callback registered, cannot trigger reauth")
+                return False
 
-                # Log token rotation (suffix of new refresh token)
-                new_refresh_suffix = data.get("refreshToken", "")[-5:] if data.get("refreshToken") else "<none>"
-                _LOGGER.debug(
-                    f"[TOKEN-REFRESH] Token rotation: old suffix ...{refresh_suffix} -> new suffix ...{new_refresh_suffix}"
-                )
+            # For other errors, set cooldown and return False
+            _LOGGER.warning(f"[TOKEN-REFRESH] Temporary refresh failure (will retry with backoff): {e}")
+            self._consecutive_failures += 1
+            # Exponential backoff based on consecutive failures (see _REFRESH_BACKOFF_SECONDS)
+            next_backoff = _REFRESH_BACKOFF_SECONDS[min(self._consecutive_failures, len(_REFRESH_BACKOFF_SECONDS)) - 1]
+            self._next_allowed_refresh_at = current_time + next_backoff
+            _LOGGER.warning(
+                f"[TOKEN-REFRESH] Failure tracking updated: consecutive_failures={self._consecutive_failures}, "
+                f"next_backoff={next_backoff}s"
+            )
+            return False
 
-                # Update with new tokens
-                _LOGGER.debug("[TOKEN-REFRESH] Updating token manager with new tokens")
-                self.update_with_expiry(
-                    access_token=data["accessToken"],
-                    refresh_token=data["refreshToken"],
-                    api_key=auth_data.api_key,
-                    expires_at=expires_at,
-                )
+    async def run_background_refresh(self) -> None:
+        """Refresh the token as it enters the 15-minute buffer, until cancelled.
 
-                # Clear failed refresh counter on success
-                self._last_failed_refresh = 0
-                self._consecutive_failures = 0  # Reset exponential backoff
-                self._marked_needs_refresh = False
-                self._permanent_auth_failure = False  # New creds worked — clear the latch
-                _LOGGER.info(
-                    f"[TOKEN-REFRESH] Token refresh completed successfully (new token valid for {exp_hours} hours, {exp_minutes} minutes)"
-                )
-                return True
+        Requests then find a fresh token instead of paying for the refresh
+        round-trip inline; get_auth_data() keeps its own check as a fallback.
+        The caller owns the task: the integration runs it as a config entry
+        background task so it is cancelled on unload and on HA stop.
+        """
+        refreshed = False
+        while not self._permanent_auth_failure:
+            now = time.time()
+            try:
+                # Read the expiry directly; is_token_valid() would log and mark the token for refresh
+                exp = self._access_token_exp(self._auth_data.access_token) if self._auth_data else None
+            except Exception:
+                exp = None
+            if exp is None:
+                delay = _BACKGROUND_REFRESH_RETRY_SECONDS
+            else:
+                # Wake just after the buffer starts so refresh_token() doesn't skip as still fresh
+                delay = exp - now - TOKEN_REFRESH_BUFFER_SECONDS + 1
+            if refreshed:
+                # A token issued with less lifetime than the buffer must not be refreshed back-to-back
+                delay = max(delay, _BACKGROUND_REFRESH_RETRY_SECONDS)
+            # A failed refresh is retried only once its backoff cooldown has passed
+            await asyncio.sleep(max(delay, self._next_allowed_refresh_at - now, 0))
 
+            try:
+                # Unlike request-path refreshes, never bypass the backoff for an expiring token
+                refreshed = await self.refresh_token(honor_cooldown=True)
+            except ConfigEntryAuthFailed:
+                return
             except Exception as e:
-                error_msg = str(e).lower()
-                _LOGGER.error(f"[TOKEN-REFRESH] Token refresh failed: {type(e).__name__}: {e}")
-                _LOGGER.debug(f"[TOKEN-REFRESH] Full error details: {error_msg}")
-                # Check for permanent token errors (401/Invalid Grant)
-                if any(keyword in error_msg for keyword in ["401", "invalid grant", "forbidden"]):
-                    _LOGGER.error(f"[TOKEN-REFRESH] PERMANENT AUTH ERROR detected: {error_msg}")
-                    # Check for possible multiple instance issue
-                    if "invalid grant" in error_msg and self._consecutive_failures == 0:
-                        _LOGGER.error(
-                            "[TOKEN-REFRESH] Refresh token became invalid unexpectedly (zero failures). "
-                            "This may indicate multiple Home Assistant instances using same credentials, "
-                            "which is NOT supported due to single-use refresh tokens."
-                        )
-                    # Latch: stop all future refresh attempts until new credentials are loaded
-                    self._permanent_auth_failure = True
-                    self._consecutive_failures = 0
-                    # Trigger reauthentication once
-                    if self._on_auth_error:
-                        _LOGGER.warning(
-                            "[TOKEN-REFRESH] Triggering reauth callback due to permanent auth error "
-                            "(further refresh attempts suppressed until credentials are updated)"
-                        )
-                        await self._on_auth_error(f"Token refresh failed: {e}")
-                    else:
-                        _LOGGER.warning("[TOKEN-REFRESH] No auth error callback registered, cannot trigger reauth")
-                    return False
-
-                # For other errors, set cooldown and return False
-                _LOGGER.warning(f"[TOKEN-REFRESH] Temporary refresh failure (will retry with backoff): {e}")
-                self._last_failed_refresh = current_time
-                self._consecutive_failures += 1
-                next_backoff = min(60 * (2**self._consecutive_failures), 300)
-                _LOGGER.warning(
-                    f"[TOKEN-REFRESH] Failure tracking updated: consecutive_failures={self._consecutive_failures}, "
-                    f"next_backoff={next_backoff}s"
-                )
-                return False
+                _LOGGER.warning(f"[TOKEN-REFRESH] Background refresh failed: {e}")
+                refreshed = False
+            if not refreshed and self._next_allowed_refresh_at <= time.time():
+                # Failed without starting a cooldown; pause so the loop doesn't spin
+                await asyncio.sleep(_BACKGROUND_REFRESH_RETRY_SECONDS)
 
     def update_with_expiry(self, access_token: str, refresh_token: str, api_key: str, expires_at: int) -> None:
         """Update the authentication data with expiration information.
@@ -283,3 +395,7 @@ class ElectroluxTokenManager(TokenManager):
         # Use parent's update method to maintain SDK compatibility
         # Parent will call _on_token_update callback and update _auth_data
         self.update(access_token, refresh_token, api_key)
+
+        # The expiry is already known, so is_token_valid() need not decode the new JWT
+        self._decoded_for_token = access_token
+        self._decoded_exp = expires_at
@@ -14,6 +14,10 @@ from __future__ import annotations
 
 import asyncio
 import inspect
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
 
 # Replace asyncio.iscoroutinefunction with inspect.iscoroutinefunction
 # to avoid DeprecationWarning emitted by some third-party packages.
@@ -38,3 +42,36 @@ try:
 except Exception:
     # If aiohttp isn't available or monkeypatching fails, continue without error.
     pass
+
+
+# Shared doubles for platform-level tests; modules defining their own fixtures
+# of the same name override these.
+@pytest.fixture
+def mock_hass():
+    """Create a mock Home Assistant instance."""
+    hass = MagicMock()
+    hass.data = {}
+    return hass
+
+
+@pytest.fixture
+def mock_config_entry():
+    """Create a mock config entry; platforms read the coordinator from runtime_data."""
+    return SimpleNamespace(
+        entry_id="test_entry_id",
+        data={
+            "api_key": "test_api_key",
+            "access_token": "test_access_token",
+            "refresh_token": "test_refresh_token",
+        },
+        runtime_data=None,
+    )
+
+
+@pytest.fixture
+def mock_coordinator():
+    """Create a mock coordinator with appliances."""
+    # MagicMock so entities built during setup can call appliances.get_appliance()
+    coordinator = MagicMock()
+    coordinator.data = {"appliances": MagicMock()}
+    return coordinator
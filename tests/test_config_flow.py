@@ -1,9 +1,11 @@
 """Test the Electrolux config flow."""
 
+from dataclasses import dataclass, field
+from typing import Any
 from unittest.mock import AsyncMock, Mock, PropertyMock, patch
 
 import pytest
-from homeassistant import data_entry_flow
+from homeassistant.data_entry_flow import FlowResultType
 
 from custom_components.electrolux.config_flow import (
     ElectroluxRepairFlow,
@@ -19,37 +21,79 @@ from custom_components.electrolux.repairs import (
     async_create_fix_flow as async_create_repairs_fix_flow,
 )
 
+FORM = FlowResultType.FORM
+CREATE_ENTRY = FlowResultType.CREATE_ENTRY
+ABORT = FlowResultType.ABORT
+
 
 def test_config_flow_class():
     """Test that the config flow class exists."""
     assert ElectroluxStatusFlowHandler is not None
 
 
+def _async_return(value):
+    """Return a coroutine function that resolves to ``value``."""
+
+    async def _inner(*args, **kwargs):
+        return value
+
+    return _inner
+
+
+def _async_raise(exc):
+    """Return a coroutine function that raises ``exc``."""
+
+    async def _inner(*args, **kwargs):
+        raise exc
+
+    return _inner
+
+
+@dataclass
+class _FakeEntry:
+    """Plain data holder standing in for a ConfigEntry."""
+
+    entry_id: str = "test_entry"
+    data: dict[str, Any] = field(default_factory=dict)
+    title: str = "Test"
+
+
+@pytest.fixture
+def stub_hass():
+    """Return a hass stub with no existing config entries."""
+    hass = Mock()
+    hass.config_entries = Mock()
+    hass.config_entries.async_entries.return_value = []
+    hass.data = {}
+    return hass
+
+
+@patch(
+    "custom_components.electrolux.config_flow.async_get_clientsession",
+    new_callable=Mock,
+)
+@patch("custom_components.electrolux.config_flow.get_electrolux_session")
 class TestConfigFlowUserStep:
     """Test the user step of config flow."""
 
     @pytest.mark.asyncio
-    async def test_user_form_shown(self):
+    async def test_user_form_shown(self, mock_session, mock_client_session, stub_hass):
         """Test that user form is shown."""
         flow = ElectroluxStatusFlowHandler()
-        # Mock hass
-        flow.hass = Mock()
-        flow.hass.config_entries = Mock()
-        flow.hass.config_entries.async_entries.return_value = []
+        flow.hass = stub_hass
 
         result = await flow.async_step_user()
 
-        assert result["type"] == data_entry_flow.FlowResultType.FORM  # type: ignore[typeddict-item]
+        assert result["type"] == FORM  # type: ignore[typeddict-item]
         assert result["step_id"] == "user"  # type: ignore[typeddict-item]
 
     @pytest.mark.asyncio
-    async def test_user_input_creates_entry(self):
+    async def test_user_input_creates_entry(
+        self, mock_session, mock_client_session, stub_hass
+    ):
         """Test that user input creates config entry."""
         flow = ElectroluxStatusFlowHandler()
-        flow.hass = Mock()
-        flow.hass.config_entries = Mock()
-        flow.hass.config_entries.async_entries.return_value = []
-        flow.hass.data = {}
+        flow.hass = stub_hass
 
         user_input = {
             "api_key": "test_api_key_1234567890",
@@ -57,37 +101,26 @@ class TestConfigFlowUserStep:
             "refresh_token": "test_refresh_token_1234567890",
         }
 
-        with (
-            patch(
-                "custom_components.electrolux.config_flow.get_electrolux_session"
-            ) as mock_session,
-            patch(
-                "custom_components.electrolux.config_flow.async_get_clientsession"
-            ) as mock_client_session,
-        ):
-            # Mock successful API connection
-            mock_client = Mock()
-            mock_client.get_appliances_list = AsyncMock(
-                return_value=[
-                    {"applianceId": "test_123", "applianceName": "Test Device"}
-                ]
-            )
-            mock_session.return_value = mock_client
-            mock_client_session.return_value = Mock()
+        # Mock successful API connection
+        mock_client = Mock()
+        mock_client.get_appliances_list = _async_return(
+            [{"applianceId": "test_123", "applianceName": "Test Device"}]
+        )
+        mock_session.return_value = mock_client
 
-            result = await flow.async_step_user(user_input)
+        result = await flow.async_step_user(user_input)
 
-            assert result["type"] == data_entry_flow.FlowResultType.CREATE_ENTRY  # type: ignore[typeddict-item]
-            assert result["title"] == "Electrolux"  # type: ignore[typeddict-item]
-            assert result["data"]["api_key"] == user_input["api_key"]  # type: ignore[typeddict-item]
+        assert result["type"] == CREATE_ENTRY  # type: ignore[typeddict-item]
+        assert result["title"] == "Electrolux"  # type: ignore[typeddict-item]
+        assert result["data"]["api_key"] == user_input["api_key"]  # type: ignore[typeddict-item]
 
     @pytest.mark.asyncio
-    async def test_user_input_connection_error(self):
+    async def test_user_input_connection_error(
+        self, mock_session, mock_client_session, stub_hass
+    ):
         """Test that connection errors are handled."""
         flow = ElectroluxStatusFlowHandler()
-        flow.hass = Mock()
-        flow.hass.config_entries = Mock()
-        flow.hass.config_entries.async_entries.return_value = []
+        flow.hass = stub_hass
 
         user_input = {
             "api_key": "test_api_key_1234567890",
@@ -95,35 +128,26 @@ class TestConfigFlowUserStep:
             "refresh_token": "test_refresh_token_1234567890",
         }
 
-        with (
-            patch(
-                "custom_components.electrolux.config_flow.get_electrolux_session"
-            ) as mock_session,
-            patch(
-                "custom_components.electrolux.config_flow.async_get_clientsession"
-            ) as mock_client_session,
-        ):
-            mock_client = Mock()
-            mock_client.get_appliances_list = AsyncMock(
-                side_effect=ConnectionError("Connection failed")
-            )
-            mock_session.return_value = mock_client
-            mock_client_session.return_value = Mock()
+        mock_client = Mock()
+        mock_client.get_appliances_list = _async_raise(
+            ConnectionError("Connection failed")
+        )
+        mock_session.return_value = mock_client
 
-            result = await flow.async_step_user(user_input)
+        result = await flow.async_step_user(user_input)
 
-            assert result["type"] == data_entry_flow.FlowResultType.FORM  # type: ignore[typeddict-item]
-            assert "errors" in result
-            # Connection errors are treated as invalid_auth in config flow
-            assert result["errors"]["base"] == "invalid_auth"  # type: ignore[index]
+        assert result["type"] == FORM  # type: ignore[typeddict-item]
+        assert "errors" in result
+        # Connection errors are treated as invalid_auth in config flow
+        assert result["errors"]["base"] == "invalid_auth"  # type: ignore[index]
 
     @pytest.mark.asyncio
-    async def test_user_input_invalid_auth(self):
+    async def test_user_input_invalid_auth(
+        self, mock_session, mock_client_session, stub_hass
+    ):
         """Test that invalid auth errors are handled."""
         flow = ElectroluxStatusFlowHandler()
-        flow.hass = Mock()
-        flow.hass.config_entries = Mock()
-        flow.hass.config_entries.async_entries.return_value = []
+        flow.hass = stub_hass
 
         user_input = {
             "api_key": "invalid_key_1234567890",
@@ -131,26 +155,15 @@ class TestConfigFlowUserStep:
             "refresh_token": "invalid_refresh_token_1234567890",
         }
 
-        with (
-            patch(
-                "custom_components.electrolux.config_flow.get_electrolux_session"
-            ) as mock_session,
-            patch(
-                "custom_components.electrolux.config_flow.async_get_clientsession"
-            ) as mock_client_session,
-        ):
-            mock_client = Mock()
-            mock_client.get_appliances_list = AsyncMock(
-                side_effect=ValueError("401 Unauthorized")
-            )
-            mock_session.return_value = mock_client
-            mock_client_session.return_value = Mock()
+        mock_client = Mock()
+        mock_client.get_appliances_list = _async_raise(ValueError("401 Unauthorized"))
+        mock_session.return_value = mock_client
 
-            result = await flow.async_step_user(user_input)
+        result = await flow.async_step_user(user_input)
 
-            assert result["type"] == data_entry_flow.FlowResultType.FORM  # type: ignore[typeddict-item]
-            assert "errors" in result
-            assert result["errors"]["base"] == "invalid_auth"  # type: ignore[index]
+        assert result["type"] == FORM  # type: ignore[typeddict-item]
+        assert "errors" in result
+        assert result["errors"]["base"] == "invalid_auth"  # type: ignore[index]
 
 
 class TestConfigFlowOptionsFlow:
@@ -171,7 +184,7 @@ class TestConfigFlowOptionsFlow:
             options_flow = Mock()
             options_flow.async_step_init = AsyncMock(
                 return_value={
-                    "type": data_entry_flow.FlowResultType.FORM,
+                    "type": FORM,
                     "step_id": "init",
                 }
             )
@@ -179,14 +192,22 @@ class TestConfigFlowOptionsFlow:
 
             result = await options_flow.async_step_init()
 
-            assert result["type"] == data_entry_flow.FlowResultType.FORM
+            assert result["type"] == FORM
 
 
+@patch("custom_components.electrolux.config_flow.ir.async_delete_issue")
+@patch(
+    "custom_components.electrolux.config_flow.async_get_clientsession",
+    new_callable=Mock,
+)
+@patch("custom_components.electrolux.config_flow.get_electrolux_session")
 class TestRepairFlow:
     """Test repair flow for invalid refresh tokens."""
 
     @pytest.mark.asyncio
-    async def test_repair_flow_initialization(self):
+    async def test_repair_flow_initialization(
+        self, mock_session, mock_client_session, mock_delete_issue
+    ):
         """Test that the repair flow can be created."""
         # Create mock hass
         mock_hass = Mock()
@@ -201,7 +222,9 @@ class TestRepairFlow:
         assert isinstance(flow, ElectroluxRepairFlow)
 
     @pytest.mark.asyncio
-    async def test_repairs_module_passes_issue_id_to_flow(self):
+    async def test_repairs_module_passes_issue_id_to_flow(
+        self, mock_session, mock_client_session, mock_delete_issue
+    ):
         """Home Assistant's repairs module passes issue_id outside flow context."""
         flow = await async_create_repairs_fix_flow(
             Mock(), "invalid_refresh_token_test_entry", None
@@ -211,32 +234,34 @@ class TestRepairFlow:
         assert flow._get_issue_id() == "invalid_refresh_token_test_entry"
 
     @pytest.mark.asyncio
-    async def test_repair_flow_form_shown(self):
+    async def test_repair_flow_form_shown(
+        self, mock_session, mock_client_session, mock_delete_issue
+    ):
         """Test that repair flow shows form."""
         flow = ElectroluxRepairFlow()
         flow.hass = Mock()
         flow.context = {"issue_id": "invalid_refresh_token_test_entry"}  # type: ignore[typeddict-item]
 
-        mock_entry = Mock()
-        mock_entry.entry_id = "test_entry"
-        mock_entry.data = {"api_key": "old_key"}
+        mock_entry = _FakeEntry(data={"api_key": "old_key"})
 
         flow.hass.config_entries = Mock()
         flow.hass.config_entries.async_get_entry = Mock(return_value=mock_entry)
 
         result = await flow.async_step_init()
 
-        assert result["type"] == data_entry_flow.FlowResultType.FORM  # type: ignore[typeddict-item]
+        assert result["type"] == FORM  # type: ignore[typeddict-item]
         assert result["step_id"] == "confirm_repair"  # type: ignore[typeddict-item]
 
     @pytest.mark.asyncio
-    async def test_repair_validation(self):
+    async def test_repair_validation(
+        self, mock_session, mock_client_session, mock_delete_issue
+    ):
         """Test repair input validation."""
         # Create mock hass with config entry
         mock_hass = Mock()
-        mock_entry = Mock()
-        mock_entry.entry_id = "test_entry"
-        mock_entry.data = {"api_key": "old_key", "access_token": "old_token"}
+        mock_entry = _FakeEntry(
+            data={"api_key": "old_key", "access_token": "old_token"}
+        )
 
         mock_hass.config_entries = Mock()
         mock_hass.config_entries.async_get_entry = Mock(return_value=mock_entry)
@@ -254,35 +279,26 @@ class TestRepairFlow:
             "refresh_token": "new_refresh_token_1234567890",
         }
 
-        with (
-            patch(
-                "custom_components.electrolux.config_flow.get_electrolux_session"
-            ) as mock_session,
-            patch(
-                "custom_components.electrolux.config_flow.async_get_clientsession"
-            ) as mock_client_session,
-            patch("custom_components.electrolux.config_flow.ir.async_delete_issue"),
-        ):
-            mock_client = Mock()
-            mock_client.get_appliances_list = AsyncMock(return_value=[])
-            mock_session.return_value = mock_client
-            mock_client_session.return_value = Mock()
+        mock_client = Mock()
+        mock_client.get_appliances_list = _async_return([])
+        mock_session.return_value = mock_client
 
-            result = await flow.async_step_init(user_input)
+        result = await flow.async_step_init(user_input)
 
-            assert result["type"] == data_entry_flow.FlowResultType.CREATE_ENTRY  # type: ignore[typeddict-item]
-            # Verify config entry was updated
-            mock_hass.config_entries.async_update_entry.assert_called_once()
-            # Verify reload was triggered
-            mock_hass.config_entries.async_reload.assert_called_once()
+        assert result["type"] == CREATE_ENTRY  # type: ignore[typeddict-item]
+        mock_delete_issue.assert_called_once()
+        # Verify config entry was updated
+        mock_hass.config_entries.async_update_entry.assert_called_once()
+        # Verify reload was triggered
+        mock_hass.config_entries.async_reload.assert_called_once()
 
     @pytest.mark.asyncio
-    async def test_repair_validation_fails(self):
+    async def test_repair_validation_fails(
+        self, mock_session, mock_client_session, mock_delete_issue
+    ):
         """Test repair validation with invalid tokens."""
         mock_hass = Mock()
-        mock_entry = Mock()
-        mock_entry.entry_id = "test_entry"
-        mock_entry.data = {"api_key": "old_key"}
+        mock_entry = _FakeEntry(data={"api_key": "old_key"})
 
         mock_hass.config_entries = Mock()
         mock_hass.config_entries.async_get_entry = Mock(return_value=mock_entry)
@@ -297,43 +313,29 @@ class TestRepairFlow:
             "refresh_token": "invalid_refresh_token_1234567890",
         }
 
-        with (
-            patch(
-                "custom_components.electrolux.config_flow.get_electrolux_session"
-            ) as mock_session,
-            patch(
-                "custom_components.electrolux.config_flow.async_get_clientsession"
-            ) as mock_client_session,
-        ):
-            mock_client = Mock()
-            mock_client.get_appliances_list = AsyncMock(
-                side_effect=ValueError("401 Unauthorized")
-            )
-            mock_session.return_value = mock_client
-            mock_client_session.return_value = Mock()
+        mock_client = Mock()
+        mock_client.get_appliances_list = _async_raise(ValueError("401 Unauthorized"))
+        mock_session.return_value = mock_client
 
-            result = await flow.async_step_init(user_input)
+        result = await flow.async_step_init(user_input)
 
-            assert result["type"] == data_entry_flow.FlowResultType.FORM  # type: ignore[typeddict-item]
-            assert "errors" in result
-            assert result["errors"]["base"] == "invalid_auth"  # type: ignore[index]
+        assert result["type"] == FORM  # type: ignore[typeddict-item]
+        assert "errors" in result
+        assert result["errors"]["base"] == "invalid_auth"  # type: ignore[index]
 
 
 class TestConfigFlowAbort:
     """Test config flow abort scenarios."""
 
     @pytest.mark.asyncio
-    async def test_abort_if_already_configured(self):
+    async def test_abort_if_already_configured(self, stub_hass):
         """Test that flow aborts if integration already configured."""
         flow = ElectroluxStatusFlowHandler()
-        flow.hass = Mock()
+        flow.hass = stub_hass
         flow._errors = {}
 
         # Mock existing entry with same API key
-        existing_entry = Mock()
-        existing_entry.data = {"api_key": "test_key_1234567890"}
-        flow.hass.config_entries = Mock()
-        flow.hass.config_entries.async_entries.return_value = []
+        existing_entry = _FakeEntry(data={"api_key": "test_key_1234567890"})
         # Mock _async_current_entries to return existing entry
         flow._async_current_entries = Mock(return_value=[existing_entry])
 
@@ -345,7 +347,7 @@ class TestConfigFlowAbort:
 
         result = await flow.async_step_user(user_input)
 
-        assert result["type"] == data_entry_flow.FlowResultType.ABORT  # type: ignore[typeddict-item]
+        assert result["type"] == ABORT  # type: ignore[typeddict-item]
         assert result["reason"] == "already_configured_account"  # type: ignore[typeddict-item]
 
 
@@ -516,7 +518,7 @@ class TestReauthFlow:
 
         result = await flow.async_step_reauth(mock_entry)
 
-        assert result["type"] == data_entry_flow.FlowResultType.FORM  # type: ignore[typeddict-item]
+        assert result["type"] == FORM  # type: ignore[typeddict-item]
         assert result["step_id"] == "reauth_validate"  # type: ignore[typeddict-item]
 
     @pytest.mark.asyncio
@@ -552,7 +554,7 @@ class TestReauthFlow:
                 flow, "async_update_reload_and_abort", return_value={"type": "abort"}
             ),
         ):
-            mock_session.return_value.get_appliances_list = AsyncMock(return_value=[])
+            mock_session.return_value.get_appliances_list = _async_return([])
             result = await flow.async_step_reauth_validate(user_input)  # type: ignore[arg-type]
 
         assert result["type"] == "abort"  # type: ignore[literal-required]
@@ -590,12 +592,12 @@ class TestReauthFlow:
             ) as mock_session,
             patch("custom_components.electrolux.config_flow.async_get_clientsession"),
         ):
-            mock_session.return_value.get_appliances_list = AsyncMock(
-                side_effect=ValueError("Unauthorized")
+            mock_session.return_value.get_appliances_list = _async_raise(
+                ValueError("Unauthorized")
             )
             result = await flow.async_step_reauth_validate(user_input)  # type: ignore[arg-type]
 
-        assert result["type"] == data_entry_flow.FlowResultType.FORM  # type: ignore[typeddict-item]
+        assert result["type"] == FORM  # type: ignore[typeddict-item]
         assert result["errors"]["base"] == "invalid_auth"  # type: ignore[index]
 
     def test_get_reauth_entry_raises_when_missing(self):
@@ -636,7 +638,7 @@ class TestReconfigureFlow:
         ):
             result = await flow.async_step_reconfigure()
 
-        assert result["type"] == data_entry_flow.FlowResultType.FORM  # type: ignore[typeddict-item]
+        assert result["type"] == FORM  # type: ignore[typeddict-item]
         assert result["step_id"] == "reconfigure"  # type: ignore[typeddict-item]
 
     @pytest.mark.asyncio
@@ -675,7 +677,7 @@ class TestReconfigureFlow:
                 return_value={"type": "abort", "reason": "reconfigure_successful"},
             ),
         ):
-            mock_session.return_value.get_appliances_list = AsyncMock(return_value=[])
+            mock_session.return_value.get_appliances_list = _async_return([])
             result = await flow.async_step_reconfigure(user_input)
 
         assert result["reason"] == "reconfigure_successful"  # type: ignore[typeddict-item]
@@ -701,7 +703,7 @@ class TestReconfigureFlow:
                 {"api_key": "short", "access_token": "short", "refresh_token": "short"}
             )
 
-        assert result["type"] == data_entry_flow.FlowResultType.FORM  # type: ignore[typeddict-item]
+        assert result["type"] == FORM  # type: ignore[typeddict-item]
         assert result["errors"]["base"] == "invalid_format"  # type: ignore[index]
 
     @pytest.mark.asyncio
@@ -733,12 +735,12 @@ class TestReconfigureFlow:
             ) as mock_session,
             patch("custom_components.electrolux.config_flow.async_get_clientsession"),
         ):
-            mock_session.return_value.get_appliances_list = AsyncMock(
-                side_effect=ConnectionError
+            mock_session.return_value.get_appliances_list = _async_raise(
+                ConnectionError
             )
             result = await flow.async_step_reconfigure(user_input)
 
-        assert result["type"] == data_entry_flow.FlowResultType.FORM  # type: ignore[typeddict-item]
+        assert result["type"] == FORM  # type: ignore[typeddict-item]
         assert result["errors"]["base"] == "invalid_auth"  # type: ignore[index]
 
     @pytest.mark.asyncio
@@ -788,7 +790,7 @@ class TestOptionsFlowHandler:
 
         result = await flow.async_step_init()
 
-        assert result["type"] == data_entry_flow.FlowResultType.FORM  # type: ignore[typeddict-item]
+        assert result["type"] == FORM  # type: ignore[typeddict-item]
 
     @pytest.mark.asyncio
     async def test_options_step_user_shows_form_with_no_input(self):
@@ -797,7 +799,7 @@ class TestOptionsFlowHandler:
 
         result = await flow.async_step_user()
 
-        assert result["type"] == data_entry_flow.FlowResultType.FORM  # type: ignore[typeddict-item]
+        assert result["type"] == FORM  # type: ignore[typeddict-item]
         assert result["step_id"] == "user"  # type: ignore[typeddict-item]
 
     @pytest.mark.asyncio
@@ -822,10 +824,10 @@ class TestOptionsFlowHandler:
             ) as mock_session,
             patch("custom_components.electrolux.config_flow.async_get_clientsession"),
         ):
-            mock_session.return_value.get_appliances_list = AsyncMock(return_value=[])
+            mock_session.return_value.get_appliances_list = _async_return([])
             result = await flow.async_step_user(user_input)
 
-        assert result["type"] == data_entry_flow.FlowResultType.CREATE_ENTRY  # type: ignore[typeddict-item]
+        assert result["type"] == CREATE_ENTRY  # type: ignore[typeddict-item]
 
     @pytest.mark.asyncio
     async def test_options_step_user_invalid_credentials_shows_error(self):
@@ -845,12 +847,12 @@ class TestOptionsFlowHandler:
             ) as mock_session,
             patch("custom_components.electrolux.config_flow.async_get_clientsession"),
         ):
-            mock_session.return_value.get_appliances_list = AsyncMock(
-                side_effect=ValueError("Unauthorized")
+            mock_session.return_value.get_appliances_list = _async_raise(
+                ValueError("Unauthorized")
             )
             result = await flow.async_step_user(user_input)
 
-        assert result["type"] == data_entry_flow.FlowResultType.FORM  # type: ignore[typeddict-item]
+        assert result["type"] == FORM  # type: ignore[typeddict-item]
         assert result["errors"]["base"] == "invalid_auth"  # type: ignore[index]
 
     @pytest.mark.asyncio
@@ -869,19 +871,17 @@ class TestConfigFlowMissingCoverage:
     # ------------------------------------------------------------------ #
 
     @pytest.mark.asyncio
-    async def test_user_step_short_credentials_shows_invalid_format(self):
+    async def test_user_step_short_credentials_shows_invalid_format(self, stub_hass):
         """Short credentials trigger validation_errors → lines 131-135."""
         flow = ElectroluxStatusFlowHandler()
-        flow.hass = Mock()
+        flow.hass = stub_hass
         flow._errors = {}
-        flow.hass.config_entries = Mock()
-        flow.hass.config_entries.async_entries.return_value = []
 
         result = await flow.async_step_user(
             {"api_key": "short", "access_token": "short", "refresh_token": "short"}
         )
 
-        assert result["type"] == data_entry_flow.FlowResultType.FORM  # type: ignore[typeddict-item]
+        assert result["type"] == FORM  # type: ignore[typeddict-item]
         assert result["errors"]["base"] == "invalid_format"  # type: ignore[index]
 
     # ------------------------------------------------------------------ #
@@ -889,13 +889,10 @@ class TestConfigFlowMissingCoverage:
     # ------------------------------------------------------------------ #
 
     @pytest.mark.asyncio
-    async def test_user_step_stores_token_expiry_when_present(self):
+    async def test_user_step_stores_token_expiry_when_present(self, stub_hass):
         """When _extract_token_expiry returns a value, token_expires_at is stored (lines 156-159)."""
         flow = ElectroluxStatusFlowHandler()
-        flow.hass = Mock()
-        flow.hass.config_entries = Mock()
-        flow.hass.config_entries.async_entries.return_value = []
-        flow.hass.data = {}
+        flow.hass = stub_hass
 
         user_input = {
             "api_key": "test_api_key_1234567890",
@@ -913,10 +910,10 @@ class TestConfigFlowMissingCoverage:
                 return_value=9999999999,
             ),
         ):
-            mock_session.return_value.get_appliances_list = AsyncMock(return_value=[])
+            mock_session.return_value.get_appliances_list = _async_return([])
             result = await flow.async_step_user(user_input)
 
-        assert result["type"] == data_entry_flow.FlowResultType.CREATE_ENTRY  # type: ignore[typeddict-item]
+        assert result["type"] == CREATE_ENTRY  # type: ignore[typeddict-item]
         assert result["data"]["token_expires_at"] == 9999999999  # type: ignore[typeddict-item]
 
     # ------------------------------------------------------------------ #
@@ -946,7 +943,7 @@ class TestConfigFlowMissingCoverage:
             # Patch _get_reauth_entry to return None on first call
             patch.object(flow, "_get_reauth_entry", return_value=None),
         ):
-            mock_session.return_value.get_appliances_list = AsyncMock(return_value=[])
+            mock_session.return_value.get_appliances_list = _async_return([])
             # Call the inner method directly to avoid the second _get_reauth_entry call
             result = await flow._validate_reauth_input(user_input)
 
@@ -998,7 +995,7 @@ class TestConfigFlowMissingCoverage:
                 return_value={"type": "abort"},
             ),
         ):
-            mock_session.return_value.get_appliances_list = AsyncMock(return_value=[])
+            mock_session.return_value.get_appliances_list = _async_return([])
             result = await flow.async_step_reauth_validate(user_input)  # type: ignore[arg-type]
 
         assert result["type"] == "abort"  # type: ignore[literal-required]
@@ -1048,7 +1045,7 @@ class TestConfigFlowMissingCoverage:
                 return_value={"type": "abort", "reason": "reconfigure_successful"},
             ),
         ):
-            mock_session.return_value.get_appliances_list = AsyncMock(return_value=[])
+            mock_session.return_value.get_appliances_list = _async_return([])
             result = await flow.async_step_reconfigure(user_input)
 
         assert result["reason"] == "reconfigure_successful"  # type: ignore[typeddict-item]
@@ -1086,12 +1083,10 @@ class TestConfigFlowMissingCoverage:
     # ------------------------------------------------------------------ #
 
     @pytest.mark.asyncio
-    async def test_user_step_unexpected_exception_shows_invalid_auth(self):
+    async def test_user_step_unexpected_exception_shows_invalid_auth(self, stub_hass):
         """RuntimeError in _test_credentials hits the unexpected-exception except block (lines 410-415)."""
         flow = ElectroluxStatusFlowHandler()
-        flow.hass = Mock()
-        flow.hass.config_entries = Mock()
-        flow.hass.config_entries.async_entries.return_value = []
+        flow.hass = stub_hass
 
         user_input = {
             "api_key": "test_api_key_1234567890",
@@ -1105,12 +1100,12 @@ class TestConfigFlowMissingCoverage:
             ) as mock_session,
             patch("custom_components.electrolux.config_flow.async_get_clientsession"),
         ):
-            mock_session.return_value.get_appliances_list = AsyncMock(
-                side_effect=RuntimeError("unexpected error")
+            mock_session.return_value.get_appliances_list = _async_raise(
+                RuntimeError("unexpected error")
             )
             result = await flow.async_step_user(user_input)
 
-        assert result["type"] == data_entry_flow.FlowResultType.FORM  # type: ignore[typeddict-item]
+        assert result["type"] == FORM  # type: ignore[typeddict-item]
         assert result["errors"]["base"] == "invalid_auth"  # type: ignore[index]
 
     # ------------------------------------------------------------------ #
@@ -1143,12 +1138,12 @@ class TestConfigFlowMissingCoverage:
             ) as mock_session,
             patch("custom_components.electrolux.config_flow.async_get_clientsession"),
         ):
-            mock_session.return_value.get_appliances_list = AsyncMock(
-                side_effect=RuntimeError("unexpected error")
+            mock_session.return_value.get_appliances_list = _async_raise(
+                RuntimeError("unexpected error")
             )
             result = await flow.async_step_user(user_input)
 
-        assert result["type"] == data_entry_flow.FlowResultType.FORM  # type: ignore[typeddict-item]
+        assert result["type"] == FORM  # type: ignore[typeddict-item]
         assert result["errors"]["base"] == "invalid_auth"  # type: ignore[index]
 
     # ------------------------------------------------------------------ #
@@ -1186,9 +1181,7 @@ class TestConfigFlowMissingCoverage:
         flow = ElectroluxRepairFlow()
         flow.hass = Mock()
         flow.context = {"issue_id": "invalid_refresh_token_test_entry"}  # type: ignore[typeddict-item]
-        mock_entry = Mock()
-        mock_entry.entry_id = "test_entry"
-        mock_entry.data = {"api_key": "old_key"}
+        mock_entry = _FakeEntry(data={"api_key": "old_key"})
         flow.hass.config_entries = Mock()
         flow.hass.config_entries.async_get_entry = Mock(return_value=mock_entry)
 
@@ -1196,7 +1189,7 @@ class TestConfigFlowMissingCoverage:
             {"api_key": "short", "access_token": "short", "refresh_token": "short"}
         )
 
-        assert result["type"] == data_entry_flow.FlowResultType.FORM  # type: ignore[typeddict-item]
+        assert result["type"] == FORM  # type: ignore[typeddict-item]
         assert result["errors"]["base"] == "invalid_format"  # type: ignore[index]
 
     # ------------------------------------------------------------------ #
@@ -1207,9 +1200,9 @@ class TestConfigFlowMissingCoverage:
     async def test_repair_confirm_repair_success_with_token_expiry(self):
         """Repair flow success with token_expiry truthy stores expires_at and runs update/reload (lines 635-636, 651-653)."""
         mock_hass = Mock()
-        mock_entry = Mock()
-        mock_entry.entry_id = "test_entry"
-        mock_entry.data = {"api_key": "old_key", "access_token": "old_token"}
+        mock_entry = _FakeEntry(
+            data={"api_key": "old_key", "access_token": "old_token"}
+        )
         mock_hass.config_entries = Mock()
         mock_hass.config_entries.async_get_entry = Mock(return_value=mock_entry)
         mock_hass.config_entries.async_update_entry = Mock()
@@ -1236,10 +1229,10 @@ class TestConfigFlowMissingCoverage:
                 return_value=9999999999,
             ),
         ):
-            mock_session.return_value.get_appliances_list = AsyncMock(return_value=[])
+            mock_session.return_value.get_appliances_list = _async_return([])
             result = await flow.async_step_init(user_input)
 
-        assert result["type"] == data_entry_flow.FlowResultType.CREATE_ENTRY  # type: ignore[typeddict-item]
+        assert result["type"] == CREATE_ENTRY  # type: ignore[typeddict-item]
         mock_hass.config_entries.async_update_entry.assert_called_once()
         mock_hass.config_entries.async_reload.assert_called_once()
 
@@ -1255,9 +1248,7 @@ class TestConfigFlowMissingCoverage:
         flow = ElectroluxRepairFlow()
         flow.hass = Mock()
         flow.context = {"issue_id": "invalid_refresh_token_test_entry"}  # type: ignore[typeddict-item]
-        mock_entry = Mock()
-        mock_entry.entry_id = "test_entry"
-        mock_entry.data = {"api_key": "old_key"}
+        mock_entry = _FakeEntry(data={"api_key": "old_key"})
         flow.hass.config_entries = Mock()
         flow.hass.config_entries.async_get_entry = Mock(return_value=mock_entry)
 
@@ -1273,10 +1264,10 @@ class TestConfigFlowMissingCoverage:
             ) as mock_session,
             patch("custom_components.electrolux.config_flow.async_get_clientsession"),
         ):
-            mock_session.return_value.get_appliances_list = AsyncMock(
-                side_effect=RuntimeError("unexpected error")
+            mock_session.return_value.get_appliances_list = _async_raise(
+                RuntimeError("unexpected error")
             )
             result = await flow.async_step_init(user_input)
 
-        assert result["type"] == data_entry_flow.FlowResultType.FORM  # type: ignore[typeddict-item]
+        assert result["type"] == FORM  # type: ignore[typeddict-item]
         assert result["errors"]["base"] == "invalid_auth"  # type: ignore[index]
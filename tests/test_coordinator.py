@@ -1,10 +1,15 @@
 """Test the Electrolux coordinator."""
 
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+from homeassistant.exceptions import ConfigEntryAuthFailed, ConfigEntryNotReady
+from homeassistant.helpers.update_coordinator import UpdateFailed
 
-from custom_components.electrolux.models import Appliance, Appliances
+from custom_components.electrolux.auth_errors import is_auth_error
+from custom_components.electrolux.coordinator import ElectroluxCoordinator
+from custom_components.electrolux.exceptions import NetworkError
 
 
 @pytest.fixture
@@ -17,39 +22,24 @@ def mock_api_client():
 
 @pytest.fixture
 def mock_coordinator(mock_api_client):
-    """Create a mock coordinator with the necessary attributes."""
-    from custom_components.electrolux.coordinator import ElectroluxCoordinator
+    """Create a coordinator through its real __init__ with a stub hass and client."""
+    # Only hass.loop.time() is needed for cleanup timing; tests that assert
+    # against hass calls swap in a MagicMock themselves
+    hass = SimpleNamespace(loop=SimpleNamespace(time=lambda: 1000000.0))
 
-    # Mock the DataUpdateCoordinator.__init__ to avoid HA setup issues
+    # Skip DataUpdateCoordinator's HA setup; the coordinator's own state is real
     with patch(
         "homeassistant.helpers.update_coordinator.DataUpdateCoordinator.__init__",
         return_value=None,
     ):
-        coord = ElectroluxCoordinator.__new__(ElectroluxCoordinator)
-        coord.api = mock_api_client
-        coord.platforms = []
-        coord.renew_interval = 7200
-        coord.data = {}  # Initialize as empty dict instead of None
-        coord._last_update_times = {}
-        coord._last_known_connectivity = {}
-        coord._last_sse_restart_time = 0
-        coord._consecutive_sse_restarts = 0
-        coord._consecutive_auth_failures = 0
-        coord._auth_failure_threshold = 3
-        coord._last_time_to_end = {}
-        coord._last_time_to_end_seen = {}
-        coord._deferred_tasks = set()
-        coord._deferred_tasks_by_appliance = {}
-        coord._pending_capability_retry = set()
-
-        # Mock hass.loop.time() for cleanup timing
-        mock_loop = MagicMock()
-        mock_loop.time.return_value = 1000000.0  # Mock timestamp
-        mock_hass = MagicMock()
-        mock_hass.loop = mock_loop
-        coord.hass = mock_hass
-
-        return coord
+        coord = ElectroluxCoordinator(
+            hass=hass,
+            client=mock_api_client,
+            renew_interval=7200,
+            username="test_user",
+        )
+    coord.data = {}  # Initialize as empty dict instead of None
+    return coord
 
 
 def test_coordinator_attributes(mock_coordinator, mock_api_client):
@@ -59,7 +49,6 @@ def test_coordinator_attributes(mock_coordinator, mock_api_client):
     assert mock_coordinator.renew_interval == 7200
 
 
-@pytest.mark.asyncio
 async def test_async_update_data_success(mock_coordinator, mock_api_client):
     """Test successful data update with mocked API response."""
     # Create mock appliance data
@@ -75,10 +64,7 @@ async def test_async_update_data_success(mock_coordinator, mock_api_client):
     }
 
     # Mock the API to return the appliance state
-    async def mock_get_state(app_id):
-        return mock_appliance_state
-
-    mock_api_client.get_appliance_state = mock_get_state
+    mock_api_client.get_appliance_state = AsyncMock(return_value=mock_appliance_state)
 
     # Create a mock appliance in the coordinator data
     mock_appliance = MagicMock()
@@ -95,7 +81,7 @@ async def test_async_update_data_success(mock_coordinator, mock_api_client):
     result = await mock_coordinator._async_update_data()
 
     # Verify the API was called correctly
-    # Since it's not a mock, we can't assert_called
+    mock_api_client.get_appliance_state.assert_called_once_with("test_appliance_1")
 
     # Verify the appliance was updated with the correct data
     mock_appliance.update.assert_called_once_with(mock_appliance_state)
@@ -104,62 +90,48 @@ async def test_async_update_data_success(mock_coordinator, mock_api_client):
     assert result == mock_coordinator.data
 
 
-@pytest.mark.asyncio
-async def test_async_update_data_api_error(mock_coordinator, mock_api_client):
-    """Test data update when API call fails."""
-    # Mock the API to raise an exception
-    mock_api_client.get_appliance_state = AsyncMock(side_effect=Exception("API Error"))
+@pytest.mark.parametrize(
+    ("side_effect", "expected", "auth_failures"),
+    [
+        pytest.param(Exception("API Error"), UpdateFailed, 0, id="api_error"),
+        pytest.param(
+            Exception("401 Unauthorized"), ConfigEntryAuthFailed, 1, id="auth_error"
+        ),
+        pytest.param(
+            NetworkError("Network connection failed"), UpdateFailed, 0, id="offline"
+        ),
+    ],
+)
+async def test_async_update_data_error_paths(
+    mock_coordinator, mock_api_client, side_effect, expected, auth_failures
+):
+    """Test that a failing appliance fetch surfaces the matching HA exception."""
+    mock_api_client.get_appliance_state = AsyncMock(side_effect=side_effect)
 
     # Create a mock appliance
-    mock_appliance = MagicMock(spec=Appliance)
-    mock_appliance.pnc_id = "test_appliance_1"
-
-    mock_appliances = MagicMock(spec=Appliances)
-    mock_appliances.get_appliances.return_value = {"test_appliance_1": mock_appliance}
-
-    # Set up coordinator data
-    mock_coordinator.data = {"appliances": mock_appliances}
-
-    # Call the update method and expect it to raise UpdateFailed
-    from homeassistant.helpers.update_coordinator import UpdateFailed
+    mock_appliance = SimpleNamespace(pnc_id="test_appliance_1")
 
-    with pytest.raises(UpdateFailed):
-        await mock_coordinator._async_update_data()
-
-
-@pytest.mark.asyncio
-async def test_async_update_data_auth_error(mock_coordinator, mock_api_client):
-    """Test data update when authentication fails."""
-    # Mock the API to raise an exception with auth keywords
-    mock_api_client.get_appliance_state = AsyncMock(
-        side_effect=Exception("401 Unauthorized")
-    )
-
-    # Create a mock appliance
-    mock_appliance = MagicMock(spec=Appliance)
-    mock_appliance.pnc_id = "test_appliance_1"
-
-    mock_appliances = MagicMock(spec=Appliances)
+    mock_appliances = MagicMock()
     mock_appliances.get_appliances.return_value = {"test_appliance_1": mock_appliance}
 
     # Set up coordinator data and required attributes
     mock_coordinator.data = {"appliances": mock_appliances}
     mock_coordinator.hass = MagicMock()  # Mock hass for issue creation
-    mock_coordinator.config_entry = MagicMock()  # Mock config entry
-    mock_coordinator.config_entry.entry_id = "test_entry_id"
-    mock_coordinator.config_entry.title = "Test Entry"
+    mock_coordinator.config_entry = SimpleNamespace(
+        entry_id="test_entry_id", title="Test Entry"
+    )
     mock_coordinator._auth_failure_threshold = (
         1  # Trigger reauth on first failure for test
     )
 
-    # Call the update method and expect it to raise ConfigEntryAuthFailed
-    from homeassistant.exceptions import ConfigEntryAuthFailed
-
-    with pytest.raises(ConfigEntryAuthFailed):
+    with pytest.raises(expected):
         await mock_coordinator._async_update_data()
 
+    mock_api_client.get_appliance_state.assert_called_once_with("test_appliance_1")
+    # Only auth errors count towards the reauth threshold
+    assert mock_coordinator._consecutive_auth_failures == auth_failures
+
 
-@pytest.mark.asyncio
 async def test_async_update_data_multiple_appliances(mock_coordinator, mock_api_client):
     """Test data update with multiple appliances."""
     # Create mock appliance states
@@ -176,13 +148,12 @@ async def test_async_update_data_multiple_appliances(mock_coordinator, mock_api_
     )
 
     # Create mock appliances
-    mock_appliance_1 = MagicMock()
-    mock_appliance_1.pnc_id = "appliance_1"
-    mock_appliance_1.update = MagicMock()
-
-    mock_appliance_2 = MagicMock()
-    mock_appliance_2.pnc_id = "appliance_2"
-    mock_appliance_2.update = MagicMock()
+    mock_appliance_1 = SimpleNamespace(
+        pnc_id="appliance_1", state={}, update=MagicMock()
+    )
+    mock_appliance_2 = SimpleNamespace(
+        pnc_id="appliance_2", state={}, update=MagicMock()
+    )
 
     mock_appliances = MagicMock()
     mock_appliances.get_appliances.return_value = {
@@ -204,10 +175,9 @@ async def test_async_update_data_multiple_appliances(mock_coordinator, mock_api_
     assert result == mock_coordinator.data
 
 
-@pytest.mark.asyncio
-async def test_setup_token_refresh_callback(mock_coordinator):
-    """Test setting up the token refresh callback."""
-    # Mock config entry
+@pytest.fixture
+def coord_with_callback(mock_coordinator):
+    """Return the coordinator and the token update callback it registered."""
     mock_config_entry = MagicMock()
     mock_config_entry.data = {
         "access_token": "old_token",
@@ -216,18 +186,22 @@ async def test_setup_token_refresh_callback(mock_coordinator):
     mock_coordinator.config_entry = mock_config_entry
     mock_coordinator.hass = MagicMock()
 
-    # Call setup
     mock_coordinator.setup_token_refresh_callback()
 
+    call_args = mock_coordinator.api.set_token_update_callback_with_expiry.call_args
+    return mock_coordinator, call_args[0][0]
+
+
+def test_setup_token_refresh_callback(coord_with_callback):
+    """Test setting up the token refresh callback."""
+    coord, _callback = coord_with_callback
+
     # Verify callback was set
-    mock_coordinator.api.set_token_update_callback_with_expiry.assert_called_once()
+    coord.api.set_token_update_callback_with_expiry.assert_called_once()
 
 
-@pytest.mark.asyncio
 async def test_handle_authentication_error(mock_coordinator):
     """Test handling authentication errors."""
-    from homeassistant.exceptions import ConfigEntryAuthFailed
-
     # Test with auth error
     with pytest.raises(ConfigEntryAuthFailed):
         await mock_coordinator.handle_authentication_error(
@@ -238,20 +212,8 @@ async def test_handle_authentication_error(mock_coordinator):
     await mock_coordinator.handle_authentication_error(Exception("Network error"))
 
 
-@pytest.mark.asyncio
-async def test_token_refresh_loop(mock_coordinator):
-    """Test that background token refresh loop was removed in favor of lazy refreshing."""
-    # The background token refresh loop was removed to prevent collision risks
-    # Token refresh now happens lazily through the TokenManager's get_auth_data method
-    assert not hasattr(mock_coordinator, "_token_refresh_loop")
-    assert not hasattr(mock_coordinator, "token_refresh_task")
-
-
-@pytest.mark.asyncio
 async def test_async_update_data_auth_failed(mock_coordinator):
     """Test _async_update_data when auth has failed."""
-    from homeassistant.exceptions import ConfigEntryAuthFailed
-
     # Set auth failed flag
     mock_coordinator.api._auth_failed = True
 
@@ -260,48 +222,28 @@ async def test_async_update_data_auth_failed(mock_coordinator):
         await mock_coordinator._async_update_data()
 
 
-@pytest.mark.asyncio
-async def test_token_update_callback(mock_coordinator):
+@pytest.mark.parametrize(
+    ("access", "refresh", "expires"),
+    [("new_access", "new_refresh", 1234567890)],
+)
+def test_token_update_callback(coord_with_callback, access, refresh, expires):
     """Test the token update callback."""
-    # Mock config entry
-    mock_config_entry = MagicMock()
-    mock_config_entry.data = {
-        "access_token": "old_token",
-        "refresh_token": "old_refresh",
-    }
-    mock_coordinator.config_entry = mock_config_entry
-    mock_coordinator.hass = MagicMock()
-
-    # Setup callback
-    mock_coordinator.setup_token_refresh_callback()
-
-    # Get the callback function
-    call_args = mock_coordinator.api.set_token_update_callback_with_expiry.call_args
-    callback = call_args[0][0]
+    mock_coordinator, callback = coord_with_callback
 
     # Call the callback
-    callback("new_access", "new_refresh", "api_key", 1234567890)
+    callback(access, refresh, "api_key", expires)
 
     # Verify config entry was updated (update_listener will prevent reload via timestamp check)
-    expected_data = {
-        "access_token": "new_access",
-        "refresh_token": "new_refresh",
-        "token_expires_at": 1234567890,
-    }
     mock_coordinator.hass.config_entries.async_update_entry.assert_called_once_with(
-        mock_config_entry, data=expected_data
+        mock_coordinator.config_entry,
+        data={
+            "access_token": access,
+            "refresh_token": refresh,
+            "token_expires_at": expires,
+        },
     )
 
 
-@pytest.mark.asyncio
-async def test_background_token_refresh_with_rate_limit(mock_coordinator):
-    """Test that background token refresh loop was removed to prevent rate limiting issues."""
-    # The background token refresh loop was removed to prevent collision risks
-    # Rate limiting is now handled by the TokenManager's lazy refresh with cooldown
-    assert not hasattr(mock_coordinator, "_token_refresh_loop")
-
-
-@pytest.mark.asyncio
 async def test_auth_error_detection_in_sse():
     """Test auth error detection in SSE failure handling."""
     client = MagicMock()
@@ -317,23 +259,13 @@ async def test_auth_error_detection_in_sse():
 
     # Call the failure handler (simplified)
     if client.hass and client.config_entry:
-        error_msg = str(task.exception()).lower()
-        auth_keywords = [
-            "401",
-            "unauthorized",
-            "auth",
-            "token",
-            "invalid grant",
-            "forbidden",
-        ]
-        if any(keyword in error_msg for keyword in auth_keywords):
+        if is_auth_error(task.exception()):
             await client._trigger_reauth(f"SSE auth error: {task.exception()}")
 
     # Verify reauth was triggered
     client._trigger_reauth.assert_called_once()
 
 
-@pytest.mark.asyncio
 async def test_token_refresh_error_handling():
     """Test token refresh error creates issue and triggers reauth."""
     from custom_components.electrolux.util import ElectroluxApiClient
@@ -359,14 +291,11 @@ async def test_token_refresh_error_handling():
 
 def test_coordinator_init_sets_attributes():
     """Test that ElectroluxCoordinator.__init__ sets all expected attributes."""
-    from unittest.mock import patch
-
-    from custom_components.electrolux.coordinator import ElectroluxCoordinator
-
     mock_hass = MagicMock()
     mock_client = MagicMock()
     mock_client._auth_failed = False
 
+    # Mock the DataUpdateCoordinator.__init__ to avoid HA setup issues
     with patch(
         "homeassistant.helpers.update_coordinator.DataUpdateCoordinator.__init__",
         return_value=None,
@@ -383,6 +312,8 @@ def test_coordinator_init_sets_attributes():
     assert coordinator.platforms == []
     assert coordinator.renew_task is None
     assert coordinator.listen_task is None
+    # The config entry starts the token refresh task after setup
+    assert coordinator.token_refresh_task is None
     assert coordinator.renew_interval == 3600
     assert coordinator._consecutive_auth_failures == 0
     assert coordinator._auth_failure_threshold == 3
@@ -400,89 +331,53 @@ def test_coordinator_init_sets_attributes():
 # ---------------------------------------------------------------------------
 
 
-@pytest.mark.asyncio
 async def test_async_login_success():
     """async_login returns True when get_appliances_list succeeds."""
-    from custom_components.electrolux.coordinator import ElectroluxCoordinator
-
-    with patch(
-        "homeassistant.helpers.update_coordinator.DataUpdateCoordinator.__init__",
-        return_value=None,
-    ):
-        coord = ElectroluxCoordinator.__new__(ElectroluxCoordinator)
-        coord.api = MagicMock()
-        coord.api.get_appliances_list = AsyncMock(return_value=[])
-        coord.api._token_manager = MagicMock()
-        coord.api._token_manager.is_token_valid.return_value = True
+    coord = ElectroluxCoordinator.__new__(ElectroluxCoordinator)
+    coord.api = MagicMock()
+    coord.api.get_appliances_list = AsyncMock(return_value=[])
+    coord.api._token_manager = MagicMock()
+    coord.api._token_manager.is_token_valid.return_value = True
 
     result = await coord.async_login()
     assert result is True
 
 
-@pytest.mark.asyncio
 async def test_async_login_raises_config_entry_auth_failed_on_auth_error():
     """async_login raises ConfigEntryAuthFailed when AuthenticationError is raised."""
-    from homeassistant.exceptions import ConfigEntryAuthFailed
-
-    from custom_components.electrolux.coordinator import ElectroluxCoordinator
     from custom_components.electrolux.exceptions import AuthenticationError
 
-    with patch(
-        "homeassistant.helpers.update_coordinator.DataUpdateCoordinator.__init__",
-        return_value=None,
-    ):
-        coord = ElectroluxCoordinator.__new__(ElectroluxCoordinator)
-        coord.api = MagicMock()
-        coord.api.get_appliances_list = AsyncMock(
-            side_effect=AuthenticationError("bad creds")
-        )
-        coord.api._token_manager = MagicMock()
-        coord.api._token_manager.is_token_valid.return_value = False
+    coord = ElectroluxCoordinator.__new__(ElectroluxCoordinator)
+    coord.api = MagicMock()
+    coord.api.get_appliances_list = AsyncMock(
+        side_effect=AuthenticationError("bad creds")
+    )
+    coord.api._token_manager = MagicMock()
+    coord.api._token_manager.is_token_valid.return_value = False
 
     with pytest.raises(ConfigEntryAuthFailed):
         await coord.async_login()
 
 
-@pytest.mark.asyncio
 async def test_async_login_raises_config_entry_not_ready_on_network_error():
     """async_login raises ConfigEntryNotReady when NetworkError is raised."""
-    from homeassistant.exceptions import ConfigEntryNotReady
-
-    from custom_components.electrolux.coordinator import ElectroluxCoordinator
-    from custom_components.electrolux.exceptions import NetworkError
-
-    with patch(
-        "homeassistant.helpers.update_coordinator.DataUpdateCoordinator.__init__",
-        return_value=None,
-    ):
-        coord = ElectroluxCoordinator.__new__(ElectroluxCoordinator)
-        coord.api = MagicMock()
-        coord.api.get_appliances_list = AsyncMock(side_effect=NetworkError("timeout"))
-        coord.api._token_manager = MagicMock()
-        coord.api._token_manager.is_token_valid.return_value = True
+    coord = ElectroluxCoordinator.__new__(ElectroluxCoordinator)
+    coord.api = MagicMock()
+    coord.api.get_appliances_list = AsyncMock(side_effect=NetworkError("timeout"))
+    coord.api._token_manager = MagicMock()
+    coord.api._token_manager.is_token_valid.return_value = True
 
     with pytest.raises(ConfigEntryNotReady):
         await coord.async_login()
 
 
-@pytest.mark.asyncio
 async def test_async_login_raises_config_entry_not_ready_on_unexpected_error():
     """async_login raises ConfigEntryNotReady on unexpected exceptions."""
-    from homeassistant.exceptions import ConfigEntryNotReady
-
-    from custom_components.electrolux.coordinator import ElectroluxCoordinator
-
-    with patch(
-        "homeassistant.helpers.update_coordinator.DataUpdateCoordinator.__init__",
-        return_value=None,
-    ):
-        coord = ElectroluxCoordinator.__new__(ElectroluxCoordinator)
-        coord.api = MagicMock()
-        coord.api.get_appliances_list = AsyncMock(
-            side_effect=RuntimeError("unexpected")
-        )
-        coord.api._token_manager = MagicMock()
-        coord.api._token_manager.is_token_valid.return_value = True
+    coord = ElectroluxCoordinator.__new__(ElectroluxCoordinator)
+    coord.api = MagicMock()
+    coord.api.get_appliances_list = AsyncMock(side_effect=RuntimeError("unexpected"))
+    coord.api._token_manager = MagicMock()
+    coord.api._token_manager.is_token_valid.return_value = True
 
     with pytest.raises(ConfigEntryNotReady):
         await coord.async_login()
@@ -493,7 +388,6 @@ async def test_async_login_raises_config_entry_not_ready_on_unexpected_error():
 # ---------------------------------------------------------------------------
 
 
-@pytest.mark.asyncio
 async def test_cancel_cleanup_tasks_cancelled_error_is_reraised(mock_coordinator):
     """L615-621: asyncio.gather raises CancelledError → drains again, logs, re-raises."""
     import asyncio
@@ -524,7 +418,6 @@ async def test_cancel_cleanup_tasks_cancelled_error_is_reraised(mock_coordinator
     assert gather_call_count == 2
 
 
-@pytest.mark.asyncio
 async def test_cancel_cleanup_tasks_generic_exception_is_swallowed(mock_coordinator):
     """L622-623: Generic exception during gather is logged and NOT re-raised."""
     mock_task = MagicMock()
@@ -1,35 +1,30 @@
 """Test coordinator connectivity and error handling."""
 
 import asyncio
+from types import MappingProxyType, SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
-from custom_components.electrolux.models import Appliances
-from custom_components.electrolux.util import NetworkError
+from custom_components.electrolux.coordinator import ElectroluxCoordinator
+from custom_components.electrolux.models import Appliance, Appliances
 
 
 @pytest.fixture
 def mock_hass():
     """Mock Home Assistant instance."""
-    hass = MagicMock()
-    hass.loop = MagicMock()
-    hass.loop.time.return_value = 1000000000
-    hass.async_create_task = MagicMock(
-        side_effect=lambda coro, **kwargs: (
+    return SimpleNamespace(
+        loop=SimpleNamespace(time=lambda: 1000000000),
+        async_create_task=lambda coro, **kwargs: (
             coro.close() if asyncio.iscoroutine(coro) else None
-        )
+        ),
     )
-    return hass
 
 
 @pytest.fixture
 def mock_config_entry():
     """Mock config entry."""
-    entry = MagicMock()
-    entry.entry_id = "test_entry_id"
-    entry.title = "Test Entry"
-    return entry
+    return SimpleNamespace(entry_id="test_entry_id", title="Test Entry")
 
 
 @pytest.fixture
@@ -48,105 +43,65 @@ def mock_api_client():
 
 @pytest.fixture
 def coordinator(mock_hass, mock_api_client, mock_config_entry):
-    """Create test coordinator."""
-    from custom_components.electrolux.coordinator import ElectroluxCoordinator
-
-    # Mock the DataUpdateCoordinator.__init__ to avoid HA setup issues
+    """Create a coordinator through its real __init__ with a stub hass and client."""
+    # Skip DataUpdateCoordinator's HA setup; the coordinator's own state is real
     with patch(
         "homeassistant.helpers.update_coordinator.DataUpdateCoordinator.__init__",
         return_value=None,
     ):
-        coord = ElectroluxCoordinator.__new__(ElectroluxCoordinator)
-        coord.hass = mock_hass
-        coord.api = mock_api_client
-        coord.config_entry = mock_config_entry
-        coord.platforms = []
-        coord.renew_interval = 3600
-        coord.data = {"appliances": Appliances({})}
-        coord._last_known_connectivity = {}
-        coord._last_update_times = {}
-        coord._last_sse_restart_time = 0
-        coord._consecutive_sse_restarts = 0
-        coord.renew_task = None
-        coord.listen_task = None
-        coord._deferred_tasks = set()
-        coord._deferred_tasks_by_appliance = {}
-        coord._appliances_lock = asyncio.Lock()
-        coord._manual_sync_lock = asyncio.Lock()
-        coord._last_cleanup_time = 0
-        coord._last_manual_sync_time = 0
-        coord._consecutive_auth_failures = 0
-        coord._auth_failure_threshold = 3
-        coord._last_time_to_end = {}
-        coord._last_time_to_end_seen = {}
-        coord._last_token_update = 0.0
-        coord._appliances_cache = None
-        coord._can_restart_sse = MagicMock(return_value=True)
-        return coord
+        coord = ElectroluxCoordinator(
+            hass=mock_hass,
+            client=mock_api_client,
+            renew_interval=3600,
+            username="test_user",
+        )
+    coord.config_entry = mock_config_entry
+    coord.data = {"appliances": Appliances({})}
+    coord._can_restart_sse = MagicMock(return_value=True)
+    return coord
 
 
-class TestCoordinatorConnectivity:
-    """Test coordinator connectivity and error handling."""
+# Read-only initial state shared by every test appliance; Appliance.update()
+# replaces it before the coordinator writes connectivity changes.
+_CONNECTED_STATE = MappingProxyType({"connectivityState": "connected"})
 
-    @pytest.mark.asyncio
-    async def test_appliance_offline_marks_unavailable_without_reauth(
-        self, coordinator, mock_api_client
-    ):
-        """Test that appliance offline errors mark entities unavailable without triggering reauth."""
-        # Setup mock appliance data
-        from custom_components.electrolux.models import Appliance
 
-        appliance_id = "test_appliance_123"
+@pytest.fixture
+def make_appliance(coordinator):
+    """Return a factory that installs a single appliance on the coordinator."""
+
+    def _make(
+        pnc_id="test_appliance_123",
+        name="Test Appliance",
+        brand="Electrolux",
+        model="TestModel",
+        state=_CONNECTED_STATE,
+    ):
         appliance = Appliance(
             coordinator=coordinator,
-            name="Test Appliance",
-            pnc_id=appliance_id,
-            brand="Electrolux",
-            model="TestModel",
-            state={"connectivityState": "connected"},
+            name=name,
+            pnc_id=pnc_id,
+            brand=brand,
+            model=model,
+            state=state,
         )
-        appliances = Appliances({appliance_id: appliance})
+        appliances = Appliances({pnc_id: appliance})
         coordinator.data = {"appliances": appliances}
+        return appliance, appliances
 
-        # Mock network error during appliance state fetch
-        mock_api_client.get_appliance_state.side_effect = NetworkError(
-            "Network connection failed"
-        )
-
-        # Call update data - expect UpdateFailed when all appliances fail
-        from homeassistant.helpers.update_coordinator import UpdateFailed
-
-        with pytest.raises(UpdateFailed):
-            await coordinator._async_update_data()
+    return _make
 
-        # Verify get_appliance_state was called
-        mock_api_client.get_appliance_state.assert_called_once_with(appliance_id)
 
-        # Verify no reauth was triggered (auth_failed should remain False)
-        assert mock_api_client._auth_failed is False
-
-        # Verify the coordinator logged the failure but didn't raise auth error
-        # (In real HA, this would mark the entity as unavailable)
+class TestCoordinatorConnectivity:
+    """Test coordinator connectivity and error handling."""
 
-    @pytest.mark.asyncio
     async def test_sse_stream_recovery_attempts_reconnection(
-        self, coordinator, mock_api_client, mock_hass
+        self, coordinator, make_appliance, mock_api_client, mock_hass
     ):
         """Test that SSE stream disconnection triggers reconnection attempts."""
         # Setup mock appliance data
-        from custom_components.electrolux.models import Appliance
-
         appliance_id = "test_appliance_123"
-        appliance = Appliance(
-            coordinator=coordinator,
-            name="Test Appliance",
-            pnc_id=appliance_id,
-            brand="Electrolux",
-            model="TestModel",
-            state={"connectivityState": "connected"},
-        )
-        appliances = Appliances({appliance_id: appliance})
-        coordinator.data = {"appliances": appliances}
+        make_appliance(pnc_id=appliance_id)
 
         # Mock successful initial SSE setup
         mock_api_client.watch_for_appliance_state_updates.return_value = None
@@ -177,33 +132,13 @@ class TestCoordinatorConnectivity:
         # renew_websocket task which runs every 6 hours. The test above verifies
         # that SSE can be started successfully.
 
-    @pytest.mark.asyncio
     async def test_successful_appliance_poll_updates_state(
-        self, coordinator, mock_api_client
+        self, coordinator, make_appliance, mock_api_client
     ):
         """Test that successful appliance polling updates the appliance state."""
         # Setup mock appliance data
-        from custom_components.electrolux.models import Appliance
-
         appliance_id = "test_appliance_123"
-        appliance = Appliance(
-            coordinator=coordinator,
-            name="Test Appliance",
-            pnc_id=appliance_id,
-            brand="Electrolux",
-            model="TestModel",
-            state={"connectivityState": "connected"},
-        )
-        appliances = Appliances({appliance_id: appliance})
-        coordinator.data = {"appliances": appliances}
-
-        # Debug: check before update
-        print(
-            f"Before update - Appliances object id: {id(coordinator.data['appliances'])}"
-        )
-        print(
-            f"Before update - Appliances dict: {coordinator.data['appliances'].get_appliances()}"
-        )
+        make_appliance(pnc_id=appliance_id)
 
         # Mock successful appliance state response
         mock_state = {
@@ -219,16 +154,6 @@ class TestCoordinatorConnectivity:
         # Call update data
         result = await coordinator._async_update_data()
 
-        # Debug: check what's in result
-        print(f"Result: {result}")
-        print(f"Appliances object id: {id(result['appliances'])}")
-        print(f"Appliances in result: {result['appliances'].get_appliances()}")
-        print(f"Appliance ID: {appliance_id}")
-        print(f"Coordinator data appliances id: {id(coordinator.data['appliances'])}")
-        print(
-            f"Coordinator data appliances dict: {coordinator.data['appliances'].get_appliances()}"
-        )
-
         # Verify the appliance state was updated
         updated_appliance = result["appliances"].get_appliances()[appliance_id]
         assert updated_appliance.state["connectivityState"] == "connected"
@@ -250,36 +175,31 @@ class TestCoordinatorConnectivity:
 class TestSSERecovery:
     """Test SSE stream recovery functionality."""
 
-    @pytest.mark.asyncio
-    async def test_sse_recovery_loop_with_reconnect(self, coordinator, mock_api_client):
+    async def test_sse_recovery_loop_with_reconnect(
+        self, coordinator, make_appliance, mock_api_client
+    ):
         """Test that SSE recovery loop can be started and cancelled properly."""
         # Setup mock appliance data
-        from custom_components.electrolux.models import Appliance
-
         appliance_id = "test_appliance_123"
-        appliance = Appliance(
-            coordinator=coordinator,
-            name="Test Appliance",
-            pnc_id=appliance_id,
-            brand="Electrolux",
-            model="TestModel",
-            state={"connectivityState": "connected"},
-        )
-        appliances = Appliances({appliance_id: appliance})
-        coordinator.data = {"appliances": appliances}
+        make_appliance(pnc_id=appliance_id)
+
+        # Renew immediately so the loop iterates without waiting
+        coordinator.renew_interval = 0
 
-        # Set a very short renew interval for testing
-        coordinator.renew_interval = 0.001  # Very short interval
+        # Mock successful reconnect operations, signalling once listen runs
+        called = asyncio.Event()
+
+        async def _listen():
+            called.set()
 
-        # Mock successful reconnect operations
         mock_api_client.disconnect_websocket = AsyncMock()
-        coordinator.listen_websocket = AsyncMock()
+        coordinator.listen_websocket = _listen
 
         # Start the renew_websocket task
         renew_task = asyncio.create_task(coordinator.renew_websocket())
 
-        # Wait a short time to allow at least one iteration
-        await asyncio.sleep(0.01)
+        # Wait until one iteration has reconnected
+        await asyncio.wait_for(called.wait(), timeout=1.0)
 
         # Cancel the task
         renew_task.cancel()
@@ -294,9 +214,7 @@ class TestSSERecovery:
         ), "disconnect_websocket should have been called"
 
         # Verify that listen_websocket was called at least once
-        assert (
-            coordinator.listen_websocket.called
-        ), "listen_websocket should have been called"
+        assert called.is_set(), "listen_websocket should have been called"
 
 
 # Mock appliance states for different device types
@@ -337,201 +255,121 @@ MOCK_AC_STATE = {
 class TestMultiApplianceMatrix:
     """Test multi-appliance compatibility matrix."""
 
-    @pytest.mark.asyncio
-    async def test_oven_state_processing(self, coordinator, mock_api_client):
-        """Test that oven appliance state is processed correctly."""
-        from custom_components.electrolux.models import Appliance
-
-        appliance_id = "oven_123"
-        appliance = Appliance(
-            coordinator=coordinator,
-            name="Test Oven",
-            pnc_id=appliance_id,
-            brand="Electrolux",
-            model="TestOven",
-            state={"connectivityState": "connected"},
-        )
-        appliances = Appliances({appliance_id: appliance})
-        coordinator.data = {"appliances": appliances}
-
-        mock_api_client.get_appliance_state.return_value = MOCK_OVEN_STATE
-        mock_api_client.get_appliances_list.return_value = [
-            {"applianceId": appliance_id}
-        ]
-
-        result = await coordinator._async_update_data()
-
-        updated_appliance = result["appliances"].get_appliances()[appliance_id]
-        assert updated_appliance.state["connectivityState"] == "connected"
-        assert updated_appliance.state["cavityLight"] == "OFF"
-        assert updated_appliance.state["targetTemperatureC"] == 180
-
-    @pytest.mark.asyncio
-    async def test_washer_state_processing(self, coordinator, mock_api_client):
-        """Test that washer appliance state is processed correctly."""
-        from custom_components.electrolux.models import Appliance
-
-        appliance_id = "washer_123"
-        appliance = Appliance(
-            coordinator=coordinator,
-            name="Test Washer",
-            pnc_id=appliance_id,
-            brand="Electrolux",
-            model="TestWasher",
-            state={"connectivityState": "connected"},
-        )
-        appliances = Appliances({appliance_id: appliance})
-        coordinator.data = {"appliances": appliances}
-
-        mock_api_client.get_appliance_state.return_value = MOCK_WASHER_STATE
-        mock_api_client.get_appliances_list.return_value = [
-            {"applianceId": appliance_id}
-        ]
-
-        result = await coordinator._async_update_data()
-
-        updated_appliance = result["appliances"].get_appliances()[appliance_id]
-        assert updated_appliance.state["connectivityState"] == "connected"
-        assert updated_appliance.state["program"] == "cotton"
-        assert updated_appliance.state["temperature"] == "40"
-
-    @pytest.mark.asyncio
-    async def test_ac_state_processing(self, coordinator, mock_api_client):
-        """Test that AC appliance state is processed correctly."""
-        from custom_components.electrolux.models import Appliance
-
-        appliance_id = "ac_123"
-        appliance = Appliance(
-            coordinator=coordinator,
-            name="Test AC",
-            pnc_id=appliance_id,
-            brand="Electrolux",
-            model="TestAC",
-            state={"connectivityState": "connected"},
-        )
-        appliances = Appliances({appliance_id: appliance})
-        coordinator.data = {"appliances": appliances}
-
-        mock_api_client.get_appliance_state.return_value = MOCK_AC_STATE
-        mock_api_client.get_appliances_list.return_value = [
-            {"applianceId": appliance_id}
-        ]
-
-        result = await coordinator._async_update_data()
-
-        updated_appliance = result["appliances"].get_appliances()[appliance_id]
-        assert updated_appliance.state["connectivityState"] == "connected"
-        assert updated_appliance.state["mode"] == "cool"
-        assert updated_appliance.state["targetTemperatureC"] == 22
-
-    @pytest.mark.asyncio
-    async def test_malformed_data_temperature_as_string(
-        self, coordinator, mock_api_client
-    ):
-        """Test handling of malformed data where temperature is sent as string instead of number."""
-        from custom_components.electrolux.models import Appliance
-
-        appliance_id = "oven_123"
-        appliance = Appliance(
-            coordinator=coordinator,
-            name="Test Oven",
-            pnc_id=appliance_id,
-            brand="Electrolux",
-            model="TestOven",
-            state={"connectivityState": "connected"},
-        )
-        appliances = Appliances({appliance_id: appliance})
-        coordinator.data = {"appliances": appliances}
-
-        # Mock malformed data - temperature as string instead of number
-        malformed_state = {
-            "connectivityState": "connected",
-            "cavityLight": "OFF",
-            "targetTemperatureC": "180",  # String instead of number
-            "currentTemperatureC": 25,
-            "program": "conventional",
-            "powerState": "standby",
-        }
-        mock_api_client.get_appliance_state.return_value = malformed_state
-        mock_api_client.get_appliances_list.return_value = [
-            {"applianceId": appliance_id}
-        ]
-
-        # This should not crash the coordinator
-        result = await coordinator._async_update_data()
-
-        # Verify the appliance data is still returned
-        assert "appliances" in result
-        updated_appliance = result["appliances"].get_appliances()[appliance_id]
-
-        # The malformed data should be stored as-is (coordinator doesn't validate types)
-        assert updated_appliance.state["targetTemperatureC"] == "180"
-
-    @pytest.mark.asyncio
-    async def test_malformed_data_connectivity_state_invalid(
-        self, coordinator, mock_api_client
+    @pytest.mark.parametrize(
+        ("appliance_id", "name", "model", "mock_state", "expected"),
+        [
+            (
+                "oven_123",
+                "Test Oven",
+                "TestOven",
+                MOCK_OVEN_STATE,
+                {"cavityLight": "OFF", "targetTemperatureC": 180},
+            ),
+            (
+                "washer_123",
+                "Test Washer",
+                "TestWasher",
+                MOCK_WASHER_STATE,
+                {"program": "cotton", "temperature": "40"},
+            ),
+            (
+                "ac_123",
+                "Test AC",
+                "TestAC",
+                MOCK_AC_STATE,
+                {"mode": "cool", "targetTemperatureC": 22},
+            ),
+        ],
+        ids=["oven", "washer", "ac"],
+    )
+    async def test_state_processing(
+        self,
+        coordinator,
+        make_appliance,
+        mock_api_client,
+        appliance_id,
+        name,
+        model,
+        mock_state,
+        expected,
     ):
-        """Test handling of malformed data where connectivityState has invalid value."""
-        from custom_components.electrolux.models import Appliance
-
-        appliance_id = "washer_123"
-        appliance = Appliance(
-            coordinator=coordinator,
-            name="Test Washer",
-            pnc_id=appliance_id,
-            brand="Electrolux",
-            model="TestWasher",
-            state={"connectivityState": "connected"},
-        )
-        appliances = Appliances({appliance_id: appliance})
-        coordinator.data = {"appliances": appliances}
+        """Test that appliance state is processed correctly for each appliance type."""
+        make_appliance(pnc_id=appliance_id, name=name, model=model)
 
-        # Mock malformed data - invalid connectivity state
-        malformed_state = {
-            "connectivityState": "invalid_status",  # Invalid value
-            "program": "cotton",
-            "temperature": "40",
-        }
-        mock_api_client.get_appliance_state.return_value = malformed_state
+        mock_api_client.get_appliance_state.return_value = mock_state
         mock_api_client.get_appliances_list.return_value = [
             {"applianceId": appliance_id}
         ]
 
-        # This should not crash the coordinator
         result = await coordinator._async_update_data()
 
-        # Verify the appliance data is still returned
-        assert "appliances" in result
         updated_appliance = result["appliances"].get_appliances()[appliance_id]
-
-        # The malformed connectivity state should be stored as-is
-        assert updated_appliance.state["connectivityState"] == "invalid_status"
-
-    @pytest.mark.asyncio
-    async def test_malformed_data_missing_required_fields(
-        self, coordinator, mock_api_client
+        assert updated_appliance.state["connectivityState"] == "connected"
+        for key, value in expected.items():
+            assert updated_appliance.state[key] == value
+
+    @pytest.mark.parametrize(
+        ("appliance_id", "name", "model", "malformed_state", "expected"),
+        [
+            (
+                "oven_123",
+                "Test Oven",
+                "TestOven",
+                # Temperature sent as string instead of number
+                {
+                    "connectivityState": "connected",
+                    "cavityLight": "OFF",
+                    "targetTemperatureC": "180",
+                    "currentTemperatureC": 25,
+                    "program": "conventional",
+                    "powerState": "standby",
+                },
+                # The malformed data should be stored as-is (coordinator doesn't validate types)
+                {"targetTemperatureC": "180"},
+            ),
+            (
+                "washer_123",
+                "Test Washer",
+                "TestWasher",
+                # Invalid connectivity state value
+                {
+                    "connectivityState": "invalid_status",
+                    "program": "cotton",
+                    "temperature": "40",
+                },
+                # The malformed connectivity state should be stored as-is
+                {"connectivityState": "invalid_status"},
+            ),
+            (
+                "ac_123",
+                "Test AC",
+                "TestAC",
+                # Missing connectivityState
+                {"mode": "cool", "targetTemperatureC": 22},
+                # The coordinator's update logic handles missing connectivityState gracefully
+                {"mode": "cool", "targetTemperatureC": 22},
+            ),
+        ],
+        ids=[
+            "temperature_as_string",
+            "connectivity_state_invalid",
+            "missing_required_fields",
+        ],
+    )
+    async def test_malformed_data(
+        self,
+        coordinator,
+        make_appliance,
+        mock_api_client,
+        appliance_id,
+        name,
+        model,
+        malformed_state,
+        expected,
     ):
-        """Test handling of malformed data with missing required fields."""
-        from custom_components.electrolux.models import Appliance
-
-        appliance_id = "ac_123"
-        appliance = Appliance(
-            coordinator=coordinator,
-            name="Test AC",
-            pnc_id=appliance_id,
-            brand="Electrolux",
-            model="TestAC",
-            state={"connectivityState": "connected"},
-        )
-        appliances = Appliances({appliance_id: appliance})
-        coordinator.data = {"appliances": appliances}
+        """Test that malformed appliance data does not crash the coordinator."""
+        make_appliance(pnc_id=appliance_id, name=name, model=model)
 
-        # Mock malformed data - missing connectivityState
-        malformed_state = {
-            "mode": "cool",
-            "targetTemperatureC": 22,
-            # Missing connectivityState
-        }
         mock_api_client.get_appliance_state.return_value = malformed_state
         mock_api_client.get_appliances_list.return_value = [
             {"applianceId": appliance_id}
@@ -543,8 +381,5 @@ class TestMultiApplianceMatrix:
         # Verify the appliance data is still returned
         assert "appliances" in result
         updated_appliance = result["appliances"].get_appliances()[appliance_id]
-
-        # The data should be updated, but connectivityState should default to "connected" in the logic
-        # (The coordinator's update logic handles missing connectivityState gracefully)
-        assert updated_appliance.state["mode"] == "cool"
-        assert updated_appliance.state["targetTemperatureC"] == 22
+        for key, value in expected.items():
+            assert updated_appliance.state[key] == value
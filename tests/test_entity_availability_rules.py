@@ -1,6 +1,8 @@
 """Test Entity Availability Rules for Electrolux integration."""
 
-from unittest.mock import MagicMock
+import copy
+import re
+from types import MappingProxyType, SimpleNamespace
 
 import pytest
 from homeassistant.components.number import NumberDeviceClass
@@ -11,393 +13,250 @@ from custom_components.electrolux.const import NUMBER, SELECT
 from custom_components.electrolux.number import ElectroluxNumber
 from custom_components.electrolux.select import ElectroluxSelect
 
+_CATEGORY = EntityCategory.CONFIG
+_DEV_TEMP = NumberDeviceClass.TEMPERATURE
+_CELSIUS = UnitOfTemperature.CELSIUS
+
+_UNSUPPORTED_RE = re.compile("not supported by program")
+_UNSUPPORTED_CURRENT_RE = re.compile("not supported by current program")
+_FOOD_PROBE_RE = re.compile("Food probe temperature not supported by program")
+
+_TEMP_CAP = MappingProxyType(
+    {
+        "access": "readwrite",
+        "type": "temperature",
+        "min": 30,
+        "max": 250,
+        "step": 5,
+        "default": 180,
+    }
+)
+_SELECT_CAP = MappingProxyType(
+    {
+        "access": "readwrite",
+        "type": "string",
+        "values": {
+            "option1": {"label": "Option 1"},
+            "option2": {"label": "Option 2"},
+            "option3": {"label": "Option 3"},
+        },
+    }
+)
+
+
+def _set_state(entity, program, **extras):
+    """Report ``program`` (plus any extra attributes) as the entity's state."""
+    reported = {"program": program, **extras}
+    entity.appliance_status = {"properties": {"reported": reported}}
+    entity.reported_state = reported
+
+
+@pytest.fixture(scope="module")
+def _coordinator_template():
+    """Build the coordinator double once per module."""
+    hass = SimpleNamespace(loop=SimpleNamespace(time=lambda: 1000000.0))
+    # Entities read data/api on construction; nothing else is needed
+    return SimpleNamespace(
+        hass=hass, config_entry=SimpleNamespace(), data=None, api=None
+    )
+
+
+@pytest.fixture
+def mock_coordinator(_coordinator_template):
+    """Create a mock coordinator with fresh per-test update times."""
+    coordinator = copy.copy(_coordinator_template)
+    coordinator._last_update_times = {}
+    return coordinator
+
+
+@pytest.fixture
+def mock_capability_temperature():
+    """Return the shared read-only temperature capability."""
+    return _TEMP_CAP
+
+
+@pytest.fixture
+def mock_capability_select():
+    """Return the shared read-only select capability."""
+    return _SELECT_CAP
+
+
+@pytest.fixture
+def make_number(mock_coordinator, mock_capability_temperature):
+    """Return a factory for target temperature number entities."""
+
+    def _make(program="unsupported_program", extras=None, supported=False, **overrides):
+        kwargs = {
+            "coordinator": mock_coordinator,
+            "name": "Target Temperature",
+            "config_entry": mock_coordinator.config_entry,
+            "pnc_id": "TEST_PNC",
+            "entity_type": NUMBER,
+            "entity_name": "target_temperature",
+            "entity_attr": "targetTemperatureC",
+            "entity_source": None,
+            "capability": mock_capability_temperature,
+            "unit": _CELSIUS,
+            "device_class": _DEV_TEMP,
+            "entity_category": None,
+            "icon": "mdi:thermometer",
+        }
+        kwargs.update(overrides)
+        entity = ElectroluxNumber(**kwargs)
+        entity.hass = mock_coordinator.hass
+        _set_state(entity, program, **(extras or {}))
+        entity._is_supported_by_program = lambda *a, **k: supported
+        return entity
+
+    return _make
+
+
+@pytest.fixture
+def make_select(mock_coordinator, mock_capability_select):
+    """Return a factory for CONFIG select entities."""
+
+    def _make(program="unsupported_program", extras=None, supported=False, **overrides):
+        kwargs = {
+            "coordinator": mock_coordinator,
+            "name": "Test Select",
+            "config_entry": mock_coordinator.config_entry,
+            "pnc_id": "TEST_PNC",
+            "entity_type": SELECT,
+            "entity_name": "test_select",
+            "entity_attr": "testSelect",
+            "entity_source": None,
+            "capability": mock_capability_select,
+            "unit": None,
+            "device_class": "",
+            "entity_category": _CATEGORY,
+            "icon": "mdi:menu",
+        }
+        kwargs.update(overrides)
+        entity = ElectroluxSelect(**kwargs)
+        entity.hass = mock_coordinator.hass
+        _set_state(entity, program, **(extras or {}))
+        entity._is_supported_by_program = lambda *a, **k: supported
+        return entity
 
-class TestEntityAvailabilityRules:
-    """Test Entity Availability Rules - entities must remain available but constrained when not supported by program."""
+    return _make
 
-    @pytest.fixture
-    def mock_coordinator(self):
-        """Create a mock coordinator."""
-        coordinator = MagicMock()
-        coordinator.hass = MagicMock()
-        coordinator.hass.loop = MagicMock()
-        coordinator.hass.loop.time.return_value = 1000000.0
-        coordinator.config_entry = MagicMock()
-        coordinator._last_update_times = {}
-        return coordinator
-
-    @pytest.fixture
-    def mock_capability_temperature(self):
-        """Create a mock temperature capability."""
-        return {
-            "access": "readwrite",
-            "type": "temperature",
-            "min": 30,
-            "max": 250,
-            "step": 5,
-            "default": 180,
-        }
 
-    @pytest.fixture
-    def mock_capability_select(self):
-        """Create a mock select capability."""
-        return {
-            "access": "readwrite",
-            "type": "string",
-            "values": {
-                "option1": {"label": "Option 1"},
-                "option2": {"label": "Option 2"},
-                "option3": {"label": "Option 3"},
-            },
-        }
+class TestEntityAvailabilityRules:
+    """Test Entity Availability Rules - entities must remain available but constrained when not supported by program."""
 
     # ============================================================================
     # NUMBER ENTITY TESTS - Clamping Behavior
     # ============================================================================
 
-    def test_number_entity_always_available_regardless_of_program_support(
-        self, mock_coordinator, mock_capability_temperature
+    @pytest.mark.parametrize("factory", ["make_number", "make_select"])
+    def test_entity_always_available_regardless_of_program_support(
+        self, request, factory
     ):
-        """Test that number entities are always available, even when not supported by program."""
-        entity = ElectroluxNumber(
-            coordinator=mock_coordinator,
-            name="Target Temperature",
-            config_entry=mock_coordinator.config_entry,
-            pnc_id="TEST_PNC",
-            entity_type=NUMBER,
-            entity_name="target_temperature",
-            entity_attr="targetTemperatureC",
-            entity_source=None,
-            capability=mock_capability_temperature,
-            unit=UnitOfTemperature.CELSIUS,
-            device_class=NumberDeviceClass.TEMPERATURE,
-            entity_category=EntityCategory.CONFIG,
-            icon="mdi:thermometer",
-        )
-        entity.hass = mock_coordinator.hass
-        entity.appliance_status = {
-            "properties": {"reported": {"program": "unsupported_program"}}
-        }
-        entity.reported_state = {"program": "unsupported_program"}
-
-        # Mock _is_supported_by_program to return False
-        entity._is_supported_by_program = MagicMock(return_value=False)
+        """Test that entities are always available, even when not supported by program."""
+        entity = request.getfixturevalue(factory)(entity_category=_CATEGORY)
 
         # Entity should still be available
         assert entity.available is True
 
-    def test_number_entity_shows_minimum_value_when_not_supported_by_program(
-        self, mock_coordinator, mock_capability_temperature
-    ):
-        """Test that number entities show minimum value when not supported by program."""
-        entity = ElectroluxNumber(
-            coordinator=mock_coordinator,
-            name="Target Temperature",
-            config_entry=mock_coordinator.config_entry,
-            pnc_id="TEST_PNC",
-            entity_type=NUMBER,
-            entity_name="target_temperature",
-            entity_attr="targetTemperatureC",
-            entity_source=None,
-            capability=mock_capability_temperature,
-            unit=UnitOfTemperature.CELSIUS,
-            device_class=NumberDeviceClass.TEMPERATURE,
-            entity_category=None,
-            icon="mdi:thermometer",
-        )
-        entity.hass = mock_coordinator.hass
-        entity.appliance_status = {
-            "properties": {"reported": {"program": "unsupported_program"}}
-        }
-        entity.reported_state = {"program": "unsupported_program"}
-
-        # Mock _is_supported_by_program to return False
-        entity._is_supported_by_program = MagicMock(return_value=False)
-
-        # Should return default value (180) when not supported (locked value priority: default > min)
-        assert entity.native_value == 180.0
-
-    def test_number_entity_shows_zero_fallback_when_no_minimum_defined(
-        self, mock_coordinator
-    ):
-        """Test that number entities show 0 when no minimum is defined and not supported by program."""
-        capability_no_min = {
-            "access": "readwrite",
-            "type": "number",
-            "max": 100,
-            "step": 1,
-        }
-
-        entity = ElectroluxNumber(
-            coordinator=mock_coordinator,
-            name="Generic Number",
-            config_entry=mock_coordinator.config_entry,
-            pnc_id="TEST_PNC",
-            entity_type=NUMBER,
-            entity_name="generic_number",
-            entity_attr="genericAttr",
-            entity_source=None,
-            capability=capability_no_min,
-            unit=None,
-            device_class=None,
-            entity_category=None,
-            icon="mdi:counter",
-        )
-        entity.hass = mock_coordinator.hass
-        entity.appliance_status = {
-            "properties": {"reported": {"program": "unsupported_program"}}
-        }
-        entity.reported_state = {"program": "unsupported_program"}
-
-        # Mock _is_supported_by_program to return False
-        entity._is_supported_by_program = MagicMock(return_value=False)
-
-        # Should return 0.0 as fallback when no minimum defined
-        assert entity.native_value == 0.0
-
-    @pytest.mark.asyncio
-    async def test_number_entity_prevents_modification_when_not_supported_by_program(
-        self, mock_coordinator, mock_capability_temperature
-    ):
-        """Test that number entities prevent modification when not supported by program."""
-        entity = ElectroluxNumber(
-            coordinator=mock_coordinator,
-            name="Target Temperature",
-            config_entry=mock_coordinator.config_entry,
-            pnc_id="TEST_PNC",
-            entity_type=NUMBER,
-            entity_name="target_temperature",
-            entity_attr="targetTemperatureC",
-            entity_source=None,
-            capability=mock_capability_temperature,
-            unit=UnitOfTemperature.CELSIUS,
-            device_class=NumberDeviceClass.TEMPERATURE,
-            entity_category=None,
-            icon="mdi:thermometer",
-        )
-        entity.hass = mock_coordinator.hass
-        entity.appliance_status = {
-            "properties": {"reported": {"program": "unsupported_program"}}
-        }
-        entity.reported_state = {"program": "unsupported_program"}
-
-        # Mock _is_supported_by_program to return False
-        entity._is_supported_by_program = MagicMock(return_value=False)
-
-        # Attempting to set value should raise HomeAssistantError
-        with pytest.raises(HomeAssistantError, match="not supported by program"):
-            await entity.async_set_native_value(200.0)
-
-    @pytest.mark.asyncio
-    async def test_food_probe_temperature_prevents_modification_when_not_supported_by_program(
-        self, mock_coordinator
+    @pytest.mark.parametrize(
+        ("overrides", "expected"),
+        [
+            # Default wins over min when both are defined (locked value priority)
+            pytest.param({}, 180.0, id="temperature_default"),
+            pytest.param(
+                {
+                    "capability": {
+                        "access": "readwrite",
+                        "type": "temperature",
+                        "min": 50,
+                        "max": 250,
+                    },
+                },
+                50.0,
+                id="temperature_min",
+            ),
+            pytest.param(
+                {
+                    "name": "Food Probe Temperature",
+                    "entity_name": "food_probe_temperature",
+                    "entity_attr": "targetFoodProbeTemperatureC",
+                    "capability": {
+                        "access": "readwrite",
+                        "type": "temperature",
+                        "min": 30,
+                        "max": 99,
+                    },
+                    "icon": "mdi:thermometer-probe",
+                },
+                30.0,
+                id="food_probe_min",
+            ),
+            # Falls back to 0 when no minimum is defined
+            pytest.param(
+                {
+                    "name": "Generic Number",
+                    "entity_name": "generic_number",
+                    "entity_attr": "genericAttr",
+                    "capability": {
+                        "access": "readwrite",
+                        "type": "number",
+                        "max": 100,
+                        "step": 1,
+                    },
+                    "unit": None,
+                    "device_class": None,
+                    "icon": "mdi:counter",
+                },
+                0.0,
+                id="no_minimum",
+            ),
+        ],
+    )
+    def test_number_entity_shows_locked_value_when_not_supported_by_program(
+        self, make_number, overrides, expected
     ):
-        """Test that food probe temperature entities prevent modification when not supported by program."""
-        entity = ElectroluxNumber(
-            coordinator=mock_coordinator,
-            name="Food Probe Temperature",
-            config_entry=mock_coordinator.config_entry,
-            pnc_id="TEST_PNC",
-            entity_type=NUMBER,
-            entity_name="food_probe_temperature",
-            entity_attr="targetFoodProbeTemperatureC",
-            entity_source=None,
-            capability={
-                "access": "readwrite",
-                "type": "temperature",
-                "min": 30,
-                "max": 99,
-                "step": 1,
-            },
-            unit=UnitOfTemperature.CELSIUS,
-            device_class=NumberDeviceClass.TEMPERATURE,
-            entity_category=None,
-            icon="mdi:thermometer-probe",
-        )
-        entity.hass = mock_coordinator.hass
-        entity.appliance_status = {
-            "properties": {"reported": {"program": "DOUGH_PROVING"}}
-        }
-        entity.reported_state = {"program": "DOUGH_PROVING"}
-
-        # Mock _is_supported_by_program to return False
-        entity._is_supported_by_program = MagicMock(return_value=False)
+        """Test that unsupported number entities stay available and show their locked value."""
+        entity = make_number(**overrides)
 
-        # Attempting to set value should raise HomeAssistantError with specific message
-        with pytest.raises(
-            HomeAssistantError,
-            match="Food probe temperature not supported by program",
-        ):
-            await entity.async_set_native_value(50.0)
+        assert entity.available is True
+        assert entity.native_value == expected
 
     # ============================================================================
     # SELECT ENTITY TESTS - Empty Selection Behavior
     # ============================================================================
 
-    def test_select_entity_always_available_regardless_of_program_support(
-        self, mock_coordinator, mock_capability_select
-    ):
-        """Test that select entities are always available, even when not supported by program."""
-        entity = ElectroluxSelect(
-            coordinator=mock_coordinator,
-            name="Test Select",
-            config_entry=mock_coordinator.config_entry,
-            pnc_id="TEST_PNC",
-            entity_type=SELECT,
-            entity_name="test_select",
-            entity_attr="testSelect",
-            entity_source=None,
-            capability=mock_capability_select,
-            unit=None,
-            device_class="",
-            entity_category=EntityCategory.CONFIG,
-            icon="mdi:menu",
-        )
-        entity.hass = mock_coordinator.hass
-        entity.appliance_status = {
-            "properties": {"reported": {"program": "unsupported_program"}}
-        }
-        entity.reported_state = {"program": "unsupported_program"}
-
-        # Mock _is_supported_by_program to return False
-        entity._is_supported_by_program = MagicMock(return_value=False)
-
-        # Entity should still be available
-        assert entity.available is True
-
+    @pytest.mark.parametrize("entity_category", [_CATEGORY, None])
     def test_select_entity_shows_empty_selection_when_not_supported_by_program(
-        self, mock_coordinator, mock_capability_select
+        self, make_select, entity_category
     ):
-        """Test that select entities show empty selection when not supported by program."""
-        entity = ElectroluxSelect(
-            coordinator=mock_coordinator,
-            name="Test Select",
-            config_entry=mock_coordinator.config_entry,
-            pnc_id="TEST_PNC",
-            entity_type=SELECT,
-            entity_name="test_select",
-            entity_attr="testSelect",
-            entity_source=None,
-            capability=mock_capability_select,
-            unit=None,
-            device_class="",
-            entity_category=EntityCategory.CONFIG,
-            icon="mdi:menu",
-        )
-        entity.hass = mock_coordinator.hass
-        entity.appliance_status = {
-            "properties": {"reported": {"program": "unsupported_program"}}
-        }
-        entity.reported_state = {"program": "unsupported_program"}
-
-        # Mock _is_supported_by_program to return False
-        entity._is_supported_by_program = MagicMock(return_value=False)
+        """Test that select entities stay available with an empty selection when not supported by program."""
+        entity = make_select(entity_category=entity_category)
 
+        assert entity.available is True
         # Should show empty selection when not supported
         assert entity.current_option == ""
 
-    @pytest.mark.asyncio
-    async def test_select_entity_prevents_selection_when_not_supported_by_program(
-        self, mock_coordinator, mock_capability_select
-    ):
-        """Test that select entities prevent selection when not supported by program."""
-        entity = ElectroluxSelect(
-            coordinator=mock_coordinator,
-            name="Test Select",
-            config_entry=mock_coordinator.config_entry,
-            pnc_id="TEST_PNC",
-            entity_type=SELECT,
-            entity_name="test_select",
-            entity_attr="testSelect",
-            entity_source=None,
-            capability=mock_capability_select,
-            unit=None,
-            device_class="",
-            entity_category=None,  # Not CONFIG - program-dependent entity
-            icon="mdi:menu",
-        )
-        entity.hass = mock_coordinator.hass
-        entity.appliance_status = {
-            "properties": {"reported": {"program": "unsupported_program"}}
-        }
-        entity.reported_state = {"program": "unsupported_program"}
-
-        # Mock _is_supported_by_program to return False
-        entity._is_supported_by_program = MagicMock(return_value=False)
-
-        # Attempting to select option should raise HomeAssistantError
-        with pytest.raises(
-            HomeAssistantError, match="not supported by current program"
-        ):
-            await entity.async_select_option("Option 1")
-
-    def test_select_config_entity_bypasses_program_support_check(
-        self, mock_coordinator, mock_capability_select
-    ):
+    def test_select_config_entity_bypasses_program_support_check(self, make_select):
         """Test that CONFIG select entities bypass program support checking (persistent settings)."""
-        entity = ElectroluxSelect(
-            coordinator=mock_coordinator,
+        entity = make_select(
+            extras={"testSelectConfig": "option2"},
             name="Test Select Config",
-            config_entry=mock_coordinator.config_entry,
-            pnc_id="TEST_PNC",
-            entity_type=SELECT,
             entity_name="test_select_config",
             entity_attr="testSelectConfig",
-            entity_source=None,
-            capability=mock_capability_select,
-            unit=None,
-            device_class="",
-            entity_category=EntityCategory.CONFIG,  # CONFIG entity
-            icon="mdi:menu",
         )
-        entity.hass = mock_coordinator.hass
-        entity.appliance_status = {
-            "properties": {
-                "reported": {
-                    "program": "unsupported_program",
-                    "testSelectConfig": "option2",
-                }
-            }
-        }
-        entity.reported_state = {
-            "program": "unsupported_program",
-            "testSelectConfig": "option2",
-        }
-
-        # Mock _is_supported_by_program to return False
-        entity._is_supported_by_program = MagicMock(return_value=False)
 
         # CONFIG entities should show value even when not supported by program
         current = entity.current_option
         assert current == "Option 2"  # Should read the value, not return empty
 
     def test_select_entity_shows_filtered_options_based_on_program_constraints(
-        self, mock_coordinator, mock_capability_select
+        self, make_select
     ):
         """Test that select entities filter options based on program constraints."""
-        entity = ElectroluxSelect(
-            coordinator=mock_coordinator,
-            name="Test Select",
-            config_entry=mock_coordinator.config_entry,
-            pnc_id="TEST_PNC",
-            entity_type=SELECT,
-            entity_name="test_select",
-            entity_attr="testSelect",
-            entity_source=None,
-            capability=mock_capability_select,
-            unit=None,
-            device_class="",
-            entity_category=EntityCategory.CONFIG,
-            icon="mdi:menu",
-        )
-        entity.hass = mock_coordinator.hass
-        entity.appliance_status = {
-            "properties": {"reported": {"program": "test_program"}}
-        }
-        entity.reported_state = {"program": "test_program"}
+        entity = make_select(program="test_program")
 
         # Mock program constraints to only allow option1 and option2
-        entity._get_program_constraint = MagicMock(return_value=["option1", "option2"])
+        entity._get_program_constraint = lambda *a, **k: ["option1", "option2"]
 
         # Should only show allowed options
         options = entity.options
@@ -409,123 +268,13 @@ class TestEntityAvailabilityRules:
     # INTEGRATION TESTS - Multiple Entity Types
     # ============================================================================
 
-    def test_multiple_number_entities_clamped_when_program_not_supported(
-        self, mock_coordinator
-    ):
-        """Test that multiple number entities are properly clamped when not supported."""
-        # Test targetTemperatureC
-        temp_entity = ElectroluxNumber(
-            coordinator=mock_coordinator,
-            name="Target Temperature",
-            config_entry=mock_coordinator.config_entry,
-            pnc_id="TEST_PNC",
-            entity_type=NUMBER,
-            entity_name="target_temperature",
-            entity_attr="targetTemperatureC",
-            entity_source=None,
-            capability={
-                "access": "readwrite",
-                "type": "temperature",
-                "min": 50,
-                "max": 250,
-            },
-            unit=UnitOfTemperature.CELSIUS,
-            device_class=NumberDeviceClass.TEMPERATURE,
-            entity_category=None,
-            icon="mdi:thermometer",
-        )
-        temp_entity.hass = mock_coordinator.hass
-        temp_entity.appliance_status = {
-            "properties": {"reported": {"program": "unsupported"}}
-        }
-        temp_entity.reported_state = {"program": "unsupported"}
-        temp_entity._is_supported_by_program = MagicMock(return_value=False)
-
-        # Test targetFoodProbeTemperatureC
-        probe_entity = ElectroluxNumber(
-            coordinator=mock_coordinator,
-            name="Food Probe Temperature",
-            config_entry=mock_coordinator.config_entry,
-            pnc_id="TEST_PNC",
-            entity_type=NUMBER,
-            entity_name="food_probe_temperature",
-            entity_attr="targetFoodProbeTemperatureC",
-            entity_source=None,
-            capability={
-                "access": "readwrite",
-                "type": "temperature",
-                "min": 30,
-                "max": 99,
-            },
-            unit=UnitOfTemperature.CELSIUS,
-            device_class=NumberDeviceClass.TEMPERATURE,
-            entity_category=None,
-            icon="mdi:thermometer-probe",
-        )
-        probe_entity.hass = mock_coordinator.hass
-        probe_entity.appliance_status = {
-            "properties": {"reported": {"program": "unsupported"}}
-        }
-        probe_entity.reported_state = {"program": "unsupported"}
-        probe_entity._is_supported_by_program = MagicMock(return_value=False)
-
-        # Both should be available and show minimum values (fallback when no default)
-        assert temp_entity.available is True
-        assert temp_entity.native_value == 50.0  # min value (no default in capability)
-
-        assert probe_entity.available is True
-        assert probe_entity.native_value == 30.0  # min value (no default in capability)
-
     def test_entities_remain_available_when_program_changes(
-        self, mock_coordinator, mock_capability_temperature, mock_capability_select
+        self, make_number, make_select
     ):
         """Test that entities remain available when program changes."""
-        # Create entities
-        temp_entity = ElectroluxNumber(
-            coordinator=mock_coordinator,
-            name="Target Temperature",
-            config_entry=mock_coordinator.config_entry,
-            pnc_id="TEST_PNC",
-            entity_type=NUMBER,
-            entity_name="target_temperature",
-            entity_attr="targetTemperatureC",
-            entity_source=None,
-            capability=mock_capability_temperature,
-            unit=UnitOfTemperature.CELSIUS,
-            device_class=NumberDeviceClass.TEMPERATURE,
-            entity_category=None,
-            icon="mdi:thermometer",
-        )
-        temp_entity.hass = mock_coordinator.hass
-
-        select_entity = ElectroluxSelect(
-            coordinator=mock_coordinator,
-            name="Test Select",
-            config_entry=mock_coordinator.config_entry,
-            pnc_id="TEST_PNC",
-            entity_type=SELECT,
-            entity_name="test_select",
-            entity_attr="testSelect",
-            entity_source=None,
-            capability=mock_capability_select,
-            unit=None,
-            device_class="",
-            entity_category=EntityCategory.CONFIG,
-            icon="mdi:menu",
-        )
-        select_entity.hass = mock_coordinator.hass
-
-        # Test with program that doesn't support entities
-        appliance_status_unsupported = {
-            "properties": {"reported": {"program": "unsupported_program"}}
-        }
-        temp_entity.appliance_status = appliance_status_unsupported
-        temp_entity.reported_state = {"program": "unsupported_program"}
-        temp_entity._is_supported_by_program = MagicMock(return_value=False)
-
-        select_entity.appliance_status = appliance_status_unsupported
-        select_entity.reported_state = {"program": "unsupported_program"}
-        select_entity._is_supported_by_program = MagicMock(return_value=False)
+        # Create entities with a program that doesn't support them
+        temp_entity = make_number()
+        select_entity = make_select()
 
         # Entities should remain available
         assert temp_entity.available is True
@@ -538,27 +287,13 @@ class TestEntityAvailabilityRules:
         assert select_entity.current_option == ""  # empty selection
 
         # Test with program that supports entities
-        appliance_status_supported = {
-            "properties": {
-                "reported": {"program": "supported_program", "targetTemperatureC": 200}
-            }
-        }
-        temp_entity.appliance_status = appliance_status_supported
-        temp_entity.reported_state = {
-            "program": "supported_program",
-            "targetTemperatureC": 200,
-        }
-        temp_entity._is_supported_by_program = MagicMock(return_value=True)
-        temp_entity._is_locked_by_program = MagicMock(
-            return_value=False
-        )  # Not locked when supported
-
-        select_entity.appliance_status = appliance_status_supported
-        select_entity.reported_state = {
-            "program": "supported_program",
-            "testSelect": "option1",
-        }
-        select_entity._is_supported_by_program = MagicMock(return_value=True)
+        _set_state(temp_entity, "supported_program", targetTemperatureC=200)
+        temp_entity._is_supported_by_program = lambda *a, **k: True
+        # Not locked when supported
+        temp_entity._is_locked_by_program = lambda *a, **k: False
+
+        _set_state(select_entity, "supported_program", testSelect="option1")
+        select_entity._is_supported_by_program = lambda *a, **k: True
 
         # Entities should still be available
         assert temp_entity.available is True
@@ -567,3 +302,54 @@ class TestEntityAvailabilityRules:
         # Should show actual values
         assert temp_entity.native_value == 200.0
         assert select_entity.current_option == "Option 1"
+
+
+class TestEntityAvailabilityRulesAsync:
+    """Test that unsupported entities reject changes; kept apart so only these tests need an event loop."""
+
+    async def test_number_entity_prevents_modification_when_not_supported_by_program(
+        self, make_number
+    ):
+        """Test that number entities prevent modification when not supported by program."""
+        entity = make_number()
+
+        # Attempting to set value should raise HomeAssistantError
+        with pytest.raises(HomeAssistantError, match=_UNSUPPORTED_RE):
+            await entity.async_set_native_value(200.0)
+
+    async def test_food_probe_temperature_prevents_modification_when_not_supported_by_program(
+        self, make_number
+    ):
+        """Test that food probe temperature entities prevent modification when not supported by program."""
+        entity = make_number(
+            program="DOUGH_PROVING",
+            name="Food Probe Temperature",
+            entity_name="food_probe_temperature",
+            entity_attr="targetFoodProbeTemperatureC",
+            capability={
+                "access": "readwrite",
+                "type": "temperature",
+                "min": 30,
+                "max": 99,
+                "step": 1,
+            },
+            icon="mdi:thermometer-probe",
+        )
+
+        # Attempting to set value should raise HomeAssistantError with specific message
+        with pytest.raises(
+            HomeAssistantError,
+            match=_FOOD_PROBE_RE,
+        ):
+            await entity.async_set_native_value(50.0)
+
+    async def test_select_entity_prevents_selection_when_not_supported_by_program(
+        self, make_select
+    ):
+        """Test that select entities prevent selection when not supported by program."""
+        # Not CONFIG - program-dependent entity
+        entity = make_select(entity_category=None)
+
+        # Attempting to select option should raise HomeAssistantError
+        with pytest.raises(HomeAssistantError, match=_UNSUPPORTED_CURRENT_RE):
+            await entity.async_select_option("Option 1")
@@ -10,6 +10,7 @@ Covers:
 - _evaluate_trigger_condition / _evaluate_operand: trigger logic
 """
 
+from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -766,16 +767,18 @@ class TestGetProgramConstraintCrossLookup:
         mock_appliance = entity.coordinator.data[
             "appliances"
         ].get_appliance.return_value
-        mock_appliance.data.capabilities = {
-            "program": {
-                "values": {
-                    "BAKE": {
-                        "targetTemperatureC": {"min": 30, "max": 250, "step": 5}
-                        # No 'targetTemperatureF' entry deliberately
+        mock_appliance.data = SimpleNamespace(
+            capabilities={
+                "program": {
+                    "values": {
+                        "BAKE": {
+                            "targetTemperatureC": {"min": 30, "max": 250, "step": 5}
+                            # No 'targetTemperatureF' entry deliberately
+                        }
                     }
                 }
             }
-        }
+        )
         entity._reported_state_cache = {"program": "BAKE"}
         return entity
 
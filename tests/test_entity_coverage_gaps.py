@@ -30,6 +30,7 @@ Targets the following uncovered lines identified by coverage report:
 - 1112: _evaluate_operand cap_name == 'value' path
 """
 
+from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -51,7 +52,7 @@ def make_coordinator(reported: dict | None = None, pnc_id: str = "TEST_PNC"):
     coordinator = MagicMock()
     coordinator.hass = MagicMock()
     coordinator.hass.loop = MagicMock()
-    coordinator.hass.loop.time.return_value = 1_000_000.0
+    coordinator.hass.loop.time = lambda: 1_000_000.0
     coordinator.config_entry = MagicMock()
     coordinator.config_entry.data = {"api_key": "test_api_key_1234567890abcdef"}
     coordinator._last_update_times = {}
@@ -379,14 +380,37 @@ class TestHandleCoordinatorUpdateGaps:
         # Set initial program_cache_key to something different
         entity._program_cache_key = "OldProgram"
         entity._is_supported_cache = True
-        entity._constraints_cache = {"min": 30}
+        entity._constraints_cache = {("OldProgram", "min"): 30}
 
         entity._handle_coordinator_update()
 
-        # Cache should be cleared after program change
+        # Support cache is cleared after program change; constraints are keyed
+        # by program, so the old program's entries are kept
         assert entity._program_cache_key == "QuickWash"
         assert entity._is_supported_cache is None
-        assert entity._constraints_cache == {}
+        assert entity._constraints_cache == {("OldProgram", "min"): 30}
+
+    def test_program_change_reuses_stored_support_result(self):
+        """Switching back to a program restores its support result."""
+        coordinator = self._make_coordinator_with_state(
+            {"userSelections": {"programUID": "QuickWash"}}
+        )
+        entity = make_entity(entity_attr="spinSpeed")
+        entity.coordinator = coordinator
+        object.__setattr__(entity, "async_write_ha_state", MagicMock())
+        capabilities = coordinator.data["appliances"].get_appliance().data.capabilities
+        entity._program_cache_key = "OldProgram"
+        entity._supported_by_program = {"QuickWash": False}
+        entity._supported_source = capabilities
+
+        entity._handle_coordinator_update()
+        assert entity._is_supported_cache is False
+
+        # A replaced capabilities payload invalidates the stored results
+        entity._program_cache_key = "OldProgram"
+        entity._supported_source = {}
+        entity._handle_coordinator_update()
+        assert entity._is_supported_cache is None
 
     def test_program_from_cyclepersonalization_in_update(self):
         """_handle_coordinator_update reads program from cyclePersonalization.programUID."""
@@ -413,13 +437,13 @@ class TestHandleCoordinatorUpdateGaps:
         object.__setattr__(entity, "async_write_ha_state", write_mock)
         entity._program_cache_key = "OldProgram"
         entity._is_supported_cache = True
-        entity._constraints_cache = {"max": 90}
+        entity._constraints_cache = {("OldProgram", "max"): 90}
 
         entity._handle_coordinator_update()
 
         assert entity._program_cache_key == "Synthetic"
         assert entity._is_supported_cache is None
-        assert entity._constraints_cache == {}
+        assert entity._constraints_cache == {("OldProgram", "max"): 90}
 
     def test_non_dict_appliance_status_clears_cache(self):
         """When get_appliance returns non-dict state, cache is reset to {}."""
@@ -484,13 +508,13 @@ class TestHandleCoordinatorUpdateGaps:
         # Same program already in cache
         entity._program_cache_key = "Cotton"
         entity._is_supported_cache = True
-        entity._constraints_cache = {"min": 30}
+        entity._constraints_cache = {("Cotton", "min"): 30}
 
         entity._handle_coordinator_update()
 
         # Cache should NOT be cleared (program didn't change)
         assert entity._is_supported_cache is True
-        assert entity._constraints_cache == {"min": 30}
+        assert entity._constraints_cache == {("Cotton", "min"): 30}
 
 
 # ===========================================================================
@@ -711,7 +735,7 @@ class TestApplyOptimisticUpdateGaps:
         )
         entity.coordinator.data["appliances"].get_appliance(
             "TEST_APPLIANCE_123"
-        ).data.capabilities = capabilities
+        ).data = SimpleNamespace(capabilities=capabilities)
         entity.entity_id = ""
         write_mock = MagicMock()
         object.__setattr__(entity, "async_write_ha_state", write_mock)
@@ -763,7 +787,7 @@ class TestApplyOptimisticUpdateGaps:
         )
         entity.coordinator.data["appliances"].get_appliance(
             "TEST_APPLIANCE_123"
-        ).data.capabilities = capabilities
+        ).data = SimpleNamespace(capabilities=capabilities)
         set_updated_mock = MagicMock()
         entity.coordinator.async_set_updated_data = set_updated_mock
 
@@ -784,7 +808,7 @@ class TestApplyOptimisticUpdateGaps:
         )
         entity.coordinator.data["appliances"].get_appliance(
             "TEST_APPLIANCE_123"
-        ).data.capabilities = capabilities
+        ).data = SimpleNamespace(capabilities=capabilities)
         set_updated_mock = MagicMock()
         entity.coordinator.async_set_updated_data = set_updated_mock
 
@@ -843,7 +867,7 @@ class TestApplyOptimisticUpdateGaps:
         )
         entity.coordinator.data["appliances"].get_appliance(
             "TEST_APPLIANCE_123"
-        ).data.capabilities = capabilities
+        ).data = SimpleNamespace(capabilities=capabilities)
         set_updated_mock = MagicMock()
         entity.coordinator.async_set_updated_data = set_updated_mock
 
@@ -903,7 +927,7 @@ class TestApplyOptimisticUpdateGaps:
         )
         entity.coordinator.data["appliances"].get_appliance(
             "TEST_APPLIANCE_123"
-        ).data.capabilities = capabilities
+        ).data = SimpleNamespace(capabilities=capabilities)
         set_updated_mock = MagicMock()
         entity.coordinator.async_set_updated_data = set_updated_mock
 
@@ -948,7 +972,7 @@ class TestApplyOptimisticUpdateGaps:
         )
         entity.coordinator.data["appliances"].get_appliance(
             "TEST_APPLIANCE_123"
-        ).data.capabilities = capabilities
+        ).data = SimpleNamespace(capabilities=capabilities)
         entity.entity_id = ""
         write_mock = MagicMock()
         object.__setattr__(entity, "async_write_ha_state", write_mock)
@@ -1235,10 +1259,10 @@ def _make_entity_with_capabilities(
         entity_source=entity_source,
         reported=reported or {},
     )
-    # Wire get_appliance.data.capabilities
-    mock_data = MagicMock()
-    mock_data.capabilities = appliance_capabilities or {}
-    entity.coordinator.data["appliances"].get_appliance.return_value.data = mock_data
+    # Wire get_appliance.data.capabilities; a plain namespace avoids child mocks
+    entity.coordinator.data["appliances"].get_appliance.return_value.data = (
+        SimpleNamespace(capabilities=appliance_capabilities or {})
+    )
     return entity
 
 
@@ -1775,8 +1799,7 @@ class TestGetProgramCapabilitiesGaps:
             entity_attr="targetTemperatureC",
             reported={"program": "Cotton"},
         )
-        mock_data = MagicMock()
-        mock_data.capabilities = None
+        mock_data = SimpleNamespace(capabilities=None)
         entity.coordinator.data["appliances"].get_appliance.return_value.data = (
             mock_data
         )
@@ -1786,12 +1809,13 @@ class TestGetProgramCapabilitiesGaps:
 
     def test_userselections_location(self):
         """Program caps found via userSelections/programUID path."""
-        mock_data = MagicMock()
-        mock_data.capabilities = {
-            "userSelections/programUID": {
-                "values": {"QuickWash": {"spinSpeed": {"min": 400, "max": 1200}}}
+        mock_data = SimpleNamespace(
+            capabilities={
+                "userSelections/programUID": {
+                    "values": {"QuickWash": {"spinSpeed": {"min": 400, "max": 1200}}}
+                }
             }
-        }
+        )
         entity = make_entity(entity_attr="spinSpeed", reported={"program": "QuickWash"})
         entity.coordinator.data["appliances"].get_appliance.return_value.data = (
             mock_data
@@ -1802,12 +1826,13 @@ class TestGetProgramCapabilitiesGaps:
 
     def test_cyclepersonalization_location(self):
         """Program caps found via cyclePersonalization/programUID path."""
-        mock_data = MagicMock()
-        mock_data.capabilities = {
-            "cyclePersonalization/programUID": {
-                "values": {"Synthetic": {"temperature": {"min": 30, "max": 60}}}
+        mock_data = SimpleNamespace(
+            capabilities={
+                "cyclePersonalization/programUID": {
+                    "values": {"Synthetic": {"temperature": {"min": 30, "max": 60}}}
+                }
             }
-        }
+        )
         entity = make_entity(entity_attr="temperature", reported={})
         entity.coordinator.data["appliances"].get_appliance.return_value.data = (
             mock_data
@@ -2131,8 +2156,7 @@ class TestIsSupportedByProgramNoApplianceData:
             entity_attr="targetTemperatureC",
             reported={"program": "Cotton"},
         )
-        mock_data = MagicMock()
-        mock_data.capabilities = None
+        mock_data = SimpleNamespace(capabilities=None)
         entity.coordinator.data["appliances"].get_appliance.return_value.data = (
             mock_data
         )
@@ -2157,10 +2181,9 @@ class TestGetProgramConstraintNoProgram:
             reported={"program": "UnknownProgram"},
         )
         # _get_program_capabilities will return {} for unknown program
-        mock_data = MagicMock()
-        mock_data.capabilities = {
-            "program": {"values": {}}  # UnknownProgram not in values
-        }
+        mock_data = SimpleNamespace(
+            capabilities={"program": {"values": {}}}  # UnknownProgram not in values
+        )
         entity.coordinator.data["appliances"].get_appliance.return_value.data = (
             mock_data
         )
@@ -6,6 +6,7 @@ from unittest.mock import MagicMock
 import pytest
 from homeassistant.core import HomeAssistant
 
+from custom_components.electrolux import _mask_token, _validate_config, async_setup
 from custom_components.electrolux.const import DOMAIN, PLATFORMS
 
 
@@ -28,9 +29,9 @@ def test_platforms_defined():
         "fan",
         "vacuum",
     ]
-    # Convert Platform enums to strings for comparison
-    platform_strings = [str(p).split(".")[-1] for p in PLATFORMS]
-    assert set(platform_strings) == set(expected_platforms)
+    # Compare the Platform enum values directly
+    platform_strings = {p.value for p in PLATFORMS}
+    assert platform_strings == set(expected_platforms)
 
 
 class TestValidateConfig:
@@ -40,8 +41,6 @@ class TestValidateConfig:
         """Test that validation fails with missing API key."""
         from homeassistant.exceptions import ConfigEntryError
 
-        from custom_components.electrolux import _validate_config
-
         mock_entry = MagicMock()
         mock_entry.data = {}
 
@@ -50,8 +49,6 @@ class TestValidateConfig:
 
     def test_validate_config_with_api_key(self):
         """Test that validation passes with API key."""
-        from custom_components.electrolux import _validate_config
-
         mock_entry = MagicMock()
         mock_entry.data = {"api_key": "test_key"}
 
@@ -64,8 +61,6 @@ class TestMaskToken:
 
     def test_mask_token_normal(self):
         """Test masking of normal length token."""
-        from custom_components.electrolux import _mask_token
-
         token = "abcdefgh12345678"
         masked = _mask_token(token)
         assert masked == "abcd***5678"
@@ -74,16 +69,12 @@ class TestMaskToken:
 
     def test_mask_token_short(self):
         """Test masking of short token."""
-        from custom_components.electrolux import _mask_token
-
         token = "short"
         masked = _mask_token(token)
         assert masked == "***"
 
     def test_mask_token_none(self):
         """Test masking of None token."""
-        from custom_components.electrolux import _mask_token
-
         masked = _mask_token(None)
         assert masked == "***"
 
@@ -94,8 +85,6 @@ class TestAsyncSetup:
     @pytest.mark.asyncio
     async def test_async_setup_returns_true(self):
         """Test that async_setup returns True (YAML not supported)."""
-        from custom_components.electrolux import async_setup
-
         mock_hass = MagicMock(spec=HomeAssistant)
         result = await async_setup(mock_hass, {})
         assert result is True
@@ -529,7 +518,7 @@ class TestAsyncSetupEntryAdditional:
 
     @pytest.mark.asyncio
     async def test_setup_entry_cleanup_tasks_cancels_listen_and_renew(self):
-        """Lines 236-247: cleanup_tasks() cancels listen_task and renew_task."""
+        """Lines 236-247: cleanup_tasks() cancels the websocket and token refresh tasks."""
         from unittest.mock import AsyncMock, patch
 
         from custom_components.electrolux import async_setup_entry
@@ -579,6 +568,9 @@ class TestAsyncSetupEntryAdditional:
 
         mock_coordinator.listen_task.cancel.assert_called()
         mock_coordinator.renew_task.cancel.assert_called()
+        # The token refresh loop runs as an entry background task
+        mock_entry.async_create_background_task.assert_called_once()
+        mock_coordinator.token_refresh_task.cancel.assert_called()
 
     @pytest.mark.asyncio
     async def test_setup_entry_close_coordinator_on_stop_event(self):
@@ -626,6 +618,7 @@ class TestAsyncSetupEntryAdditional:
         ), "_close_coordinator not registered for STOP event"
         await stop_callback(None)
         mock_coordinator.close_websocket.assert_awaited_once()
+        mock_coordinator.token_refresh_task.cancel.assert_called_once()
 
     @pytest.mark.asyncio
     async def test_setup_entry_close_coordinator_exception_swallowed(self):
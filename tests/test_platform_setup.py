@@ -1,168 +1,118 @@
 """Test platform setup for all Electrolux platforms."""
 
+from dataclasses import dataclass, field
+from types import SimpleNamespace
+from typing import Any
 from unittest.mock import MagicMock
 
 import pytest
 from homeassistant.const import Platform
 
-
-@pytest.fixture
-def mock_hass():
-    """Create a mock Home Assistant instance."""
-    hass = MagicMock()
-    hass.data = {}
-    return hass
-
-
-@pytest.fixture
-def mock_config_entry():
-    """Create a mock config entry."""
-    entry = MagicMock()
-    entry.entry_id = "test_entry_id"
-    entry.data = {
-        "api_key": "test_api_key",
-        "access_token": "test_access_token",
-        "refresh_token": "test_refresh_token",
-    }
-    return entry
-
-
-@pytest.fixture
-def mock_coordinator():
-    """Create a mock coordinator with appliances."""
-    coordinator = MagicMock()
-    coordinator.data = {"appliances": MagicMock()}
-
-    # Mock appliances
-    mock_appliance = MagicMock()
-    mock_appliance.pnc_id = "test_appliance_123"
-    mock_appliance.name = "Test Appliance"
-    mock_appliance.brand = "Electrolux"
-    mock_appliance.model = "TEST123"
+from custom_components.electrolux.binary_sensor import (
+    async_setup_entry as binary_sensor_setup,
+)
+from custom_components.electrolux.button import async_setup_entry as button_setup
+from custom_components.electrolux.climate import async_setup_entry as climate_setup
+from custom_components.electrolux.const import SWITCH
+from custom_components.electrolux.number import async_setup_entry as number_setup
+from custom_components.electrolux.select import async_setup_entry as select_setup
+from custom_components.electrolux.sensor import async_setup_entry as sensor_setup
+from custom_components.electrolux.switch import async_setup_entry as switch_setup
+from custom_components.electrolux.text import async_setup_entry as text_setup
+
+# asyncio_mode = "auto" picks up the tests; they share one event loop
+pytestmark = pytest.mark.asyncio(loop_scope="module")
+
+SETUPS = {
+    "binary_sensor": binary_sensor_setup,
+    "button": button_setup,
+    "number": number_setup,
+    "select": select_setup,
+    "sensor": sensor_setup,
+    "text": text_setup,
+}
+
+_PLATFORMS = {
+    "binary_sensor": Platform.BINARY_SENSOR,
+    "button": Platform.BUTTON,
+    "number": Platform.NUMBER,
+    "select": Platform.SELECT,
+    "sensor": Platform.SENSOR,
+    "text": Platform.TEXT,
+}
+
+
+@dataclass(slots=True)
+class FakeAppliance:
+    """Plain appliance double; only what the platform setups read."""
+
+    pnc_id: str
+    name: str
+    brand: str = "Electrolux"
+    model: str = "TEST123"
+    appliance_type: str = "OV"
+    entities: list = field(default_factory=list)
+    data: Any = None
+    state: dict = field(default_factory=dict)
+
+
+@pytest.fixture(scope="module")
+def mock_appliance():
+    """Create the coordinator's appliance once per module; it is reset per test."""
+    return FakeAppliance(pnc_id="test_appliance_123", name="Test Appliance")
+
+
+@pytest.fixture(autouse=True)
+def _reset_shared_mocks(mock_coordinator, mock_appliance):
+    """Restore the shared appliance and install it on this test's coordinator."""
     mock_appliance.appliance_type = "OV"  # Oven
     mock_appliance.entities = []
+    mock_appliance.data = None
+    mock_coordinator.data["appliances"].appliances = {
+        "test_appliance_123": mock_appliance
+    }
 
-    coordinator.data["appliances"].appliances = {"test_appliance_123": mock_appliance}
-    return coordinator
-
-
-class TestSensorPlatformSetup:
-    """Test sensor platform setup."""
-
-    @pytest.mark.asyncio
-    async def test_sensor_platform_setup_success(
-        self, mock_hass, mock_config_entry, mock_coordinator
-    ):
-        """Test successful sensor platform setup."""
-        from custom_components.electrolux.sensor import async_setup_entry
-
-        # Add entities to the appliance
-        mock_entity = MagicMock()
-        mock_entity.entity_type = Platform.SENSOR
-        mock_coordinator.data["appliances"].appliances[
-            "test_appliance_123"
-        ].entities = [mock_entity]
-
-        mock_config_entry.runtime_data = mock_coordinator
-        mock_add_entities = MagicMock()
-
-        result = await async_setup_entry(
-            mock_hass, mock_config_entry, mock_add_entities
-        )
-
-        assert result is None  # Function returns None on success
-        mock_add_entities.assert_called_once()
-        # Verify entities were added
-        call_args = mock_add_entities.call_args[0][0]
-        assert len(call_args) == 1
-        assert call_args[0] == mock_entity
-
-    @pytest.mark.asyncio
-    async def test_sensor_platform_setup_no_appliances(
-        self, mock_hass, mock_config_entry
-    ):
-        """Test sensor platform setup with no appliances."""
-        from custom_components.electrolux.sensor import async_setup_entry
-
-        mock_coordinator = MagicMock()
-        mock_coordinator.data = {}  # No appliances
-        mock_config_entry.runtime_data = mock_coordinator
-        mock_add_entities = MagicMock()
-
-        result = await async_setup_entry(
-            mock_hass, mock_config_entry, mock_add_entities
-        )
-
-        assert result is None
-        mock_add_entities.assert_not_called()
-
-
-class TestNumberPlatformSetup:
-    """Test number platform setup."""
-
-    @pytest.mark.asyncio
-    async def test_number_platform_setup_success(
-        self, mock_hass, mock_config_entry, mock_coordinator
-    ):
-        """Test successful number platform setup."""
-        from custom_components.electrolux.number import async_setup_entry
-
-        # Add number entities
-        mock_entity = MagicMock()
-        mock_entity.entity_type = Platform.NUMBER
-        mock_coordinator.data["appliances"].appliances[
-            "test_appliance_123"
-        ].entities = [mock_entity]
 
-        mock_config_entry.runtime_data = mock_coordinator
-        mock_add_entities = MagicMock()
+@pytest.fixture
+def wired_entry(mock_config_entry, mock_coordinator):
+    """Return the config entry with the shared coordinator already installed."""
+    mock_config_entry.runtime_data = mock_coordinator
+    return mock_config_entry
 
-        result = await async_setup_entry(
-            mock_hass, mock_config_entry, mock_add_entities
-        )
 
-        assert result is None
-        mock_add_entities.assert_called_once()
+async def _run_setup(setup_fn, hass, entry):
+    """Run a platform setup and return the entities it added in its single call."""
+    mock_add_entities = MagicMock()
 
+    assert await setup_fn(hass, entry, mock_add_entities) is None
+    mock_add_entities.assert_called_once()
+    return mock_add_entities.call_args[0][0]
 
-class TestSelectPlatformSetup:
-    """Test select platform setup."""
 
-    @pytest.mark.asyncio
-    async def test_select_platform_setup_success(
-        self, mock_hass, mock_config_entry, mock_coordinator
-    ):
-        """Test successful select platform setup."""
-        from custom_components.electrolux.select import async_setup_entry
+@pytest.mark.parametrize("module_name", list(SETUPS))
+async def test_platform_setup_success(
+    module_name, mock_hass, wired_entry, mock_appliance
+):
+    """Test that each platform adds the appliance entities of its own type."""
+    # entity_attr is set because the sensor platform filters on it
+    entity = SimpleNamespace(
+        entity_type=_PLATFORMS[module_name], entity_attr="sentinel"
+    )
+    mock_appliance.entities = [entity]
 
-        mock_entity = MagicMock()
-        mock_entity.entity_type = Platform.SELECT
-        mock_coordinator.data["appliances"].appliances[
-            "test_appliance_123"
-        ].entities = [mock_entity]
+    added = await _run_setup(SETUPS[module_name], mock_hass, wired_entry)
 
-        mock_config_entry.runtime_data = mock_coordinator
-        mock_add_entities = MagicMock()
-
-        result = await async_setup_entry(
-            mock_hass, mock_config_entry, mock_add_entities
-        )
-
-        assert result is None
-        mock_add_entities.assert_called_once()
+    assert len(added) == 1
+    assert added[0] is entity
 
 
 class TestSwitchPlatformSetup:
     """Test switch platform setup."""
 
-    @pytest.mark.asyncio
     async def test_switch_platform_setup_success(
-        self, mock_hass, mock_config_entry, mock_coordinator
+        self, mock_hass, wired_entry, mock_coordinator
     ):
         """Test successful switch platform setup."""
-        from custom_components.electrolux.const import SWITCH  # Use internal constant
-        from custom_components.electrolux.switch import async_setup_entry
-
         # 1. Define a specific attribute name for the test switch
         test_attr = "userSelections/EWX1493A_preWashPhase"
 
@@ -198,193 +148,67 @@ class TestSwitchPlatformSetup:
             "test_appliance_123": mock_appliance
         }
 
-        mock_config_entry.runtime_data = mock_coordinator
-        mock_add_entities = MagicMock()
-
-        result = await async_setup_entry(
-            mock_hass, mock_config_entry, mock_add_entities
-        )
-
-        assert result is None
-        mock_add_entities.assert_called_once()
-
-
-class TestBinarySensorPlatformSetup:
-    """Test binary sensor platform setup."""
-
-    @pytest.mark.asyncio
-    async def test_binary_sensor_platform_setup_success(
-        self, mock_hass, mock_config_entry, mock_coordinator
-    ):
-        """Test successful binary sensor platform setup."""
-        from custom_components.electrolux.binary_sensor import async_setup_entry
-
-        mock_entity = MagicMock()
-        mock_entity.entity_type = Platform.BINARY_SENSOR
-        mock_coordinator.data["appliances"].appliances[
-            "test_appliance_123"
-        ].entities = [mock_entity]
+        added = await _run_setup(switch_setup, mock_hass, wired_entry)
 
-        mock_config_entry.runtime_data = mock_coordinator
-        mock_add_entities = MagicMock()
-
-        result = await async_setup_entry(
-            mock_hass, mock_config_entry, mock_add_entities
-        )
-
-        assert result is None
-        mock_add_entities.assert_called_once()
-
-
-class TestButtonPlatformSetup:
-    """Test button platform setup."""
-
-    @pytest.mark.asyncio
-    async def test_button_platform_setup_success(
-        self, mock_hass, mock_config_entry, mock_coordinator
-    ):
-        """Test successful button platform setup."""
-        from custom_components.electrolux.button import async_setup_entry
-
-        mock_entity = MagicMock()
-        mock_entity.entity_type = Platform.BUTTON
-        mock_coordinator.data["appliances"].appliances[
-            "test_appliance_123"
-        ].entities = [mock_entity]
-
-        mock_config_entry.runtime_data = mock_coordinator
-        mock_add_entities = MagicMock()
-
-        result = await async_setup_entry(
-            mock_hass, mock_config_entry, mock_add_entities
-        )
-
-        assert result is None
-        mock_add_entities.assert_called_once()
-
-
-class TestTextPlatformSetup:
-    """Test text platform setup."""
-
-    @pytest.mark.asyncio
-    async def test_text_platform_setup_success(
-        self, mock_hass, mock_config_entry, mock_coordinator
-    ):
-        """Test successful text platform setup."""
-        from custom_components.electrolux.text import async_setup_entry
-
-        mock_entity = MagicMock()
-        mock_entity.entity_type = Platform.TEXT
-        mock_coordinator.data["appliances"].appliances[
-            "test_appliance_123"
-        ].entities = [mock_entity]
-
-        mock_config_entry.runtime_data = mock_coordinator
-        mock_add_entities = MagicMock()
-
-        result = await async_setup_entry(
-            mock_hass, mock_config_entry, mock_add_entities
-        )
-
-        assert result is None
-        mock_add_entities.assert_called_once()
+        assert added == [mock_entity]
 
 
 class TestClimatePlatformSetup:
     """Test climate platform setup."""
 
-    @pytest.mark.asyncio
     async def test_climate_platform_setup_ac_appliance(
-        self, mock_hass, mock_config_entry, mock_coordinator
+        self, mock_hass, wired_entry, mock_appliance
     ):
         """Test climate platform creates entity for AC appliances."""
-        from custom_components.electrolux.climate import async_setup_entry
-
         # Set appliance type to AC
-        mock_coordinator.data["appliances"].appliances[
-            "test_appliance_123"
-        ].appliance_type = "AC"
-
-        mock_config_entry.runtime_data = mock_coordinator
-        mock_add_entities = MagicMock()
+        mock_appliance.appliance_type = "AC"
 
-        result = await async_setup_entry(
-            mock_hass, mock_config_entry, mock_add_entities
-        )
+        added = await _run_setup(climate_setup, mock_hass, wired_entry)
 
-        assert result is None
-        mock_add_entities.assert_called_once()
         # Verify climate entity was created
-        call_args = mock_add_entities.call_args[0][0]
-        assert len(call_args) == 1
+        assert len(added) == 1
 
-    @pytest.mark.asyncio
     async def test_climate_platform_setup_non_ac_appliance(
-        self, mock_hass, mock_config_entry, mock_coordinator
+        self, mock_hass, wired_entry, mock_appliance
     ):
         """Test climate platform ignores non-AC appliances."""
-        from custom_components.electrolux.climate import async_setup_entry
-
         # Appliance type is "OV" (oven), not "AC"
-        mock_coordinator.data["appliances"].appliances[
-            "test_appliance_123"
-        ].appliance_type = "OV"
-
-        mock_config_entry.runtime_data = mock_coordinator
-        mock_add_entities = MagicMock()
+        mock_appliance.appliance_type = "OV"
 
-        result = await async_setup_entry(
-            mock_hass, mock_config_entry, mock_add_entities
-        )
+        added = await _run_setup(climate_setup, mock_hass, wired_entry)
 
-        assert result is None
         # No entities should be added for non-AC appliances
-        call_args = mock_add_entities.call_args[0][0]
-        assert len(call_args) == 0
+        assert len(added) == 0
 
-    @pytest.mark.asyncio
     async def test_climate_platform_setup_multiple_ac_appliances(
         self, mock_hass, mock_config_entry
     ):
         """Test climate platform handles multiple AC appliances."""
-        from custom_components.electrolux.climate import async_setup_entry
-
         # Create multiple AC appliances
         mock_coordinator = MagicMock()
-        mock_appliances = {}
-
-        for i in range(3):
-            mock_appliance = MagicMock()
-            mock_appliance.pnc_id = f"test_ac_{i}"
-            mock_appliance.name = f"AC {i}"
-            mock_appliance.appliance_type = "AC"
-            mock_appliances[f"test_ac_{i}"] = mock_appliance
-
-        mock_coordinator.data = {"appliances": MagicMock(appliances=mock_appliances)}
-
+        mock_appliances = {
+            f"test_ac_{i}": FakeAppliance(
+                pnc_id=f"test_ac_{i}", name=f"AC {i}", appliance_type="AC"
+            )
+            for i in range(3)
+        }
+        # Entity construction only needs the mapping and get_appliance()
+        mock_coordinator.data = {
+            "appliances": SimpleNamespace(
+                appliances=mock_appliances, get_appliance=mock_appliances.get
+            )
+        }
         mock_config_entry.runtime_data = mock_coordinator
-        mock_add_entities = MagicMock()
 
-        result = await async_setup_entry(
-            mock_hass, mock_config_entry, mock_add_entities
-        )
+        added = await _run_setup(climate_setup, mock_hass, mock_config_entry)
 
-        assert result is None
-        mock_add_entities.assert_called_once()
         # Verify 3 climate entities were created
-        call_args = mock_add_entities.call_args[0][0]
-        assert len(call_args) == 3
+        assert len(added) == 3
 
-    @pytest.mark.asyncio
     async def test_climate_setup_extracts_capabilities_from_appliance_data(
-        self, mock_hass, mock_config_entry, mock_coordinator
+        self, mock_hass, wired_entry, mock_appliance
     ):
         """Test line 53 — capabilities_dict is populated from appliance.data.capabilities."""
-        from custom_components.electrolux.climate import async_setup_entry
-
-        mock_appliance = mock_coordinator.data["appliances"].appliances[
-            "test_appliance_123"
-        ]
         mock_appliance.appliance_type = "AC"
         # Give the appliance real data with capabilities
         mock_appliance.data = MagicMock()
@@ -394,14 +218,10 @@ class TestClimatePlatformSetup:
             "unknownAttr": {},  # Not in climate_attrs, should be ignored
         }
 
-        mock_config_entry.runtime_data = mock_coordinator
-        mock_add_entities = MagicMock()
-
-        await async_setup_entry(mock_hass, mock_config_entry, mock_add_entities)
+        added = await _run_setup(climate_setup, mock_hass, wired_entry)
 
-        call_args = mock_add_entities.call_args[0][0]
-        assert len(call_args) == 1
-        entity = call_args[0]
+        assert len(added) == 1
+        entity = added[0]
         # Verified climate-relevant attrs were extracted; unknown attr was not
         assert "mode" in entity.capability
         assert "targetTemperatureC" in entity.capability
@@ -411,40 +231,44 @@ class TestClimatePlatformSetup:
 class TestPlatformSetupErrorHandling:
     """Test error handling in platform setup."""
 
-    @pytest.mark.asyncio
     async def test_platform_setup_handles_missing_coordinator(
         self, mock_hass, mock_config_entry
     ):
         """Test platform setup handles coordinator with empty data gracefully."""
-        from custom_components.electrolux.sensor import async_setup_entry
-
         mock_coordinator = MagicMock()
         mock_coordinator.data = {}  # No appliances key
         mock_config_entry.runtime_data = mock_coordinator
         mock_add_entities = MagicMock()
 
-        result = await async_setup_entry(
-            mock_hass, mock_config_entry, mock_add_entities
-        )
+        result = await sensor_setup(mock_hass, mock_config_entry, mock_add_entities)
 
         assert result is None
         mock_add_entities.assert_not_called()
 
-    @pytest.mark.asyncio
     async def test_platform_setup_handles_none_appliances(
         self, mock_hass, mock_config_entry
     ):
         """Test platform setup handles None appliances."""
-        from custom_components.electrolux.sensor import async_setup_entry
-
         mock_coordinator = MagicMock()
         mock_coordinator.data = {"appliances": None}
         mock_config_entry.runtime_data = mock_coordinator
         mock_add_entities = MagicMock()
 
-        result = await async_setup_entry(
-            mock_hass, mock_config_entry, mock_add_entities
-        )
+        result = await sensor_setup(mock_hass, mock_config_entry, mock_add_entities)
+
+        assert result is None
+        mock_add_entities.assert_not_called()
+
+    async def test_sensor_platform_setup_no_appliances(
+        self, mock_hass, mock_config_entry
+    ):
+        """Test sensor platform setup with no appliances."""
+        mock_coordinator = MagicMock()
+        mock_coordinator.data = {}  # No appliances
+        mock_config_entry.runtime_data = mock_coordinator
+        mock_add_entities = MagicMock()
+
+        result = await sensor_setup(mock_hass, mock_config_entry, mock_add_entities)
 
         assert result is None
         mock_add_entities.assert_not_called()
@@ -5,7 +5,7 @@ different appliance types (ovens vs dryers) which store capabilities in differen
 locations in the data structure.
 """
 
-from unittest.mock import MagicMock
+from types import MappingProxyType, SimpleNamespace
 
 import pytest
 from homeassistant.const import EntityCategory
@@ -13,50 +13,192 @@ from homeassistant.const import EntityCategory
 from custom_components.electrolux.const import NUMBER
 from custom_components.electrolux.number import ElectroluxNumber
 
+# Capability payloads shared read-only by the tests below, one per storage layout
+_OVEN_CAPS = MappingProxyType(
+    {
+        "program": {
+            "values": {
+                "ECO_MODE": {
+                    "targetTemperatureC": {
+                        "min": 30,
+                        "max": 230,
+                        "step": 5,
+                        "disabled": False,
+                    }
+                },
+                "DEFROST": {
+                    "targetTemperatureC": {
+                        "min": 30,
+                        "max": 60,
+                        "step": 5,
+                        "default": 40,
+                        "disabled": False,
+                    }
+                },
+                "CONVENTIONAL": {
+                    "targetTemperatureC": {
+                        "min": 30,
+                        "max": 250,
+                        "step": 5,
+                        "disabled": False,
+                    }
+                },
+            }
+        }
+    }
+)
+_DRYER_CAPS = MappingProxyType(
+    {
+        "userSelections/programUID": {
+            "values": {
+                "COTTON_PR_COTTONSECO": {
+                    "userSelections/antiCreaseValue": {
+                        "min": 30,
+                        "max": 120,
+                        "step": 30,
+                        "default": 30,
+                        "disabled": False,
+                    },
+                    "userSelections/humidityTarget": {
+                        "values": {"CUPBOARD": {}, "IRON": {}}
+                    },
+                },
+                "SYNTHETIC_PR_SYNTHETICS": {
+                    "userSelections/antiCreaseValue": {
+                        "min": 30,
+                        "max": 90,
+                        "step": 30,
+                    }
+                },
+                "SHOES_PR_RUNNINGSHOES": {
+                    "userSelections/drynessValue": {
+                        "values": {"MAXIMUM": {}, "MEDIUM": {}, "MINIMUM": {}}
+                    }
+                    # Note: antiCreaseValue NOT in this program
+                },
+            }
+        }
+    }
+)
+_CYCLE_CAPS = MappingProxyType(
+    {
+        "cyclePersonalization/programUID": {
+            "values": {
+                "SOME_PROGRAM": {
+                    "someControl": {"min": 0, "max": 100, "disabled": False}
+                }
+            }
+        }
+    }
+)
+_EXISTING_PROGRAM_CAPS = MappingProxyType(
+    {"program": {"values": {"EXISTING_PROGRAM": {}}}}
+)
 
-class TestProgramCapabilitiesLookup:
-    """Test _get_program_capabilities helper method works for all appliance types."""
 
-    @pytest.fixture
-    def mock_coordinator(self):
-        """Create a mock coordinator."""
-        coordinator = MagicMock()
-        coordinator.hass = MagicMock()
-        coordinator.hass.loop = MagicMock()
-        coordinator.hass.loop.time.return_value = 1000000.0
-        coordinator.config_entry = MagicMock()
-        coordinator._last_update_times = {}
-
-        # Setup mock appliances structure
-        mock_appliances = MagicMock()
-        mock_appliance = MagicMock()
-        mock_appliances.get_appliance.return_value = mock_appliance
-        coordinator.data = {"appliances": mock_appliances}
-
-        return coordinator
-
-    @pytest.fixture
-    def base_entity(self, mock_coordinator):
-        """Create a base test entity."""
-        capability = {"access": "readwrite", "type": "number"}
+class _Data:
+    """Appliance data double holding only the capabilities mapping."""
+
+    __slots__ = ("capabilities",)
+
+    def __init__(self, capabilities):
+        self.capabilities = capabilities
+
+
+class _Appliance:
+    """Appliance double; entities read state on construction."""
+
+    __slots__ = ("data", "state")
+
+    def __init__(self, data):
+        self.data = data
+        self.state = None
+
+
+class _Appliances:
+    """Appliances double returning the same appliance for any PNC."""
+
+    __slots__ = ("_appliance",)
+
+    def __init__(self, appliance):
+        self._appliance = appliance
+
+    def get_appliance(self, _pnc_id):
+        """Return the single appliance (or None)."""
+        return self._appliance
+
+
+@pytest.fixture(scope="module")
+def mock_coordinator():
+    """Create the coordinator double once per module; the appliance is per test."""
+    return SimpleNamespace(
+        hass=SimpleNamespace(loop=SimpleNamespace(time=lambda: 1000000.0)),
+        config_entry=object(),
+        api=None,
+        _last_update_times={},
+        data={"appliances": _Appliances(None)},
+    )
+
+
+@pytest.fixture
+def base_entity(mock_coordinator):
+    """Create the base test entity."""
+    capability = {"access": "readwrite", "type": "number"}
+    entity = ElectroluxNumber(
+        coordinator=mock_coordinator,
+        name="Test Control",
+        config_entry=mock_coordinator.config_entry,
+        pnc_id="TEST_PNC",
+        entity_type=NUMBER,
+        entity_name="test_control",
+        entity_attr="userSelections/antiCreaseValue",
+        entity_source=None,
+        capability=capability,
+        unit=None,
+        device_class=None,
+        entity_category=EntityCategory.CONFIG,
+        icon="mdi:test",
+    )
+    entity.hass = mock_coordinator.hass
+    return entity
+
+
+@pytest.fixture
+def number_entity(mock_coordinator):
+    """Return a factory building a number entity for the given attribute."""
+
+    def _make(entity_attr):
         entity = ElectroluxNumber(
             coordinator=mock_coordinator,
-            name="Test Control",
+            name=entity_attr,
             config_entry=mock_coordinator.config_entry,
             pnc_id="TEST_PNC",
             entity_type=NUMBER,
-            entity_name="test_control",
-            entity_attr="userSelections/antiCreaseValue",
+            entity_name=entity_attr.lower().replace("/", "_"),
+            entity_attr=entity_attr,
             entity_source=None,
-            capability=capability,
+            capability={"access": "readwrite", "type": "number"},
             unit=None,
             device_class=None,
-            entity_category=EntityCategory.CONFIG,
-            icon="mdi:test",
+            entity_category=None,
+            icon=None,
         )
         entity.hass = mock_coordinator.hass
         return entity
 
+    return _make
+
+
+@pytest.fixture(autouse=True)
+def _reset_shared_state(mock_coordinator):
+    """Give every test a fresh appliance on the shared coordinator."""
+    mock_coordinator._last_update_times.clear()
+    mock_coordinator.data["appliances"]._appliance = _Appliance(_Data({}))
+
+
+class TestProgramCapabilitiesLookup:
+    """Test _get_program_capabilities helper method works for all appliance types."""
+
     def test_get_program_capabilities_oven_structure(
         self, base_entity, mock_coordinator
     ):
@@ -66,29 +208,8 @@ class TestProgramCapabilitiesLookup:
         capabilities["program"]["values"][program_name]
         """
         # Setup oven-style capabilities structure through coordinator
-        mock_appliance = mock_coordinator.data["appliances"].get_appliance.return_value
-        mock_appliance.data.capabilities = {
-            "program": {
-                "values": {
-                    "ECO_MODE": {
-                        "targetTemperatureC": {
-                            "min": 30,
-                            "max": 230,
-                            "step": 5,
-                            "disabled": False,
-                        }
-                    },
-                    "DEFROST": {
-                        "targetTemperatureC": {
-                            "min": 30,
-                            "max": 60,
-                            "step": 5,
-                            "disabled": False,
-                        }
-                    },
-                }
-            }
-        }
+        mock_appliance = mock_coordinator.data["appliances"]._appliance
+        mock_appliance.data.capabilities = _OVEN_CAPS
 
         # Test ECO_MODE capabilities
         eco_caps = base_entity._get_program_capabilities("ECO_MODE")
@@ -111,30 +232,8 @@ class TestProgramCapabilitiesLookup:
         capabilities["userSelections/programUID"]["values"][program_name]
         """
         # Setup dryer-style capabilities structure through coordinator
-        mock_appliance = mock_coordinator.data["appliances"].get_appliance.return_value
-        mock_appliance.data.capabilities = {
-            "userSelections/programUID": {
-                "values": {
-                    "COTTON_PR_COTTONSECO": {
-                        "userSelections/antiCreaseValue": {
-                            "min": 30,
-                            "max": 120,
-                            "step": 30,
-                            "disabled": False,
-                        },
-                        "userSelections/humidityTarget": {
-                            "values": {"CUPBOARD": {}, "IRON": {}}
-                        },
-                    },
-                    "SHOES_PR_RUNNINGSHOES": {
-                        "userSelections/drynessValue": {
-                            "values": {"MAXIMUM": {}, "MEDIUM": {}, "MINIMUM": {}}
-                        }
-                        # Note: antiCreaseValue NOT in this program
-                    },
-                }
-            }
-        }
+        mock_appliance = mock_coordinator.data["appliances"]._appliance
+        mock_appliance.data.capabilities = _DRYER_CAPS
 
         # Test COTTON program has antiCreaseValue
         cotton_caps = base_entity._get_program_capabilities("COTTON_PR_COTTONSECO")
@@ -153,16 +252,8 @@ class TestProgramCapabilitiesLookup:
     ):
         """Test program capabilities lookup with cyclePersonalization fallback."""
         # Setup alternative structure through coordinator
-        mock_appliance = mock_coordinator.data["appliances"].get_appliance.return_value
-        mock_appliance.data.capabilities = {
-            "cyclePersonalization/programUID": {
-                "values": {
-                    "SOME_PROGRAM": {
-                        "someControl": {"min": 0, "max": 100, "disabled": False}
-                    }
-                }
-            }
-        }
+        mock_appliance = mock_coordinator.data["appliances"]._appliance
+        mock_appliance.data.capabilities = _CYCLE_CAPS
 
         # Should find capabilities in fallback location
         caps = base_entity._get_program_capabilities("SOME_PROGRAM")
@@ -173,8 +264,8 @@ class TestProgramCapabilitiesLookup:
         self, base_entity, mock_coordinator
     ):
         """Test graceful handling when appliance data is missing."""
-        # Return None for get_appliance
-        mock_coordinator.data["appliances"].get_appliance.return_value = None
+        # No appliance for this PNC
+        mock_coordinator.data["appliances"]._appliance = None
         caps = base_entity._get_program_capabilities("ANY_PROGRAM")
         assert caps == {}
 
@@ -182,333 +273,197 @@ class TestProgramCapabilitiesLookup:
         self, base_entity, mock_coordinator
     ):
         """Test when program doesn't exist in any location."""
-        mock_appliance = mock_coordinator.data["appliances"].get_appliance.return_value
-        mock_appliance.data.capabilities = {
-            "program": {"values": {"EXISTING_PROGRAM": {}}}
-        }
+        mock_appliance = mock_coordinator.data["appliances"]._appliance
+        mock_appliance.data.capabilities = _EXISTING_PROGRAM_CAPS
 
         caps = base_entity._get_program_capabilities("NONEXISTENT_PROGRAM")
         assert caps == {}
 
+    def test_get_program_capabilities_cached_per_capabilities_mapping(
+        self, base_entity, mock_coordinator
+    ):
+        """Test lookups are cached until the capabilities mapping is replaced."""
+        mock_appliance = mock_coordinator.data["appliances"]._appliance
+        mock_appliance.data.capabilities = {
+            "program": {"values": {"BAKE": {"targetTemperatureC": {"max": 200}}}}
+        }
 
-class TestIsSupportedByProgramWithRealData:
-    """Test _is_supported_by_program with real appliance data structures."""
+        first = base_entity._get_program_capabilities("BAKE")
+        assert base_entity._get_program_capabilities("BAKE") is first
 
-    @pytest.fixture
-    def mock_coordinator(self):
-        """Create a mock coordinator."""
-        coordinator = MagicMock()
-        coordinator.hass = MagicMock()
-        coordinator.config_entry = MagicMock()
+        # A refreshed capabilities payload must not be served from the cache
+        mock_appliance.data.capabilities = {
+            "program": {"values": {"BAKE": {"targetTemperatureC": {"max": 250}}}}
+        }
+        caps = base_entity._get_program_capabilities("BAKE")
+        assert caps["targetTemperatureC"]["max"] == 250
 
-        # Setup mock appliances structure
-        mock_appliances = MagicMock()
-        mock_appliance = MagicMock()
-        mock_appliances.get_appliance.return_value = mock_appliance
-        coordinator.data = {"appliances": mock_appliances}
 
-        return coordinator
+class TestIsSupportedByProgramWithRealData:
+    """Test _is_supported_by_program with real appliance data structures."""
 
-    def test_dryer_anticrease_supported_by_cotton_program(self, mock_coordinator):
+    def test_dryer_anticrease_supported_by_cotton_program(
+        self, mock_coordinator, number_entity
+    ):
         """Test antiCreaseValue is supported by COTTON program on dryers."""
-        # Create entity for antiCreaseValue
-        capability = {"access": "readwrite", "type": "number"}
-        entity = ElectroluxNumber(
-            coordinator=mock_coordinator,
-            name="Anti-Crease Duration",
-            config_entry=mock_coordinator.config_entry,
-            pnc_id="916099971",
-            entity_type=NUMBER,
-            entity_name="anti_crease_duration",
-            entity_attr="userSelections/antiCreaseValue",
-            entity_source=None,
-            capability=capability,
-            unit=None,
-            device_class=None,
-            entity_category=None,
-            icon="mdi:hanger",
-        )
+        entity = number_entity("userSelections/antiCreaseValue")
 
         # Setup dryer with COTTON program that supports antiCreaseValue
-        mock_appliance = mock_coordinator.data["appliances"].get_appliance.return_value
-        mock_appliance.data.capabilities = {
-            "userSelections/programUID": {
-                "values": {
-                    "COTTON_PR_COTTONSECO": {
-                        "userSelections/antiCreaseValue": {
-                            "min": 30,
-                            "max": 120,
-                            "step": 30,
-                            "disabled": False,
-                        }
-                    }
-                }
-            }
-        }
+        mock_appliance = mock_coordinator.data["appliances"]._appliance
+        mock_appliance.data.capabilities = _DRYER_CAPS
         entity._reported_state_cache = {
             "userSelections": {"programUID": "COTTON_PR_COTTONSECO"}
         }
         entity._program_cache_key = "COTTON_PR_COTTONSECO"
 
-        # Clear cache to force recomputation
-        entity._is_supported_cache = None
-
         # Test that entity IS supported by this program
         assert entity._is_supported_by_program() is True
 
-    def test_dryer_anticrease_not_supported_by_shoes_program(self, mock_coordinator):
+    def test_dryer_anticrease_not_supported_by_shoes_program(
+        self, mock_coordinator, number_entity
+    ):
         """Test antiCreaseValue is NOT supported by SHOES program on dryers."""
-        capability = {"access": "readwrite", "type": "number"}
-        entity = ElectroluxNumber(
-            coordinator=mock_coordinator,
-            name="Anti-Crease Duration",
-            config_entry=mock_coordinator.config_entry,
-            pnc_id="916099971",
-            entity_type=NUMBER,
-            entity_name="anti_crease_duration",
-            entity_attr="userSelections/antiCreaseValue",
-            entity_source=None,
-            capability=capability,
-            unit=None,
-            device_class=None,
-            entity_category=None,
-            icon="mdi:hanger",
-        )
+        entity = number_entity("userSelections/antiCreaseValue")
 
         # Setup dryer with SHOES program that does NOT support antiCreaseValue
-        mock_appliance = mock_coordinator.data["appliances"].get_appliance.return_value
-        mock_appliance.data.capabilities = {
-            "userSelections/programUID": {
-                "values": {
-                    "SHOES_PR_RUNNINGSHOES": {
-                        "userSelections/drynessValue": {
-                            "values": {"MAXIMUM": {}, "MEDIUM": {}, "MINIMUM": {}}
-                        }
-                        # antiCreaseValue NOT present
-                    }
-                }
-            }
-        }
+        mock_appliance = mock_coordinator.data["appliances"]._appliance
+        mock_appliance.data.capabilities = _DRYER_CAPS
         entity._reported_state_cache = {
             "userSelections": {"programUID": "SHOES_PR_RUNNINGSHOES"}
         }
         entity._program_cache_key = "SHOES_PR_RUNNINGSHOES"
 
-        # Clear cache to force recomputation
-        entity._is_supported_cache = None
-
         # Test that entity is NOT supported by this program
         assert entity._is_supported_by_program() is False
 
-    def test_oven_temperature_supported_by_program(self, mock_coordinator):
+    def test_oven_temperature_supported_by_program(
+        self, mock_coordinator, number_entity
+    ):
         """Test oven temperature control supported by program."""
-        capability = {"access": "readwrite", "type": "number"}
-        entity = ElectroluxNumber(
-            coordinator=mock_coordinator,
-            name="Target Temperature",
-            config_entry=mock_coordinator.config_entry,
-            pnc_id="OVEN_123",
-            entity_type=NUMBER,
-            entity_name="target_temperature",
-            entity_attr="targetTemperatureC",
-            entity_source=None,
-            capability=capability,
-            unit=None,
-            device_class=None,
-            entity_category=None,
-            icon="mdi:thermometer",
-        )
+        entity = number_entity("targetTemperatureC")
 
         # Setup oven with program that supports temperature control
-        mock_appliance = mock_coordinator.data["appliances"].get_appliance.return_value
-        mock_appliance.data.capabilities = {
-            "program": {
-                "values": {
-                    "CONVENTIONAL": {
-                        "targetTemperatureC": {
-                            "min": 30,
-                            "max": 250,
-                            "step": 5,
-                            "disabled": False,
-                        }
-                    }
-                }
-            }
-        }
+        mock_appliance = mock_coordinator.data["appliances"]._appliance
+        mock_appliance.data.capabilities = _OVEN_CAPS
         entity._reported_state_cache = {"program": "CONVENTIONAL"}
         entity._program_cache_key = "CONVENTIONAL"
 
-        # Clear cache
-        entity._is_supported_cache = None
-
         # Test that entity IS supported
         assert entity._is_supported_by_program() is True
 
-
-class TestGetProgramConstraintWithRealData:
-    """Test _get_program_constraint with real appliance data structures."""
-
-    @pytest.fixture
-    def mock_coordinator(self):
-        """Create a mock coordinator."""
-        coordinator = MagicMock()
-        coordinator.hass = MagicMock()
-        coordinator.config_entry = MagicMock()
-
-        # Setup mock appliances structure
-        mock_appliances = MagicMock()
-        mock_appliance = MagicMock()
-        mock_appliances.get_appliance.return_value = mock_appliance
-        coordinator.data = {"appliances": mock_appliances}
-
-        return coordinator
-
-    def test_dryer_anticrease_constraints_from_userselections(self, mock_coordinator):
-        """Test retrieving min/max/step constraints for dryer controls."""
-        capability = {"access": "readwrite", "type": "number"}
-        entity = ElectroluxNumber(
-            coordinator=mock_coordinator,
-            name="Anti-Crease Duration",
-            config_entry=mock_coordinator.config_entry,
-            pnc_id="916099971",
-            entity_type=NUMBER,
-            entity_name="anti_crease_duration",
-            entity_attr="userSelections/antiCreaseValue",
-            entity_source=None,
-            capability=capability,
-            unit=None,
-            device_class=None,
-            entity_category=None,
-            icon="mdi:hanger",
-        )
-
-        # Setup dryer with program-specific constraints
-        mock_appliance = mock_coordinator.data["appliances"].get_appliance.return_value
-        mock_appliance.data.capabilities = {
-            "userSelections/programUID": {
-                "values": {
-                    "COTTON_PR_COTTONSECO": {
-                        "userSelections/antiCreaseValue": {
-                            "min": 30,
-                            "max": 120,
-                            "step": 30,
-                            "default": 30,
-                        }
-                    }
-                }
-            }
+    def test_dryer_anticrease_disabled_by_trigger(
+        self, mock_coordinator, number_entity
+    ):
+        """Test a trigger targeting the entity disables it; others are ignored."""
+        entity = number_entity("userSelections/antiCreaseValue")
+        disable = {"action": {"userSelections/antiCreaseValue": {"disabled": True}}}
+        unrelated = {"action": {"userSelections/humidityTarget": {"disabled": True}}}
+        mock_coordinator.data["appliances"]._appliance.data.capabilities = {
+            **_DRYER_CAPS,
+            "userSelections/extraDry": {"triggers": [unrelated, disable]},
         }
-        entity.reported_state = {
+        entity._reported_state_cache = {
             "userSelections": {"programUID": "COTTON_PR_COTTONSECO"}
         }
 
-        # Clear constraint cache
-        entity._constraints_cache = {}
+        assert entity._is_supported_by_program() is False
+        assert entity._entity_triggers == [("userSelections/extraDry", disable)]
 
-        # Test constraint retrieval
-        assert entity._get_program_constraint("min") == 30
-        assert entity._get_program_constraint("max") == 120
-        assert entity._get_program_constraint("step") == 30
-        assert entity._get_program_constraint("default") == 30
 
-    def test_oven_temperature_constraints_from_program(self, mock_coordinator):
-        """Test retrieving constraints for oven temperature from program location."""
-        capability = {"access": "readwrite", "type": "number"}
-        entity = ElectroluxNumber(
-            coordinator=mock_coordinator,
-            name="Target Temperature",
-            config_entry=mock_coordinator.config_entry,
-            pnc_id="OVEN_123",
-            entity_type=NUMBER,
-            entity_name="target_temperature",
-            entity_attr="targetTemperatureC",
-            entity_source=None,
-            capability=capability,
-            unit=None,
-            device_class=None,
-            entity_category=None,
-            icon="mdi:thermometer",
-        )
+class TestGetProgramConstraintWithRealData:
+    """Test _get_program_constraint with real appliance data structures."""
 
-        # Setup oven with program-specific temperature constraints
-        mock_appliance = mock_coordinator.data["appliances"].get_appliance.return_value
-        mock_appliance.data.capabilities = {
-            "program": {
-                "values": {
-                    "DEFROST": {
-                        "targetTemperatureC": {
-                            "min": 30,
-                            "max": 60,
-                            "step": 5,
-                            "default": 40,
-                        }
-                    }
-                }
-            }
+    @pytest.mark.parametrize(
+        ("caps", "entity_attr", "program_path", "program_id", "expected"),
+        [
+            pytest.param(
+                _DRYER_CAPS,
+                "userSelections/antiCreaseValue",
+                ("userSelections", "programUID"),
+                "COTTON_PR_COTTONSECO",
+                {"min": 30, "max": 120, "step": 30, "default": 30},
+                id="dryer_cotton",
+            ),
+            pytest.param(
+                _DRYER_CAPS,
+                "userSelections/antiCreaseValue",
+                ("userSelections", "programUID"),
+                "SYNTHETIC_PR_SYNTHETICS",
+                {"min": 30, "max": 90, "step": 30},
+                id="dryer_synthetic",
+            ),
+            pytest.param(
+                _OVEN_CAPS,
+                "targetTemperatureC",
+                ("program",),
+                "DEFROST",
+                {"min": 30, "max": 60, "step": 5, "default": 40},
+                id="oven_defrost",
+            ),
+        ],
+    )
+    def test_constraints_for_current_program(
+        self,
+        base_entity,
+        mock_coordinator,
+        monkeypatch,
+        caps,
+        entity_attr,
+        program_path,
+        program_id,
+        expected,
+    ):
+        """Test min/max/step/default come from the current program's capabilities."""
+        monkeypatch.setattr(base_entity, "entity_attr", entity_attr)
+        mock_coordinator.data["appliances"]._appliance.data.capabilities = caps
+
+        # Nest the program id under its reported-state location
+        reported = program_id
+        for key in reversed(program_path):
+            reported = {key: reported}
+        base_entity.reported_state = reported
+
+        for key, value in expected.items():
+            assert base_entity._get_program_constraint(key) == value
+
+    def test_constraints_cached_per_program(self, base_entity, mock_coordinator):
+        """Test switching programs keeps each program's cached constraints."""
+        mock_coordinator.data["appliances"]._appliance.data.capabilities = _DRYER_CAPS
+
+        for program, expected_max in (
+            ("COTTON_PR_COTTONSECO", 120),
+            ("SYNTHETIC_PR_SYNTHETICS", 90),
+            ("COTTON_PR_COTTONSECO", 120),
+        ):
+            base_entity.reported_state = {"userSelections": {"programUID": program}}
+            assert base_entity._get_program_constraint("max") == expected_max
+
+        assert base_entity._constraints_cache == {
+            ("COTTON_PR_COTTONSECO", "max"): 120,
+            ("SYNTHETIC_PR_SYNTHETICS", "max"): 90,
         }
-        entity.reported_state = {"program": "DEFROST"}
 
-        # Clear constraint cache
-        entity._constraints_cache = {}
-
-        # Test constraint retrieval for DEFROST program
-        assert entity._get_program_constraint("min") == 30
-        assert entity._get_program_constraint("max") == 60
-        assert entity._get_program_constraint("step") == 5
-        assert entity._get_program_constraint("default") == 40
-
-    def test_constraints_change_when_program_changes(self, mock_coordinator):
-        """Test that constraints update when switching between programs."""
-        capability = {"access": "readwrite", "type": "number"}
-        entity = ElectroluxNumber(
-            coordinator=mock_coordinator,
-            name="Anti-Crease Duration",
-            config_entry=mock_coordinator.config_entry,
-            pnc_id="916099971",
-            entity_type=NUMBER,
-            entity_name="anti_crease_duration",
-            entity_attr="userSelections/antiCreaseValue",
-            entity_source=None,
-            capability=capability,
-            unit=None,
-            device_class=None,
-            entity_category=None,
-            icon="mdi:hanger",
-        )
+    def test_constraints_refreshed_when_capabilities_replaced(
+        self, base_entity, mock_coordinator
+    ):
+        """Test a replaced capabilities mapping isn't served stale constraints."""
+        appliance_data = mock_coordinator.data["appliances"]._appliance.data
+        appliance_data.capabilities = _DRYER_CAPS
+        base_entity.reported_state = {
+            "userSelections": {"programUID": "COTTON_PR_COTTONSECO"}
+        }
+        assert base_entity._get_program_constraint("min") == 30
+        assert base_entity._get_program_constraint("max") == 120
 
-        # Setup dryer with two programs with different constraints
-        mock_appliance = mock_coordinator.data["appliances"].get_appliance.return_value
-        mock_appliance.data.capabilities = {
+        # e.g. a capability retry delivering a new payload for the same program
+        appliance_data.capabilities = {
             "userSelections/programUID": {
                 "values": {
                     "COTTON_PR_COTTONSECO": {
-                        "userSelections/antiCreaseValue": {
-                            "min": 30,
-                            "max": 120,
-                            "step": 30,
-                        }
-                    },
-                    "SYNTHETIC_PR_SYNTHETICS": {
-                        "userSelections/antiCreaseValue": {
-                            "min": 30,
-                            "max": 90,
-                            "step": 30,
-                        }
-                    },
+                        "userSelections/antiCreaseValue": {"min": 60, "max": 180}
+                    }
                 }
             }
         }
-
-        # Test with COTTON program
-        entity.reported_state = {
-            "userSelections": {"programUID": "COTTON_PR_COTTONSECO"}
-        }
-        entity._constraints_cache = {}
-        assert entity._get_program_constraint("max") == 120
-
-        # Switch to SYNTHETIC program
-        entity.reported_state = {
-            "userSelections": {"programUID": "SYNTHETIC_PR_SYNTHETICS"}
-        }
-        entity._constraints_cache = {}  # Cache would be cleared by program change
-        assert entity._get_program_constraint("max") == 90
+        assert base_entity._get_program_constraint("min") == 60
+        assert base_entity._get_program_constraint("max") == 180
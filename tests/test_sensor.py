@@ -1,7 +1,8 @@
 """Tests for the Electrolux sensor platform."""
 
+from types import MappingProxyType, SimpleNamespace
 from typing import Any, ClassVar
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock, Mock, patch
 
 import pytest
 from homeassistant.components.sensor import SensorDeviceClass
@@ -10,53 +11,124 @@ from homeassistant.const import Platform, UnitOfTemperature, UnitOfTime, UnitOfV
 from custom_components.electrolux.const import SENSOR
 from custom_components.electrolux.sensor import ElectroluxSensor
 
+# Shared read-only literals; tests replace entity.capability rather than mutate it
+_READ_NUMBER_CAP = MappingProxyType({"access": "read", "type": "number"})
+_ALERTS_CAP = MappingProxyType(
+    {
+        "access": "read",
+        "type": "array",
+        "values": MappingProxyType(
+            {
+                "ERROR_CODE_1": "Error code 1 description",
+                "ERROR_CODE_2": "Error code 2 description",
+                "WARNING_CODE_1": "Warning code 1 description",
+            }
+        ),
+    }
+)
+# The only catalog attributes the sensor tests exercise
+_CATALOG_SPEC = ["friendly_name", "value_mapping"]
+_BASE_APPLIANCE_STATUS = MappingProxyType(
+    {
+        "applianceId": "test_appliance",
+        "properties": {"reported": {}, "desired": {}, "metadata": {}},
+    }
+)
+
+
+_SENSOR_DEFAULTS = MappingProxyType(
+    {
+        "name": "Test Sensor",
+        "pnc_id": "TEST_PNC",
+        "entity_type": Platform.SENSOR,
+        "entity_source": None,
+        "unit": None,
+        "device_class": None,
+        "entity_category": None,
+        "icon": "mdi:test",
+    }
+)
+
+
+def _make_sensor(
+    coordinator,
+    *,
+    entity_name: str,
+    capability: Any = _READ_NUMBER_CAP,
+    **overrides: Any,
+) -> ElectroluxSensor:
+    """Build a sensor wired to the coordinator; entity_attr defaults to entity_name."""
+    kwargs = {
+        **_SENSOR_DEFAULTS,
+        "entity_attr": entity_name,
+        **overrides,
+    }
+    entity = ElectroluxSensor(
+        coordinator=coordinator,
+        config_entry=coordinator.config_entry,
+        entity_name=entity_name,
+        capability=capability,
+        **kwargs,
+    )
+    entity.hass = coordinator.hass
+    return entity
 
-@pytest.fixture
+
+@pytest.fixture(scope="module")
 def mock_coordinator():
-    """Create a mock coordinator."""
-    coordinator = MagicMock()
-    coordinator.data = {"appliances": MagicMock()}
-    coordinator.hass = MagicMock()
-    coordinator.config_entry = MagicMock()
-    coordinator._consecutive_auth_failures = 0
-    coordinator._auth_failure_threshold = 3
-    coordinator._last_time_to_end = {}
-    coordinator._last_time_to_end_seen = {}
-    coordinator._deferred_tasks = set()
-    coordinator._deferred_tasks_by_appliance = {}
-    return coordinator
+    """Create the coordinator stub once per module; sensors only read attributes."""
+    return SimpleNamespace(
+        data={"appliances": {}},
+        hass=SimpleNamespace(),
+        config_entry=SimpleNamespace(),
+        api=None,
+    )
+
+
+def _with_reported(
+    entity: ElectroluxSensor, reported: dict[str, Any]
+) -> ElectroluxSensor:
+    """Give a sensor an appliance status and reported state holding ``reported``."""
+    entity.appliance_status = {
+        **_BASE_APPLIANCE_STATUS,
+        "properties": {**_BASE_APPLIANCE_STATUS["properties"], "reported": reported},
+    }
+    entity.reported_state = dict(reported)
+    return entity
 
 
 @pytest.fixture
 def basic_sensor_entity(mock_coordinator) -> ElectroluxSensor:
     """Create a basic sensor entity for testing."""
-    capability = {"access": "read", "type": "number"}
-    entity = ElectroluxSensor(
-        coordinator=mock_coordinator,
-        name="Test Sensor",
-        config_entry=mock_coordinator.config_entry,
-        pnc_id="TEST_PNC",
-        entity_type=Platform.SENSOR,
-        entity_name="testAttribute",
-        entity_attr="testAttribute",
-        entity_source=None,
-        capability=capability,
-        unit=None,
-        device_class=None,
-        entity_category=None,
-        icon="mdi:test",
+    entity = _make_sensor(mock_coordinator, entity_name="testAttribute")
+    return _with_reported(entity, {"testAttribute": 25.0})
+
+
+@pytest.fixture
+def time_to_end_entity(mock_coordinator) -> ElectroluxSensor:
+    """Create a timeToEnd sensor entity."""
+    entity = _make_sensor(
+        mock_coordinator,
+        entity_name="timeToEnd",
+        name="Time to End",
+        device_class=SensorDeviceClass.TIMESTAMP,
+        icon="mdi:timer",
     )
-    entity.hass = mock_coordinator.hass
-    entity.appliance_status = {
-        "applianceId": "test_appliance",
-        "properties": {
-            "reported": {"testAttribute": 25.0},
-            "desired": {},
-            "metadata": {},
-        },
-    }
-    entity.reported_state = {"testAttribute": 25.0}
-    return entity
+    return _with_reported(entity, {"timeToEnd": 3600, "applianceState": "RUNNING"})
+
+
+@pytest.fixture
+def running_time_entity(mock_coordinator) -> ElectroluxSensor:
+    """Create a runningTime sensor entity."""
+    entity = _make_sensor(
+        mock_coordinator,
+        entity_name="runningTime",
+        name="Running Time",
+        unit=UnitOfTime.SECONDS,
+        device_class=SensorDeviceClass.DURATION,
+        icon="mdi:timer",
+    )
+    return _with_reported(entity, {"runningTime": 1800, "applianceState": "RUNNING"})
 
 
 class TestElectroluxSensor:
@@ -72,26 +144,11 @@ class TestElectroluxSensor:
 
     def test_name_fallback_to_catalog(self, mock_coordinator):
         """Test sensor name no longer uses catalog friendly_name directly."""
-        catalog = MagicMock()
+        catalog = Mock(spec=_CATALOG_SPEC)
         catalog.friendly_name = "Custom Sensor"
-        capability = {"access": "read", "type": "number"}
-        entity = ElectroluxSensor(
-            coordinator=mock_coordinator,
-            name="Test Sensor",
-            config_entry=mock_coordinator.config_entry,
-            pnc_id="TEST_PNC",
-            entity_type=Platform.SENSOR,
-            entity_name="testAttribute",
-            entity_attr="testAttribute",
-            entity_source=None,
-            capability=capability,
-            unit=None,
-            device_class=None,
-            entity_category=None,
-            icon="mdi:test",
-            catalog_entry=catalog,
+        entity = _make_sensor(
+            mock_coordinator, entity_name="testAttribute", catalog_entry=catalog
         )
-        entity.hass = mock_coordinator.hass
         assert entity.name == "Test Sensor"
 
     def test_name_fallback_to_internal(self, basic_sensor_entity: ElectroluxSensor):
@@ -120,97 +177,40 @@ class TestElectroluxSensor:
         }
         assert basic_sensor_entity.native_value == 100.0
 
-    def test_suggested_display_precision_temperature(
-        self, basic_sensor_entity: ElectroluxSensor
-    ):
-        """Test display precision for temperature sensors."""
-        basic_sensor_entity.unit = UnitOfTemperature.CELSIUS
-        assert basic_sensor_entity.suggested_display_precision == 2
-
-    def test_suggested_display_precision_time(
-        self, basic_sensor_entity: ElectroluxSensor
-    ):
-        """Test display precision for time sensors."""
-        basic_sensor_entity.unit = UnitOfTime.SECONDS
-        assert basic_sensor_entity.suggested_display_precision == 0
-
-    def test_suggested_display_precision_none(
-        self, basic_sensor_entity: ElectroluxSensor
+    @pytest.mark.parametrize(
+        ("unit", "expected"),
+        [
+            (UnitOfTemperature.CELSIUS, 2),
+            (UnitOfTemperature.FAHRENHEIT, 2),
+            (UnitOfVolume.LITERS, 0),
+            (UnitOfTime.SECONDS, 0),
+            ("unknown", None),
+        ],
+        ids=["celsius", "fahrenheit", "liters", "seconds", "unknown"],
+    )
+    def test_suggested_display_precision(
+        self, basic_sensor_entity: ElectroluxSensor, unit, expected
     ):
-        """Test display precision returns None for unknown units."""
-        basic_sensor_entity.unit = "unknown"
-        assert basic_sensor_entity.suggested_display_precision is None
+        """Test display precision per unit; unknown units have none."""
+        basic_sensor_entity.unit = unit
+        assert basic_sensor_entity.suggested_display_precision == expected
 
 
 class TestTimeToEndSensor:
 
-    @pytest.fixture
-    def time_to_end_entity(self, mock_coordinator) -> ElectroluxSensor:
-        """Create a timeToEnd sensor entity."""
-        capability = {"access": "read", "type": "number"}
-        entity = ElectroluxSensor(
-            coordinator=mock_coordinator,
-            name="Time to End",
-            config_entry=mock_coordinator.config_entry,
-            pnc_id="TEST_PNC",
-            entity_type=Platform.SENSOR,
-            entity_name="timeToEnd",
-            entity_attr="timeToEnd",
-            entity_source=None,
-            capability=capability,
-            unit=None,
-            device_class=SensorDeviceClass.TIMESTAMP,
-            entity_category=None,
-            icon="mdi:timer",
-        )
-        entity.hass = mock_coordinator.hass
-        entity.appliance_status = {
-            "applianceId": "test_appliance",
-            "properties": {
-                "reported": {"timeToEnd": 3600, "applianceState": "RUNNING"},
-                "desired": {},
-                "metadata": {},
-            },
-        }
-        entity.reported_state = {"timeToEnd": 3600, "applianceState": "RUNNING"}
-        return entity
-
-    def test_time_to_end_shows_countdown_when_running(
-        self, time_to_end_entity: ElectroluxSensor
+    @pytest.mark.parametrize(
+        "state", ["RUNNING", "PAUSED", "DELAYED_START", "READY_TO_START"]
+    )
+    def test_time_to_end_shows_countdown(
+        self, time_to_end_entity: ElectroluxSensor, state
     ):
-        """Test timeToEnd returns seconds for countdown display when appliance is running."""
+        """Test timeToEnd returns the raw seconds while a cycle is active or pending."""
+        time_to_end_entity.reported_state["applianceState"] = state
         result = time_to_end_entity.native_value
         assert isinstance(result, int)
         # Should return the raw seconds value for DURATION display
         assert result == 3600
 
-    def test_time_to_end_shows_countdown_when_paused(
-        self, time_to_end_entity: ElectroluxSensor
-    ):
-        """Test timeToEnd returns seconds when appliance is paused."""
-        time_to_end_entity.reported_state["applianceState"] = "PAUSED"
-        result = time_to_end_entity.native_value
-        assert isinstance(result, int)
-        assert result == 3600
-
-    def test_time_to_end_shows_countdown_when_delayed_start(
-        self, time_to_end_entity: ElectroluxSensor
-    ):
-        """Test timeToEnd returns seconds when appliance has delayed start."""
-        time_to_end_entity.reported_state["applianceState"] = "DELAYED_START"
-        result = time_to_end_entity.native_value
-        assert isinstance(result, int)
-        assert result == 3600
-
-    def test_time_to_end_shows_countdown_when_ready_to_start(
-        self, time_to_end_entity: ElectroluxSensor
-    ):
-        """Test timeToEnd returns seconds when appliance is ready with delayed start."""
-        time_to_end_entity.reported_state["applianceState"] = "READY_TO_START"
-        result = time_to_end_entity.native_value
-        assert isinstance(result, int)
-        assert result == 3600
-
     def test_time_to_end_shows_countdown_during_end_of_cycle_anticrease(
         self, time_to_end_entity: ElectroluxSensor
     ):
@@ -243,76 +243,16 @@ class TestTimeToEndSensor:
         time_to_end_entity.reported_state["cyclePhase"] = "UNAVAILABLE"
         assert time_to_end_entity.native_value is None
 
-    def test_time_to_end_none_when_stopped(self, time_to_end_entity: ElectroluxSensor):
-        """Test timeToEnd returns None when appliance is stopped."""
-        time_to_end_entity.reported_state["applianceState"] = "STOPPED"
-        assert time_to_end_entity.native_value is None
-
-    def test_time_to_end_none_when_idle(self, time_to_end_entity: ElectroluxSensor):
-        """Test timeToEnd returns None when appliance is idle."""
-        time_to_end_entity.reported_state["applianceState"] = "IDLE"
-        assert time_to_end_entity.native_value is None
-
-    def test_time_to_end_none_when_off(self, time_to_end_entity: ElectroluxSensor):
-        """Test timeToEnd returns None when appliance is off."""
-        time_to_end_entity.reported_state["applianceState"] = "POWEROFF"
-        assert time_to_end_entity.native_value is None
-
-    def test_time_to_end_none_when_value_is_negative_one(
-        self, time_to_end_entity: ElectroluxSensor
-    ):
-        """Test timeToEnd returns None when value is -1 (not set)."""
-        time_to_end_entity.reported_state["timeToEnd"] = -1
-        assert time_to_end_entity.native_value is None
-
     def test_time_to_end_none_when_value_is_zero(
         self, time_to_end_entity: ElectroluxSensor
     ):
-        """Test timeToEnd returns None when value is 0."""
+        """Test timeToEnd returns None when value is 0 (unlike runningTime)."""
         time_to_end_entity.reported_state["timeToEnd"] = 0
         assert time_to_end_entity.native_value is None
 
-    def test_time_to_end_none_when_value_is_none(
-        self, time_to_end_entity: ElectroluxSensor
-    ):
-        """Test timeToEnd returns None when value is None."""
-        time_to_end_entity.reported_state["timeToEnd"] = None
-        assert time_to_end_entity.native_value is None
-
 
 class TestRunningTimeSensor:
 
-    @pytest.fixture
-    def running_time_entity(self, mock_coordinator) -> ElectroluxSensor:
-        """Create a runningTime sensor entity."""
-        capability = {"access": "read", "type": "number"}
-        entity = ElectroluxSensor(
-            coordinator=mock_coordinator,
-            name="Running Time",
-            config_entry=mock_coordinator.config_entry,
-            pnc_id="TEST_PNC",
-            entity_type=Platform.SENSOR,
-            entity_name="runningTime",
-            entity_attr="runningTime",
-            entity_source=None,
-            capability=capability,
-            unit=UnitOfTime.SECONDS,
-            device_class=SensorDeviceClass.DURATION,
-            entity_category=None,
-            icon="mdi:timer",
-        )
-        entity.hass = mock_coordinator.hass
-        entity.appliance_status = {
-            "applianceId": "test_appliance",
-            "properties": {
-                "reported": {"runningTime": 1800, "applianceState": "RUNNING"},
-                "desired": {},
-                "metadata": {},
-            },
-        }
-        entity.reported_state = {"runningTime": 1800, "applianceState": "RUNNING"}
-        return entity
-
     def test_running_time_shows_elapsed_when_running(
         self, running_time_entity: ElectroluxSensor
     ):
@@ -328,23 +268,6 @@ class TestRunningTimeSensor:
         result = running_time_entity.native_value
         assert result == 1800
 
-    def test_running_time_none_when_stopped(
-        self, running_time_entity: ElectroluxSensor
-    ):
-        """Test runningTime returns None when appliance is stopped."""
-        running_time_entity.reported_state["applianceState"] = "STOPPED"
-        assert running_time_entity.native_value is None
-
-    def test_running_time_none_when_idle(self, running_time_entity: ElectroluxSensor):
-        """Test runningTime returns None when appliance is idle."""
-        running_time_entity.reported_state["applianceState"] = "IDLE"
-        assert running_time_entity.native_value is None
-
-    def test_running_time_none_when_off(self, running_time_entity: ElectroluxSensor):
-        """Test runningTime returns None when appliance is off."""
-        running_time_entity.reported_state["applianceState"] = "POWEROFF"
-        assert running_time_entity.native_value is None
-
     def test_running_time_zero_when_just_started(
         self, running_time_entity: ElectroluxSensor
     ):
@@ -353,19 +276,33 @@ class TestRunningTimeSensor:
         # 0 is valid for just-started appliance
         assert running_time_entity.native_value == 0
 
-    def test_running_time_none_when_value_is_negative_one(
-        self, running_time_entity: ElectroluxSensor
-    ):
-        """Test runningTime returns None when value is -1 (not set)."""
-        running_time_entity.reported_state["runningTime"] = -1
-        assert running_time_entity.native_value is None
 
-    def test_running_time_none_when_value_is_none(
-        self, running_time_entity: ElectroluxSensor
-    ):
-        """Test runningTime returns None when value is None."""
-        running_time_entity.reported_state["runningTime"] = None
-        assert running_time_entity.native_value is None
+class TestDurationSensorGuards:
+    """Guards shared by the timeToEnd and runningTime sensors."""
+
+    _DURATION_ENTITIES = pytest.mark.parametrize(
+        ("entity_fixture", "attr"),
+        [
+            ("time_to_end_entity", "timeToEnd"),
+            ("running_time_entity", "runningTime"),
+        ],
+    )
+
+    @_DURATION_ENTITIES
+    @pytest.mark.parametrize("state", ["STOPPED", "IDLE", "POWEROFF"])
+    def test_none_when_inactive(self, request, entity_fixture, attr, state):
+        """Test the sensor returns None when the appliance is stopped, idle or off."""
+        entity = request.getfixturevalue(entity_fixture)
+        entity.reported_state["applianceState"] = state
+        assert entity.native_value is None
+
+    @_DURATION_ENTITIES
+    @pytest.mark.parametrize("value", [-1, None], ids=["unset", "none"])
+    def test_none_for_invalid_value(self, request, entity_fixture, attr, value):
+        """Test the sensor returns None when its value is unset (-1) or None."""
+        entity = request.getfixturevalue(entity_fixture)
+        entity.reported_state[attr] = value
+        assert entity.native_value is None
 
 
 class TestAlertsSensor:
@@ -373,42 +310,18 @@ class TestAlertsSensor:
     @pytest.fixture
     def alerts_entity(self, mock_coordinator) -> ElectroluxSensor:
         """Create an alerts sensor entity."""
-        capability = {
-            "access": "read",
-            "type": "array",
-            "values": {
-                "ERROR_CODE_1": "Error code 1 description",
-                "ERROR_CODE_2": "Error code 2 description",
-                "WARNING_CODE_1": "Warning code 1 description",
-            },
-        }
-        entity = ElectroluxSensor(
-            coordinator=mock_coordinator,
-            name="Alerts",
-            config_entry=mock_coordinator.config_entry,
-            pnc_id="TEST_PNC",
-            entity_type=Platform.SENSOR,
+        entity = _make_sensor(
+            mock_coordinator,
             entity_name="alerts",
-            entity_attr="alerts",
-            entity_source=None,
-            capability=capability,
-            unit=None,
-            device_class=None,
-            entity_category=None,
+            name="Alerts",
+            capability=_ALERTS_CAP,
             icon="mdi:alert",
         )
-        entity.hass = mock_coordinator.hass
-        entity.config_entry = mock_coordinator.config_entry
-        entity.appliance_status = {
-            "applianceId": "test_appliance",
-            "properties": {
-                "reported": {"alerts": []},
-                "desired": {},
-                "metadata": {},
-            },
-        }
-        entity.reported_state = {"alerts": []}
-        return entity
+        # Active alerts raise notifications through hass services and read the
+        # notification options from the entry, so these two stay mocks
+        entity.hass = MagicMock()
+        entity.config_entry = MagicMock()
+        return _with_reported(entity, {"alerts": []})
 
     def test_alerts_returns_count_when_list(self, alerts_entity: ElectroluxSensor):
         """Test alerts sensor returns count of alerts."""
@@ -491,41 +404,20 @@ class TestValueMapping:
     @pytest.fixture
     def mapped_sensor_entity(self, mock_coordinator) -> ElectroluxSensor:
         """Create a sensor entity with value mapping."""
-        catalog = MagicMock()
+        catalog = Mock(spec=_CATALOG_SPEC)
         catalog.friendly_name = "Appliance State"
         catalog.value_mapping = {
             1: "RUNNING",
             2: "PAUSED",
             3: "STOPPED",
         }
-        capability = {"access": "read", "type": "number"}
-        entity = ElectroluxSensor(
-            coordinator=mock_coordinator,
-            name="Mapped Sensor",
-            config_entry=mock_coordinator.config_entry,
-            pnc_id="TEST_PNC",
-            entity_type=Platform.SENSOR,
+        entity = _make_sensor(
+            mock_coordinator,
             entity_name="testAttribute",
-            entity_attr="testAttribute",
-            entity_source=None,
-            capability=capability,
-            unit=None,
-            device_class=None,
-            entity_category=None,
-            icon="mdi:test",
+            name="Mapped Sensor",
             catalog_entry=catalog,
         )
-        entity.hass = mock_coordinator.hass
-        entity.appliance_status = {
-            "applianceId": "test_appliance",
-            "properties": {
-                "reported": {"testAttribute": 1},
-                "desired": {},
-                "metadata": {},
-            },
-        }
-        entity.reported_state = {"testAttribute": 1}
-        return entity
+        return _with_reported(entity, {"testAttribute": 1})
 
     def test_value_mapping_converts_integer_to_string(
         self, mapped_sensor_entity: ElectroluxSensor
@@ -559,33 +451,15 @@ class TestTimeUnitConversion:
     @pytest.fixture
     def time_sensor_entity(self, mock_coordinator) -> ElectroluxSensor:
         """Create a time sensor entity."""
-        capability = {"access": "read", "type": "number"}
-        entity = ElectroluxSensor(
-            coordinator=mock_coordinator,
-            name="Time Sensor",
-            config_entry=mock_coordinator.config_entry,
-            pnc_id="TEST_PNC",
-            entity_type=Platform.SENSOR,
+        entity = _make_sensor(
+            mock_coordinator,
             entity_name="testAttribute",
-            entity_attr="testAttribute",
-            entity_source=None,
-            capability=capability,
+            name="Time Sensor",
             unit=UnitOfTime.MINUTES,
-            device_class=None,
-            entity_category=None,
             icon="mdi:timer",
         )
-        entity.hass = mock_coordinator.hass
-        entity.appliance_status = {
-            "applianceId": "test_appliance",
-            "properties": {
-                "reported": {"testAttribute": 180},  # 180 seconds = 3 minutes
-                "desired": {},
-                "metadata": {},
-            },
-        }
-        entity.reported_state = {"testAttribute": 180}
-        return entity
+        # 180 seconds = 3 minutes
+        return _with_reported(entity, {"testAttribute": 180})
 
     def test_time_conversion_seconds_to_minutes(
         self, time_sensor_entity: ElectroluxSensor
@@ -654,18 +528,6 @@ class TestConstantAccessSensors:
 class TestSensorMissingCoverage:
     """Tests targeting the remaining missed lines in sensor.py."""
 
-    # ── suggested_display_precision ──────────────────────────────────────────
-
-    def test_precision_fahrenheit_returns_2(self, basic_sensor_entity):
-        """Line 77 — Fahrenheit precision is 2."""
-        basic_sensor_entity.unit = UnitOfTemperature.FAHRENHEIT
-        assert basic_sensor_entity.suggested_display_precision == 2
-
-    def test_precision_liters_returns_0(self, basic_sensor_entity):
-        """Line 79 — Liters precision is 0."""
-        basic_sensor_entity.unit = UnitOfVolume.LITERS
-        assert basic_sensor_entity.suggested_display_precision == 0
-
     # ── native_value: offline path ────────────────────────────────────────────
 
     def test_native_value_none_when_offline_non_connectivity_sensor(
@@ -754,22 +616,14 @@ class TestSensorMissingCoverage:
         self, mock_coordinator
     ):
         """Lines 227-230 — when time_seconds_to_minutes returns None, error is logged and None returned."""
-        entity = ElectroluxSensor(
-            coordinator=mock_coordinator,
-            name="Time Sensor",
-            config_entry=mock_coordinator.config_entry,
-            pnc_id="TEST_PNC",
-            entity_type=Platform.SENSOR,
+        entity = _make_sensor(
+            mock_coordinator,
             entity_name="testAttribute",
-            entity_attr="testAttribute",
-            entity_source=None,
+            name="Time Sensor",
             capability={"access": "read"},
             unit=UnitOfTime.MINUTES,
-            device_class=None,
-            entity_category=None,
             icon="mdi:timer",
         )
-        entity.hass = mock_coordinator.hass
         entity.reported_state = {
             "testAttribute": 300
         }  # valid value (not 0 or sentinel)
@@ -782,22 +636,14 @@ class TestSensorMissingCoverage:
 
     def test_minutes_unit_logs_warning_for_non_numeric_value(self, mock_coordinator):
         """Line 233 — non-numeric value with MINUTES unit logs warning and falls through."""
-        entity = ElectroluxSensor(
-            coordinator=mock_coordinator,
-            name="Time Sensor",
-            config_entry=mock_coordinator.config_entry,
-            pnc_id="TEST_PNC",
-            entity_type=Platform.SENSOR,
+        entity = _make_sensor(
+            mock_coordinator,
             entity_name="testAttribute",
-            entity_attr="testAttribute",
-            entity_source=None,
+            name="Time Sensor",
             capability={"access": "read"},
             unit=UnitOfTime.MINUTES,
-            device_class=None,
-            entity_category=None,
             icon="mdi:timer",
         )
-        entity.hass = mock_coordinator.hass
         entity.reported_state = {"testAttribute": "not_a_number"}
         # Should not raise — logs a warning and returns title-cased string
         result = entity.native_value
@@ -842,22 +688,14 @@ class TestRvcMapZoneSensors:
     """Read-only Pure i9 map/zone sensors (#130)."""
 
     def _sensor(self, mock_coordinator, entity_attr, entity_source, reported):
-        entity = ElectroluxSensor(
-            coordinator=mock_coordinator,
-            name="Test",
-            config_entry=mock_coordinator.config_entry,
-            pnc_id="TEST_PNC",
-            entity_type=SENSOR,
+        entity = _make_sensor(
+            mock_coordinator,
             entity_name=entity_attr,
-            entity_attr=entity_attr,
+            name="Test",
             entity_source=entity_source,
             capability={"access": "read", "type": "string"},
-            unit=None,
-            device_class=None,
-            entity_category=None,
             icon="mdi:map",
         )
-        entity.hass = mock_coordinator.hass
         entity.appliance_status = {
             "applianceId": "test_appliance",
             "properties": {"reported": reported, "desired": {}, "metadata": {}},
@@ -944,22 +782,13 @@ class TestWMApplianceStateSensor:
 
     def _make_entity(self, mock_coordinator) -> ElectroluxSensor:
         capability = {"access": "read", "type": "string"}
-        entity = ElectroluxSensor(
-            coordinator=mock_coordinator,
-            name="Test WM",
-            config_entry=mock_coordinator.config_entry,
-            pnc_id="TEST_PNC",
-            entity_type=Platform.SENSOR,
+        entity = _make_sensor(
+            mock_coordinator,
             entity_name="applianceState",
-            entity_attr="applianceState",
-            entity_source=None,
+            name="Test WM",
             capability=capability,
-            unit=None,
-            device_class=None,
-            entity_category=None,
             icon="mdi:washing-machine",
         )
-        entity.hass = mock_coordinator.hass
         entity.appliance_status = {
             "applianceId": "test_appliance",
             "properties": {
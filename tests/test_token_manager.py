@@ -1,19 +1,59 @@
 """Test ElectroluxTokenManager token refresh with 401 Unauthorized response."""
 
 import asyncio
+import base64
+import json
 import time
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
+import jwt as pyjwt
 import pytest
+from homeassistant.exceptions import ConfigEntryAuthFailed
 
-from custom_components.electrolux.util import ElectroluxTokenManager
+from custom_components.electrolux.token_manager import ElectroluxTokenManager
 
 
 class TestElectroluxTokenManager401:
     """Test token refresh behavior with 401 Unauthorized response."""
 
+    @pytest.fixture
+    def token_manager(self):
+        """Return a token manager holding the standard test credentials."""
+        return ElectroluxTokenManager(
+            access_token="test_access",
+            refresh_token="test_refresh",
+            api_key="test_api_key",
+        )
+
+    @pytest.fixture(autouse=True)
+    def jwt_decode_mock(self, monkeypatch):
+        """Patch jwt.decode for each test; it decodes for real until configured."""
+        mock = MagicMock(wraps=pyjwt.decode)
+        monkeypatch.setattr(
+            "custom_components.electrolux.token_manager.jwt.decode", mock
+        )
+        return mock
+
+    @pytest.fixture(autouse=True)
+    def request_mock(self, monkeypatch):
+        """Patch the SDK HTTP request so no test reaches the network."""
+        mock = AsyncMock()
+        monkeypatch.setattr("custom_components.electrolux.token_manager.request", mock)
+        return mock
+
+    @pytest.fixture(autouse=True)
+    def time_mock(self, monkeypatch):
+        """Patch time.time for each test; it reads the real clock until configured."""
+        mock = MagicMock(wraps=time.time)
+        monkeypatch.setattr(
+            "custom_components.electrolux.token_manager.time.time", mock
+        )
+        return mock
+
     @pytest.mark.asyncio
-    async def test_get_auth_data_401_triggers_callback(self):
+    async def test_get_auth_data_401_triggers_callback(
+        self, jwt_decode_mock, request_mock, token_manager
+    ):
         """Test that get_auth_data triggers auth error callback on 401 during refresh."""
         # Create mock callback to track if it's called
         mock_callback = AsyncMock()
@@ -22,40 +62,28 @@ class TestElectroluxTokenManager401:
         expired_time = int(time.time()) - 3600
         mock_jwt_payload = {"exp": expired_time, "sub": "test_user"}
 
-        # Create token manager instance
-        token_manager = ElectroluxTokenManager(
-            access_token="test_access",
-            refresh_token="test_refresh",
-            api_key="test_api_key",
-        )
-
         # Set the auth error callback
         token_manager.set_auth_error_callback(mock_callback)
 
         # Mock the request to raise a 401 Unauthorized error
         mock_exception = Exception("401 Unauthorized")
-        with (
-            patch(
-                "custom_components.electrolux.token_manager.jwt.decode",
-                return_value=mock_jwt_payload,
-            ),
-            patch(
-                "custom_components.electrolux.token_manager.request",
-                side_effect=mock_exception,
-            ),
-        ):
-            # Call get_auth_data (this will trigger refresh due to expired token)
-            # SDK raises exception when refresh fails
-            with pytest.raises(Exception, match="Token expired and refresh failed"):
-                await token_manager.get_auth_data()
+        jwt_decode_mock.return_value = mock_jwt_payload
+        request_mock.side_effect = mock_exception
 
-            # Assert that the auth error callback was triggered with the error message
-            mock_callback.assert_called_once()
-            call_args = mock_callback.call_args[0][0]  # First positional argument
-            assert "401 Unauthorized" in call_args
+        # Call get_auth_data (this will trigger refresh due to expired token)
+        # SDK raises exception when refresh fails
+        with pytest.raises(Exception, match="Token expired and refresh failed"):
+            await token_manager.get_auth_data()
+
+        # Assert that the auth error callback was triggered with the error message
+        mock_callback.assert_called_once()
+        call_args = mock_callback.call_args[0][0]  # First positional argument
+        assert "401 Unauthorized" in call_args
 
     @pytest.mark.asyncio
-    async def test_get_auth_data_400_invalid_grant_triggers_callback(self):
+    async def test_get_auth_data_400_invalid_grant_triggers_callback(
+        self, jwt_decode_mock, request_mock, token_manager
+    ):
         """Test that get_auth_data triggers auth error callback on 400 Bad Request with invalid_grant."""
         # Create mock callback to track if it's called
         mock_callback = AsyncMock()
@@ -64,40 +92,28 @@ class TestElectroluxTokenManager401:
         expired_time = int(time.time()) - 3600
         mock_jwt_payload = {"exp": expired_time, "sub": "test_user"}
 
-        # Create token manager instance
-        token_manager = ElectroluxTokenManager(
-            access_token="test_access",
-            refresh_token="test_refresh",
-            api_key="test_api_key",
-        )
-
         # Set the auth error callback
         token_manager.set_auth_error_callback(mock_callback)
 
         # Mock the request to raise a 400 Bad Request with invalid_grant error
         mock_exception = Exception("400 Bad Request: invalid grant")
-        with (
-            patch(
-                "custom_components.electrolux.token_manager.jwt.decode",
-                return_value=mock_jwt_payload,
-            ),
-            patch(
-                "custom_components.electrolux.token_manager.request",
-                side_effect=mock_exception,
-            ),
-        ):
-            # Call get_auth_data (this will trigger refresh)
-            # SDK raises exception when refresh fails
-            with pytest.raises(Exception, match="Token expired and refresh failed"):
-                await token_manager.get_auth_data()
+        jwt_decode_mock.return_value = mock_jwt_payload
+        request_mock.side_effect = mock_exception
+
+        # Call get_auth_data (this will trigger refresh)
+        # SDK raises exception when refresh fails
+        with pytest.raises(Exception, match="Token expired and refresh failed"):
+            await token_manager.get_auth_data()
 
-            # Assert that the auth error callback was triggered with the error message
-            mock_callback.assert_called_once()
-            call_args = mock_callback.call_args[0][0]  # First positional argument
-            assert "invalid grant" in call_args
+        # Assert that the auth error callback was triggered with the error message
+        mock_callback.assert_called_once()
+        call_args = mock_callback.call_args[0][0]  # First positional argument
+        assert "invalid grant" in call_args
 
     @pytest.mark.asyncio
-    async def test_get_auth_data_200_refreshes_token(self):
+    async def test_get_auth_data_200_refreshes_token(
+        self, jwt_decode_mock, request_mock, token_manager
+    ):
         """Test that get_auth_data successfully refreshes expired token."""
         # Create expired JWT payload (expired 1 hour ago)
         expired_time = int(time.time()) - 3600
@@ -107,13 +123,6 @@ class TestElectroluxTokenManager401:
         fresh_time = int(time.time()) + 43200
         mock_fresh_jwt = {"exp": fresh_time, "sub": "test_user"}
 
-        # Create token manager instance
-        token_manager = ElectroluxTokenManager(
-            access_token="test_access",
-            refresh_token="test_refresh",
-            api_key="test_api_key",
-        )
-
         # Mock the request to return a successful 200 OK response
         mock_response = {
             "accessToken": "new_access_token",
@@ -131,29 +140,24 @@ class TestElectroluxTokenManager401:
             else:
                 return mock_fresh_jwt
 
-        with (
-            patch(
-                "custom_components.electrolux.token_manager.jwt.decode",
-                side_effect=mock_jwt_decode,
-            ),
-            patch(
-                "custom_components.electrolux.token_manager.request",
-                return_value=mock_response,
-            ),
-        ):
-            # Call get_auth_data (this will trigger refresh due to expired token)
-            auth_data = await token_manager.get_auth_data()
+        jwt_decode_mock.side_effect = mock_jwt_decode
+        request_mock.return_value = mock_response
 
-            # Assert that the returned auth data has the new tokens
-            assert auth_data.access_token == "new_access_token"
-            assert auth_data.refresh_token == "new_refresh_token"
-            assert auth_data.api_key == "test_api_key"
+        # Call get_auth_data (this will trigger refresh due to expired token)
+        auth_data = await token_manager.get_auth_data()
 
-            # Verify token is now considered valid
-            assert token_manager.is_token_valid() is True
+        # Assert that the returned auth data has the new tokens
+        assert auth_data.access_token == "new_access_token"
+        assert auth_data.refresh_token == "new_refresh_token"
+        assert auth_data.api_key == "test_api_key"
+
+        # Verify token is now considered valid
+        assert token_manager.is_token_valid() is True
 
     @pytest.mark.asyncio
-    async def test_concurrent_sdk_refresh_calls(self):
+    async def test_concurrent_sdk_refresh_calls(
+        self, jwt_decode_mock, request_mock, time_mock, token_manager
+    ):
         """Test concurrent refresh_token() calls don't cause race conditions."""
         fixed_time = 1000000000
 
@@ -165,19 +169,13 @@ class TestElectroluxTokenManager401:
         fresh_time = fixed_time + 43200  # Expires in 12 hours
         mock_fresh_jwt = {"exp": fresh_time, "sub": "test_user"}
 
-        token_manager = ElectroluxTokenManager(
-            access_token="test_access",
-            refresh_token="test_refresh",
-            api_key="test_api_key",
-        )
-
         refresh_call_count = 0
         jwt_call_count = 0
 
         async def mock_request(method, url, json_body):
             nonlocal refresh_call_count
             refresh_call_count += 1
-            await asyncio.sleep(0.1)  # Simulate network delay
+            await asyncio.sleep(0)  # Yield like a network round-trip would
             return {
                 "accessToken": f"new_access_{refresh_call_count}",
                 "refreshToken": f"new_refresh_{refresh_call_count}",
@@ -194,42 +192,35 @@ class TestElectroluxTokenManager401:
             else:
                 return mock_expired_jwt
 
-        with (
-            patch(
-                "custom_components.electrolux.token_manager.jwt.decode",
-                side_effect=mock_jwt_decode,
-            ),
-            patch(
-                "custom_components.electrolux.token_manager.request",
-                side_effect=mock_request,
-            ),
-            patch(
-                "custom_components.electrolux.token_manager.time.time",
-                return_value=1000000000,
-            ),
-        ):
-            # Simulate SDK calling refresh_token() directly from 3 concurrent 401 responses
-            results = await asyncio.gather(
-                token_manager.refresh_token(),
-                token_manager.refresh_token(),
-                token_manager.refresh_token(),
-            )
-
-            # All should succeed (no "Invalid grant")
-            assert all(results), "All concurrent refresh calls should succeed"
-
-            # Should only make ONE actual HTTP request (others wait and skip due to lock)
-            assert (
-                refresh_call_count == 1
-            ), f"Expected 1 HTTP request, got {refresh_call_count}"
-
-            # Verify tokens were updated
-            auth_data = await token_manager.get_auth_data()
-            assert "new_access_1" in auth_data.access_token
-            assert "new_refresh_1" in auth_data.refresh_token
+        jwt_decode_mock.side_effect = mock_jwt_decode
+        request_mock.side_effect = mock_request
+        time_mock.return_value = 1000000000
+
+        # Simulate SDK calling refresh_token() directly from 3 concurrent 401 responses
+        results = await asyncio.gather(
+            token_manager.refresh_token(),
+            token_manager.refresh_token(),
+            token_manager.refresh_token(),
+        )
+
+        # All should succeed (no "Invalid grant")
+        assert all(results), "All concurrent refresh calls should succeed"
+
+        # Should only make ONE actual HTTP request (others await the same task)
+        assert (
+            refresh_call_count == 1
+        ), f"Expected 1 HTTP request, got {refresh_call_count}"
+        assert token_manager._refresh_task is None
+
+        # Verify tokens were updated
+        auth_data = await token_manager.get_auth_data()
+        assert "new_access_1" in auth_data.access_token
+        assert "new_refresh_1" in auth_data.refresh_token
 
     @pytest.mark.asyncio
-    async def test_proactive_refresh_15_min_buffer(self):
+    async def test_proactive_refresh_15_min_buffer(
+        self, jwt_decode_mock, request_mock, token_manager
+    ):
         """Test that tokens are proactively refreshed 15 minutes before expiry."""
         current_time = int(time.time())
         # Token expires in 10 minutes (600 seconds) - should trigger refresh
@@ -240,12 +231,6 @@ class TestElectroluxTokenManager401:
         fresh_time = current_time + 43200
         mock_fresh_jwt = {"exp": fresh_time, "sub": "test_user"}
 
-        token_manager = ElectroluxTokenManager(
-            access_token="test_access",
-            refresh_token="test_refresh",
-            api_key="test_api_key",
-        )
-
         mock_response = {
             "accessToken": "refreshed_token",
             "refreshToken": "refreshed_refresh",
@@ -265,37 +250,26 @@ class TestElectroluxTokenManager401:
             else:
                 return mock_fresh_jwt
 
-        with (
-            patch(
-                "custom_components.electrolux.token_manager.jwt.decode",
-                side_effect=mock_jwt_decode,
-            ),
-            patch(
-                "custom_components.electrolux.token_manager.request",
-                side_effect=mock_request,
-            ),
-        ):
-            # SDK's get_auth_data() should trigger proactive refresh
-            auth_data = await token_manager.get_auth_data()
+        jwt_decode_mock.side_effect = mock_jwt_decode
+        request_mock.side_effect = mock_request
 
-            # Verify refresh was called proactively
-            assert refresh_called, "Proactive refresh should have been triggered"
-            assert auth_data.access_token == "refreshed_token"
+        # SDK's get_auth_data() should trigger proactive refresh
+        auth_data = await token_manager.get_auth_data()
+
+        # Verify refresh was called proactively
+        assert refresh_called, "Proactive refresh should have been triggered"
+        assert auth_data.access_token == "refreshed_token"
 
     @pytest.mark.asyncio
-    async def test_valid_token_no_refresh(self):
+    async def test_valid_token_no_refresh(
+        self, jwt_decode_mock, request_mock, token_manager
+    ):
         """Test that valid tokens don't trigger unnecessary refresh."""
         current_time = int(time.time())
         # Token expires in 2 hours (7200 seconds) - should NOT trigger refresh
         valid_time = current_time + 7200
         mock_valid_jwt = {"exp": valid_time, "sub": "test_user"}
 
-        token_manager = ElectroluxTokenManager(
-            access_token="test_access",
-            refresh_token="test_refresh",
-            api_key="test_api_key",
-        )
-
         refresh_called = False
 
         async def mock_request(method, url, json_body):
@@ -303,28 +277,23 @@ class TestElectroluxTokenManager401:
             refresh_called = True
             return {}
 
-        with (
-            patch(
-                "custom_components.electrolux.token_manager.jwt.decode",
-                return_value=mock_valid_jwt,
-            ),
-            patch(
-                "custom_components.electrolux.token_manager.request",
-                side_effect=mock_request,
-            ),
-        ):
-            # Should return auth data without refresh
-            auth_data = await token_manager.get_auth_data()
+        jwt_decode_mock.return_value = mock_valid_jwt
+        request_mock.side_effect = mock_request
 
-            # Verify NO refresh was called
-            assert not refresh_called, "Valid token should not trigger refresh"
-            assert auth_data.access_token == "test_access"
+        # Should return auth data without refresh
+        auth_data = await token_manager.get_auth_data()
+
+        # Verify NO refresh was called
+        assert not refresh_called, "Valid token should not trigger refresh"
+        assert auth_data.access_token == "test_access"
 
     @pytest.mark.asyncio
-    async def test_refresh_cooldown_after_failure(self):
+    async def test_refresh_cooldown_after_failure(
+        self, jwt_decode_mock, request_mock, time_mock, token_manager
+    ):
         """Test that failed refresh sets up cooldown tracking.
 
-        This verifies that _last_failed_refresh is set and _consecutive_failures
+        This verifies that _next_allowed_refresh_at is set and _consecutive_failures
         is tracked correctly. The actual cooldown enforcement is tested in
         test_exponential_backoff_on_repeated_failures.
         """
@@ -341,43 +310,27 @@ class TestElectroluxTokenManager401:
             refresh_attempts += 1
             raise mock_exception
 
-        # Patch time.time() before creating TokenManager to avoid clock skew detection
-        # during initialization
-        with (
-            patch(
-                "custom_components.electrolux.token_manager.jwt.decode",
-                return_value=mock_expiring_jwt,
-            ),
-            patch(
-                "custom_components.electrolux.token_manager.request",
-                side_effect=mock_request,
-            ),
-            patch(
-                "custom_components.electrolux.token_manager.time.time",
-                return_value=fixed_time,
-            ),
-        ):
-            token_manager = ElectroluxTokenManager(
-                access_token="test_access",
-                refresh_token="test_refresh",
-                api_key="test_api_key",
-            )
+        jwt_decode_mock.return_value = mock_expiring_jwt
+        request_mock.side_effect = mock_request
+        time_mock.return_value = fixed_time
 
-            # Verify initial state
-            assert token_manager._consecutive_failures == 0
-            assert token_manager._last_failed_refresh == 0
+        # Verify initial state
+        assert token_manager._consecutive_failures == 0
+        assert token_manager._next_allowed_refresh_at == 0
 
-            # First refresh fails (token is expiring, triggers refresh)
-            result1 = await token_manager.refresh_token()
-            assert result1 is False
-            assert refresh_attempts == 1
+        # First refresh fails (token is expiring, triggers refresh)
+        result1 = await token_manager.refresh_token()
+        assert result1 is False
+        assert refresh_attempts == 1
 
-            # Verify cooldown tracking is set up correctly
-            assert token_manager._consecutive_failures == 1
-            assert token_manager._last_failed_refresh == fixed_time
+        # Verify cooldown tracking is set up correctly
+        assert token_manager._consecutive_failures == 1
+        assert token_manager._next_allowed_refresh_at == fixed_time + 120
 
     @pytest.mark.asyncio
-    async def test_token_update_callback_with_expiry(self):
+    async def test_token_update_callback_with_expiry(
+        self, jwt_decode_mock, request_mock, time_mock, token_manager
+    ):
         """Test that token update callback receives expiry timestamp."""
         fixed_time = 1000000000
         expired_time = fixed_time - 3600  # Expired 1 hour ago
@@ -386,12 +339,6 @@ class TestElectroluxTokenManager401:
         fresh_time = fixed_time + 43200  # Expires in 12 hours
         mock_fresh_jwt = {"exp": fresh_time, "sub": "test_user"}
 
-        token_manager = ElectroluxTokenManager(
-            access_token="test_access",
-            refresh_token="test_refresh",
-            api_key="test_api_key",
-        )
-
         callback_data = {}
 
         def mock_callback_with_expiry(access_token, refresh_token, api_key, expires_at):
@@ -415,30 +362,20 @@ class TestElectroluxTokenManager401:
             else:
                 return mock_expired_jwt
 
-        with (
-            patch(
-                "custom_components.electrolux.token_manager.jwt.decode",
-                side_effect=mock_jwt_decode,
-            ),
-            patch(
-                "custom_components.electrolux.token_manager.request",
-                return_value=mock_response,
-            ),
-            patch(
-                "custom_components.electrolux.token_manager.time.time",
-                return_value=fixed_time,
-            ),
-        ):
-            # Trigger refresh via get_auth_data since token is expired
-            await token_manager.get_auth_data()
+        jwt_decode_mock.side_effect = mock_jwt_decode
+        request_mock.return_value = mock_response
+        time_mock.return_value = fixed_time
 
-            # Verify callback was called with expiry timestamp
-            assert callback_data["access_token"] == "new_token"
-            assert callback_data["refresh_token"] == "new_refresh"
-            assert callback_data["expires_at"] == fixed_time + 43200
+        # Trigger refresh via get_auth_data since token is expired
+        await token_manager.get_auth_data()
+
+        # Verify callback was called with expiry timestamp
+        assert callback_data["access_token"] == "new_token"
+        assert callback_data["refresh_token"] == "new_refresh"
+        assert callback_data["expires_at"] == fixed_time + 43200
 
     @pytest.mark.asyncio
-    async def test_jwt_decode_failure_forces_refresh(self):
+    async def test_jwt_decode_failure_forces_refresh(self, jwt_decode_mock):
         """Test that JWT decode failure marks token as invalid and forces refresh."""
         token_manager = ElectroluxTokenManager(
             access_token="malformed_token",
@@ -447,79 +384,243 @@ class TestElectroluxTokenManager401:
         )
 
         # JWT decode raises exception for malformed token
-        with patch(
-            "custom_components.electrolux.token_manager.jwt.decode",
-            side_effect=Exception("Invalid JWT"),
-        ):
-            # is_token_valid should return False for malformed token
-            assert token_manager.is_token_valid() is False
+        jwt_decode_mock.side_effect = Exception("Invalid JWT")
+
+        # is_token_valid should return False for malformed token
+        assert token_manager.is_token_valid() is False
 
     @pytest.mark.asyncio
-    async def test_missing_exp_claim_marks_invalid(self):
+    async def test_missing_exp_claim_marks_invalid(
+        self, jwt_decode_mock, token_manager
+    ):
         """Test that JWT without exp claim is marked as invalid."""
         mock_jwt_no_exp = {"sub": "test_user"}  # Missing 'exp' claim
 
+        jwt_decode_mock.return_value = mock_jwt_no_exp
+
+        # Token should be considered invalid without exp claim
+        assert token_manager.is_token_valid() is False
+
+    @pytest.mark.asyncio
+    async def test_exp_claim_cached_per_access_token(
+        self, jwt_decode_mock, token_manager
+    ):
+        """Test that repeated checks of the same token decode the JWT only once."""
+        valid_time = int(time.time()) + 7200
+
+        jwt_decode_mock.return_value = {"exp": valid_time, "sub": "test_user"}
+
+        assert token_manager.is_token_valid() is True
+        assert token_manager.is_token_valid() is True
+        assert jwt_decode_mock.call_count == 1
+
+        # A new access token is decoded again
+        token_manager.update("other_access", "test_refresh", "test_api_key")
+        assert token_manager.is_token_valid() is True
+        assert jwt_decode_mock.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_refreshed_token_validity_uses_expires_in(
+        self, jwt_decode_mock, request_mock, time_mock, token_manager
+    ):
+        """Test that a refreshed token is checked against expiresIn, not its JWT."""
+        fixed_time = 1000000000
+
+        jwt_decode_mock.return_value = {"exp": fixed_time - 3600, "sub": "test_user"}
+        request_mock.return_value = {
+            "accessToken": "new_access",
+            "refreshToken": "new_refresh",
+            "expiresIn": 43200,
+        }
+        time_mock.return_value = fixed_time
+
+        assert await token_manager.refresh_token() is True
+        decode_calls = jwt_decode_mock.call_count
+
+        assert token_manager.is_token_valid() is True
+        assert jwt_decode_mock.call_count == decode_calls
+
+    @pytest.mark.asyncio
+    async def test_background_refresh_keeps_requests_off_refresh_path(
+        self, jwt_decode_mock, request_mock, time_mock, token_manager
+    ):
+        """Test that the background loop refreshes before a request needs to."""
+        fixed_time = 1000000000
+        refreshed = asyncio.Event()
+
+        async def mock_request(method, url, json_body):
+            refreshed.set()
+            return {
+                "accessToken": "new_access",
+                "refreshToken": "new_refresh",
+                "expiresIn": 43200,
+            }
+
+        jwt_decode_mock.return_value = {"exp": fixed_time + 600, "sub": "test_user"}
+        request_mock.side_effect = mock_request
+        time_mock.return_value = fixed_time
+
+        task = asyncio.create_task(token_manager.run_background_refresh())
+        await asyncio.wait_for(refreshed.wait(), timeout=1)
+
+        auth_data = await token_manager.get_auth_data()
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        # The request used the background-refreshed token without refreshing inline
+        assert auth_data.access_token == "new_access"
+        assert request_mock.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_background_refresh_waits_out_failure_backoff(
+        self, jwt_decode_mock, request_mock, time_mock, token_manager, monkeypatch
+    ):
+        """Test that the background loop retries a failed refresh only after its backoff."""
+        fixed_time = 1000000000
+        sleeps = []
+
+        async def fake_sleep(delay):
+            sleeps.append(delay)
+            if len(sleeps) == 3:
+                raise asyncio.CancelledError
+
+        jwt_decode_mock.return_value = {"exp": fixed_time + 600, "sub": "test_user"}
+        request_mock.side_effect = Exception("Network error")
+        time_mock.return_value = fixed_time
+        monkeypatch.setattr(asyncio, "sleep", fake_sleep)
+
+        with pytest.raises(asyncio.CancelledError):
+            await token_manager.run_background_refresh()
+
+        # Refresh at once, then wait 120s and 240s after the first and second failures
+        assert sleeps == [0, 120, 240]
+        assert request_mock.await_count == 2
+        assert token_manager._consecutive_failures == 2
+
+    @pytest.mark.asyncio
+    async def test_background_refresh_keeps_cooldown_for_expiring_token(
+        self, jwt_decode_mock, request_mock, time_mock, token_manager
+    ):
+        """Test that the background path doesn't bypass the cooldown like requests do."""
+        fixed_time = 1000000000
+        jwt_decode_mock.return_value = {"exp": fixed_time - 3600, "sub": "test_user"}
+        time_mock.return_value = fixed_time
+        token_manager._next_allowed_refresh_at = fixed_time + 60
+
+        assert await token_manager.refresh_token(honor_cooldown=True) is False
+        request_mock.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_background_refresh_paces_short_lived_tokens(
+        self, jwt_decode_mock, request_mock, time_mock, token_manager, monkeypatch
+    ):
+        """Test that a token issued inside the buffer isn't refreshed back-to-back."""
+        fixed_time = 1000000000
+        sleeps = []
+
+        async def fake_sleep(delay):
+            sleeps.append(delay)
+            if len(sleeps) == 3:
+                raise asyncio.CancelledError
+
+        jwt_decode_mock.return_value = {"exp": fixed_time + 600, "sub": "test_user"}
+        # The new token is valid for less than the 15-minute refresh buffer
+        request_mock.return_value = {
+            "accessToken": "new_access",
+            "refreshToken": "new_refresh",
+            "expiresIn": 600,
+        }
+        time_mock.return_value = fixed_time
+        monkeypatch.setattr(asyncio, "sleep", fake_sleep)
+
+        with pytest.raises(asyncio.CancelledError):
+            await token_manager.run_background_refresh()
+
+        # Each successful refresh is followed by the retry pause, not an immediate refresh
+        assert sleeps == [0, 60, 60]
+        assert request_mock.await_count == 2
+
+    def test_exp_read_from_jwt_payload_without_pyjwt(self, jwt_decode_mock):
+        """Test that a well-formed JWT's 'exp' is read without calling jwt.decode."""
+        claims = json.dumps({"exp": int(time.time()) + 7200, "sub": "test_user"})
+        segment = base64.urlsafe_b64encode(claims.encode()).rstrip(b"=").decode()
         token_manager = ElectroluxTokenManager(
-            access_token="test_access",
+            access_token=f"header.{segment}.signature",
             refresh_token="test_refresh",
             api_key="test_api_key",
         )
 
-        with patch(
-            "custom_components.electrolux.token_manager.jwt.decode",
-            return_value=mock_jwt_no_exp,
-        ):
-            # Token should be considered invalid without exp claim
-            assert token_manager.is_token_valid() is False
+        assert token_manager.is_token_valid() is True
+
+        jwt_decode_mock.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_refresh_of_fresh_token_skips_refresh_task(self, token_manager):
+        """Test that refreshing an already-fresh token returns without a refresh task."""
+        token_manager.update_with_expiry(
+            "new_access", "new_refresh", "test_api_key", int(time.time()) + 43200
+        )
+
+        with patch.object(token_manager, "_do_refresh") as mock_do_refresh:
+            assert await token_manager.refresh_token() is True
+
+        mock_do_refresh.assert_not_called()
+        assert token_manager._refresh_task is None
+
+    @pytest.mark.asyncio
+    async def test_refresh_from_auth_error_callback_does_not_hang(
+        self, request_mock, token_manager
+    ):
+        """Test that a refresh started from inside the running refresh returns."""
+        nested_results = []
+
+        async def on_auth_error(message):
+            nested_results.append(await token_manager.refresh_token())
+
+        token_manager.set_auth_error_callback(on_auth_error)
+
+        request_mock.side_effect = Exception("401 Unauthorized")
+
+        with patch.object(token_manager, "is_token_valid", return_value=False):
+            result = await asyncio.wait_for(token_manager.refresh_token(), timeout=1)
+
+        assert result is False
+        assert nested_results == [False]
 
     @pytest.mark.asyncio
-    async def test_network_error_doesnt_trigger_reauth(self):
+    async def test_network_error_doesnt_trigger_reauth(
+        self, jwt_decode_mock, request_mock, token_manager
+    ):
         """Test that network errors don't trigger reauth callback."""
         mock_callback = AsyncMock()
 
         expired_time = int(time.time()) - 3600
         mock_expired_jwt = {"exp": expired_time, "sub": "test_user"}
 
-        token_manager = ElectroluxTokenManager(
-            access_token="test_access",
-            refresh_token="test_refresh",
-            api_key="test_api_key",
-        )
-
         token_manager.set_auth_error_callback(mock_callback)
 
         # Network error (not auth error)
         mock_exception = Exception("Connection timeout")
 
-        with (
-            patch(
-                "custom_components.electrolux.token_manager.jwt.decode",
-                return_value=mock_expired_jwt,
-            ),
-            patch(
-                "custom_components.electrolux.token_manager.request",
-                side_effect=mock_exception,
-            ),
-        ):
-            result = await token_manager.refresh_token()
+        jwt_decode_mock.return_value = mock_expired_jwt
+        request_mock.side_effect = mock_exception
 
-            # Refresh should fail but NOT trigger reauth
-            assert result is False
-            mock_callback.assert_not_called()
+        result = await token_manager.refresh_token()
+
+        # Refresh should fail but NOT trigger reauth
+        assert result is False
+        mock_callback.assert_not_called()
 
     @pytest.mark.asyncio
-    async def test_exponential_backoff_on_repeated_failures(self):
-        """Test that consecutive failures trigger exponential backoff (60→120→240→300s max)."""
+    async def test_exponential_backoff_on_repeated_failures(
+        self, jwt_decode_mock, request_mock, time_mock, token_manager
+    ):
+        """Test that consecutive failures trigger exponential backoff (120→240→300s max)."""
         fixed_time = 1000000000
         expired_time = fixed_time - 3600
         mock_expired_jwt = {"exp": expired_time, "sub": "test_user"}
 
-        token_manager = ElectroluxTokenManager(
-            access_token="test_access",
-            refresh_token="test_refresh",
-            api_key="test_api_key",
-        )
-
         mock_exception = Exception("Network error")
         refresh_attempts = 0
 
@@ -533,66 +634,56 @@ class TestElectroluxTokenManager401:
         def mock_time():
             return current_time
 
-        with (
-            patch(
-                "custom_components.electrolux.token_manager.jwt.decode",
-                return_value=mock_expired_jwt,
-            ),
-            patch(
-                "custom_components.electrolux.token_manager.request",
-                side_effect=mock_request,
-            ),
-            patch(
-                "custom_components.electrolux.token_manager.time.time",
-                side_effect=mock_time,
-            ),
-        ):
-            # First failure: cooldown = 60s
-            result1 = await token_manager.refresh_token()
-            assert result1 is False
-            assert token_manager._consecutive_failures == 1
-            assert refresh_attempts == 1
-
-            # Advance time by 61 seconds (past first cooldown)
-            current_time += 61
-
-            # Second failure: cooldown = 120s
-            result2 = await token_manager.refresh_token()
-            assert result2 is False
-            assert token_manager._consecutive_failures == 2
-            assert refresh_attempts == 2
-
-            # Advance time by 121 seconds (past second cooldown)
-            current_time += 121
-
-            # Third failure: cooldown = 240s
-            result3 = await token_manager.refresh_token()
-            assert result3 is False
-            assert token_manager._consecutive_failures == 3
-            assert refresh_attempts == 3
-
-            # Advance time by 241 seconds (past third cooldown)
-            current_time += 241
-
-            # Fourth failure: cooldown = 300s (capped at max)
-            result4 = await token_manager.refresh_token()
-            assert result4 is False
-            assert token_manager._consecutive_failures == 4
-            assert refresh_attempts == 4
+        jwt_decode_mock.return_value = mock_expired_jwt
+        request_mock.side_effect = mock_request
+        time_mock.side_effect = mock_time
+
+        # First failure: cooldown = 120s
+        result1 = await token_manager.refresh_token()
+        assert result1 is False
+        assert token_manager._consecutive_failures == 1
+        assert refresh_attempts == 1
+        assert token_manager._next_allowed_refresh_at == current_time + 120
+
+        # Advance time by 61 seconds (past first cooldown)
+        current_time += 61
+
+        # Second failure: cooldown = 240s
+        result2 = await token_manager.refresh_token()
+        assert result2 is False
+        assert token_manager._consecutive_failures == 2
+        assert refresh_attempts == 2
+        assert token_manager._next_allowed_refresh_at == current_time + 240
+
+        # Advance time by 121 seconds (past second cooldown)
+        current_time += 121
+
+        # Third failure: cooldown = 300s (capped at max)
+        result3 = await token_manager.refresh_token()
+        assert result3 is False
+        assert token_manager._consecutive_failures == 3
+        assert refresh_attempts == 3
+        assert token_manager._next_allowed_refresh_at == current_time + 300
+
+        # Advance time by 241 seconds (past third cooldown)
+        current_time += 241
+
+        # Fourth failure: cooldown stays at the 300s cap
+        result4 = await token_manager.refresh_token()
+        assert result4 is False
+        assert token_manager._consecutive_failures == 4
+        assert refresh_attempts == 4
+        assert token_manager._next_allowed_refresh_at == current_time + 300
 
     @pytest.mark.asyncio
-    async def test_cooldown_bypass_when_token_expired(self):
+    async def test_cooldown_bypass_when_token_expired(
+        self, jwt_decode_mock, request_mock, time_mock, token_manager
+    ):
         """Test that _marked_needs_refresh bypasses cooldown for expired tokens."""
         fixed_time = 1000000000
         expired_time = fixed_time - 3600  # Expired 1 hour ago
         mock_expired_jwt = {"exp": expired_time, "sub": "test_user"}
 
-        token_manager = ElectroluxTokenManager(
-            access_token="test_access",
-            refresh_token="test_refresh",
-            api_key="test_api_key",
-        )
-
         mock_exception = Exception("Network error")
         refresh_attempts = 0
 
@@ -601,36 +692,24 @@ class TestElectroluxTokenManager401:
             refresh_attempts += 1
             raise mock_exception
 
-        with (
-            patch(
-                "custom_components.electrolux.token_manager.jwt.decode",
-                return_value=mock_expired_jwt,
-            ),
-            patch(
-                "custom_components.electrolux.token_manager.request",
-                side_effect=mock_request,
-            ),
-            patch(
-                "custom_components.electrolux.token_manager.time.time",
-                return_value=fixed_time,
-            ),
-        ):
-            # First refresh fails, setting cooldown
-            result1 = await token_manager.refresh_token()
-            assert result1 is False
-            assert refresh_attempts == 1
+        jwt_decode_mock.return_value = mock_expired_jwt
+        request_mock.side_effect = mock_request
+        time_mock.return_value = fixed_time
 
-            # is_token_valid marks token as needing refresh
-            is_valid = token_manager.is_token_valid()
-            assert is_valid is False
-            assert token_manager._marked_needs_refresh is True
+        # First refresh fails, setting cooldown
+        result1 = await token_manager.refresh_token()
+        assert result1 is False
+        assert refresh_attempts == 1
 
-            # Second refresh should bypass cooldown due to _marked_needs_refresh
-            result2 = await token_manager.refresh_token()
-            assert result2 is False
-            assert (
-                refresh_attempts == 2
-            ), "Cooldown should be bypassed when token expired"
+        # is_token_valid marks token as needing refresh
+        is_valid = token_manager.is_token_valid()
+        assert is_valid is False
+        assert token_manager._marked_needs_refresh is True
+
+        # Second refresh should bypass cooldown due to _marked_needs_refresh
+        result2 = await token_manager.refresh_token()
+        assert result2 is False
+        assert refresh_attempts == 2, "Cooldown should be bypassed when token expired"
 
 
 class TestTokenManagerMissingCoverage:
@@ -640,8 +719,6 @@ class TestTokenManagerMissingCoverage:
 
     def test_is_token_valid_returns_false_when_no_auth_data(self):
         """Lines 70-73 — is_token_valid returns False when _auth_data is None."""
-        from custom_components.electrolux.token_manager import ElectroluxTokenManager
-
         tm = ElectroluxTokenManager(
             access_token="tok",
             refresh_token="ref",
@@ -652,10 +729,6 @@ class TestTokenManagerMissingCoverage:
 
     def test_is_token_valid_returns_false_when_access_token_empty(self):
         """Lines 70-73 — is_token_valid returns False when access_token is falsy."""
-        from unittest.mock import MagicMock
-
-        from custom_components.electrolux.token_manager import ElectroluxTokenManager
-
         tm = ElectroluxTokenManager(
             access_token="tok",
             refresh_token="ref",
@@ -670,12 +743,6 @@ class TestTokenManagerMissingCoverage:
 
     def test_is_token_valid_handles_expired_signature_error(self):
         """Lines 118-120 — ExpiredSignatureError is caught and returns False."""
-        from unittest.mock import patch
-
-        import jwt as pyjwt
-
-        from custom_components.electrolux.token_manager import ElectroluxTokenManager
-
         tm = ElectroluxTokenManager(
             access_token="tok",
             refresh_token="ref",
@@ -694,20 +761,16 @@ class TestTokenManagerMissingCoverage:
     @pytest.mark.asyncio
     async def test_refresh_token_returns_false_on_cooldown(self):
         """Lines 170-175 — refresh_token returns False when on cooldown (no bypass flag)."""
-        import time as time_module
-        from unittest.mock import patch
-
-        from custom_components.electrolux.token_manager import ElectroluxTokenManager
-
         tm = ElectroluxTokenManager(
             access_token="tok",
             refresh_token="ref",
             api_key="key",
         )
-        current_time = int(time_module.time())
+        current_time = int(time.time())
         # Set failure history so backoff applies
         tm._consecutive_failures = 1
-        tm._last_failed_refresh = current_time - 10  # failed 10s ago (backoff=120s)
+        # Failed 10s ago (backoff=120s)
+        tm._next_allowed_refresh_at = current_time + 110
         tm._marked_needs_refresh = False  # no bypass
 
         with patch(
@@ -725,12 +788,6 @@ class TestTokenManagerMissingCoverage:
     @pytest.mark.asyncio
     async def test_refresh_token_raises_when_refresh_token_is_none(self):
         """Lines 188-191 — ConfigEntryAuthFailed is raised when refresh_token is None."""
-        from unittest.mock import MagicMock, patch
-
-        from homeassistant.exceptions import ConfigEntryAuthFailed
-
-        from custom_components.electrolux.token_manager import ElectroluxTokenManager
-
         tm = ElectroluxTokenManager(
             access_token="tok",
             refresh_token="ref",
@@ -750,10 +807,6 @@ class TestTokenManagerMissingCoverage:
     @pytest.mark.asyncio
     async def test_refresh_token_logs_warning_when_no_auth_error_callback(self):
         """Line 286 — logs warning when permanent auth error but no callback registered."""
-        from unittest.mock import patch
-
-        from custom_components.electrolux.token_manager import ElectroluxTokenManager
-
         tm = ElectroluxTokenManager(
             access_token="tok",
             refresh_token="ref",
@@ -781,8 +834,6 @@ class TestTokenManagerMissingCoverage:
 @pytest.mark.asyncio
 async def test_refresh_token_returns_false_when_permanent_auth_failure():
     """L159-163: _permanent_auth_failure=True → refresh_token logs and returns False."""
-    from custom_components.electrolux.token_manager import ElectroluxTokenManager
-
     tm = ElectroluxTokenManager(
         access_token="tok",
         refresh_token="ref",
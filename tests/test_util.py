@@ -1,11 +1,15 @@
 """Tests for Electrolux util helpers."""
 
-from unittest.mock import AsyncMock, MagicMock
+import json
+import logging
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from homeassistant.exceptions import HomeAssistantError
 
+from custom_components.electrolux.const import TIME_INVALID_SENTINEL
 from custom_components.electrolux.util import (
+    DOMAIN,
     ApplianceOfflineError,
     AuthenticationError,
     CommandError,
@@ -14,8 +18,18 @@ from custom_components.electrolux.util import (
     NetworkError,
     RateLimitError,
     RemoteControlDisabledError,
+    _parse_error_detail_for_user_message,
+    celsius_to_fahrenheit,
+    create_notification,
+    execute_command_with_error_handling,
+    fahrenheit_to_celsius,
     format_command_for_appliance,
+    get_capability,
+    map_command_error_to_home_assistant_error,
+    should_send_notification,
     string_to_boolean,
+    time_minutes_to_seconds,
+    time_seconds_to_minutes,
 )
 
 
@@ -34,8 +48,6 @@ async def test_report_token_refresh_creates_issue(monkeypatch):
         fake_create_issue,
     )
 
-    from custom_components.electrolux.util import DOMAIN
-
     hass = MagicMock()
     # Mock config_entries to return empty list so issue_id doesn't include entry_id
     hass.config_entries.async_entries.return_value = []
@@ -84,10 +96,6 @@ class TestExecuteCommandWithErrorHandling:
     @pytest.mark.asyncio
     async def test_command_success(self):
         """Test successful command execution."""
-        from custom_components.electrolux.util import (
-            execute_command_with_error_handling,
-        )
-
         mock_client = MagicMock()
         mock_client.execute_appliance_command = AsyncMock(return_value={"status": "ok"})
         mock_logger = MagicMock()
@@ -106,10 +114,6 @@ class TestExecuteCommandWithErrorHandling:
     @pytest.mark.asyncio
     async def test_command_remote_control_disabled(self):
         """Test command fails with remote control disabled error."""
-        from custom_components.electrolux.util import (
-            execute_command_with_error_handling,
-        )
-
         mock_client = MagicMock()
         mock_client.execute_appliance_command = AsyncMock(
             side_effect=Exception("Remote control disabled")
@@ -128,10 +132,6 @@ class TestExecuteCommandWithErrorHandling:
     @pytest.mark.asyncio
     async def test_command_appliance_disconnected(self):
         """Test command fails with appliance disconnected error."""
-        from custom_components.electrolux.util import (
-            execute_command_with_error_handling,
-        )
-
         mock_client = MagicMock()
         mock_client.execute_appliance_command = AsyncMock(
             side_effect=Exception("Appliance disconnected")
@@ -150,11 +150,6 @@ class TestExecuteCommandWithErrorHandling:
     @pytest.mark.asyncio
     async def test_command_authentication_error(self):
         """Test command fails with authentication error."""
-        from custom_components.electrolux.util import (
-            AuthenticationError,
-            execute_command_with_error_handling,
-        )
-
         mock_client = MagicMock()
         mock_client.execute_appliance_command = AsyncMock(
             side_effect=Exception("401 Unauthorized")
@@ -502,8 +497,6 @@ class TestShouldSendNotification:
 
     def test_not_needed_always_false(self):
         """Returns False when alert_status is NOT_NEEDED regardless of config."""
-        from custom_components.electrolux.util import should_send_notification
-
         config_entry = MagicMock()
         config_entry.data = {
             "notifications": True,
@@ -514,48 +507,36 @@ class TestShouldSendNotification:
 
     def test_diagnostic_respects_config_true(self):
         """DIAGNOSTIC alerts enabled when CONF_NOTIFICATION_DIAG is True."""
-        from custom_components.electrolux.util import should_send_notification
-
         config_entry = MagicMock()
         config_entry.data = {"notifications_diagnostic": True}
         assert should_send_notification(config_entry, "DIAGNOSTIC", "NEW") is True
 
     def test_diagnostic_respects_config_false(self):
         """DIAGNOSTIC alerts disabled when CONF_NOTIFICATION_DIAG is False."""
-        from custom_components.electrolux.util import should_send_notification
-
         config_entry = MagicMock()
         config_entry.data = {"notifications_diagnostic": False}
         assert should_send_notification(config_entry, "DIAGNOSTIC", "NEW") is False
 
     def test_warning_respects_config_true(self):
         """WARNING alerts enabled when CONF_NOTIFICATION_WARNING is True."""
-        from custom_components.electrolux.util import should_send_notification
-
         config_entry = MagicMock()
         config_entry.data = {"notifications_warning": True}
         assert should_send_notification(config_entry, "WARNING", "NEW") is True
 
     def test_warning_respects_config_false(self):
         """WARNING alerts disabled when CONF_NOTIFICATION_WARNING is False."""
-        from custom_components.electrolux.util import should_send_notification
-
         config_entry = MagicMock()
         config_entry.data = {"notifications_warning": False}
         assert should_send_notification(config_entry, "WARNING", "NEW") is False
 
     def test_other_severity_uses_default_true(self):
         """Non-DIAGNOSTIC/WARNING severity uses CONF_NOTIFICATION_DEFAULT."""
-        from custom_components.electrolux.util import should_send_notification
-
         config_entry = MagicMock()
         config_entry.data = {"notifications": True}
         assert should_send_notification(config_entry, "CRITICAL", "NEW") is True
 
     def test_other_severity_default_missing_returns_true(self):
         """Non-DIAGNOSTIC/WARNING severity returns True when CONF_NOTIFICATION_DEFAULT not set."""
-        from custom_components.electrolux.util import should_send_notification
-
         config_entry = MagicMock()
         config_entry.data = {}
         # get("notifications", True) returns True when missing
@@ -567,46 +548,30 @@ class TestTimeConversions:
 
     def test_time_seconds_to_minutes_none(self):
         """Returns None when input is None."""
-        from custom_components.electrolux.util import time_seconds_to_minutes
-
         assert time_seconds_to_minutes(None) is None
 
     def test_time_seconds_to_minutes_sentinel(self):
         """Returns sentinel when input is sentinel."""
-        from custom_components.electrolux.const import TIME_INVALID_SENTINEL
-        from custom_components.electrolux.util import time_seconds_to_minutes
-
         assert time_seconds_to_minutes(TIME_INVALID_SENTINEL) == TIME_INVALID_SENTINEL
 
     def test_time_seconds_to_minutes_zero(self):
         """Converts 0 seconds to 0 minutes."""
-        from custom_components.electrolux.util import time_seconds_to_minutes
-
         assert time_seconds_to_minutes(0) == 0
 
     def test_time_seconds_to_minutes_typical(self):
         """Converts 3600 seconds to 60 minutes."""
-        from custom_components.electrolux.util import time_seconds_to_minutes
-
         assert time_seconds_to_minutes(3600) == 60
 
     def test_time_minutes_to_seconds_none(self):
         """Returns None when input is None."""
-        from custom_components.electrolux.util import time_minutes_to_seconds
-
         assert time_minutes_to_seconds(None) is None
 
     def test_time_minutes_to_seconds_sentinel(self):
         """Returns sentinel when input is sentinel."""
-        from custom_components.electrolux.const import TIME_INVALID_SENTINEL
-        from custom_components.electrolux.util import time_minutes_to_seconds
-
         assert time_minutes_to_seconds(TIME_INVALID_SENTINEL) == TIME_INVALID_SENTINEL
 
     def test_time_minutes_to_seconds_typical(self):
         """Converts 60 minutes to 3600 seconds."""
-        from custom_components.electrolux.util import time_minutes_to_seconds
-
         assert time_minutes_to_seconds(60) == 3600
 
 
@@ -615,44 +580,30 @@ class TestTemperatureConversions:
 
     def test_celsius_to_fahrenheit_none(self):
         """Returns None for None input."""
-        from custom_components.electrolux.util import celsius_to_fahrenheit
-
         assert celsius_to_fahrenheit(None) is None
 
     def test_celsius_to_fahrenheit_zero(self):
         """0°C = 32°F."""
-        from custom_components.electrolux.util import celsius_to_fahrenheit
-
         assert celsius_to_fahrenheit(0) == 32.0
 
     def test_celsius_to_fahrenheit_hundred(self):
         """100°C = 212°F."""
-        from custom_components.electrolux.util import celsius_to_fahrenheit
-
         assert celsius_to_fahrenheit(100) == 212.0
 
     def test_celsius_to_fahrenheit_body_temp(self):
         """37°C ≈ 98.6°F."""
-        from custom_components.electrolux.util import celsius_to_fahrenheit
-
         assert celsius_to_fahrenheit(37) == 98.6
 
     def test_fahrenheit_to_celsius_none(self):
         """Returns None for None input."""
-        from custom_components.electrolux.util import fahrenheit_to_celsius
-
         assert fahrenheit_to_celsius(None) is None
 
     def test_fahrenheit_to_celsius_freezing(self):
         """32°F = 0°C."""
-        from custom_components.electrolux.util import fahrenheit_to_celsius
-
         assert fahrenheit_to_celsius(32) == 0.0
 
     def test_fahrenheit_to_celsius_boiling(self):
         """212°F = 100°C."""
-        from custom_components.electrolux.util import fahrenheit_to_celsius
-
         assert fahrenheit_to_celsius(212) == 100.0
 
 
@@ -664,10 +615,6 @@ class TestParseErrorDetailForUserMessage:
 
     def _parse(self, detail, capability=None):
         """Call the private function directly (tested via import)."""
-        from custom_components.electrolux.util import (
-            _parse_error_detail_for_user_message,
-        )
-
         return _parse_error_detail_for_user_message(detail.lower(), capability)
 
     def test_returns_none_for_unknown_detail(self):
@@ -747,27 +694,19 @@ class TestGetCapability:
 
     def test_returns_none_for_missing_key(self):
         """Returns None when key is not present."""
-        from custom_components.electrolux.util import get_capability
-
         assert get_capability({}, "missing_key") is None
 
     def test_returns_scalar_value(self):
         """Returns scalar value directly."""
-        from custom_components.electrolux.util import get_capability
-
         assert get_capability({"temp": 21.5}, "temp") == 21.5
 
     def test_returns_default_from_dict(self):
         """Returns 'default' value from nested dict capability."""
-        from custom_components.electrolux.util import get_capability
-
         cap = {"mode": {"default": "COOL", "values": {"COOL": {}}}}
         assert get_capability(cap, "mode") == "COOL"
 
     def test_returns_none_for_dict_without_default(self):
         """Returns None when capability is a dict but has no 'default' key."""
-        from custom_components.electrolux.util import get_capability
-
         cap = {"mode": {"values": {"COOL": {}}}}
         result = get_capability(cap, "mode")
         assert result is None
@@ -778,8 +717,6 @@ class TestCreateNotification:
 
     def test_notification_not_sent_when_not_needed(self):
         """No notification is created when should_send_notification returns False."""
-        from custom_components.electrolux.util import create_notification
-
         hass = MagicMock()
         config_entry = MagicMock()
         config_entry.data = {}  # CONF_NOTIFICATION_DEFAULT defaults to True
@@ -790,8 +727,6 @@ class TestCreateNotification:
 
     def test_notification_sent_for_default_severity(self):
         """Notification is created for default severity with default config."""
-        from custom_components.electrolux.util import create_notification
-
         hass = MagicMock()
         config_entry = MagicMock()
         config_entry.data = {"notifications": True}
@@ -804,8 +739,6 @@ class TestMapCommandError:
     """Tests for map_command_error_to_home_assistant_error covering all Methods 1-3."""
 
     def _logger(self):
-        import logging
-
         return MagicMock(spec=logging.Logger)
 
     # ------------------------------------------------------------------ #
@@ -869,40 +802,24 @@ class TestMapCommandError:
 
     def test_response_json_remote_control_disabled_error_code(self):
         """Method 1: Response JSON with REMOTE_CONTROL_DISABLED → remote control msg."""
-        from custom_components.electrolux.util import (
-            map_command_error_to_home_assistant_error,
-        )
-
         ex = self._ex_with_response_json({"error": "REMOTE_CONTROL_DISABLED"})
         result = map_command_error_to_home_assistant_error(ex, "attr", self._logger())
         assert "Remote control" in str(result)
 
     def test_response_json_appliance_offline_error_code(self):
         """Method 1: Response JSON with APPLIANCE_OFFLINE → disconnected msg."""
-        from custom_components.electrolux.util import (
-            map_command_error_to_home_assistant_error,
-        )
-
         ex = self._ex_with_response_json({"error": "APPLIANCE_OFFLINE"})
         result = map_command_error_to_home_assistant_error(ex, "attr", self._logger())
         assert "disconnected" in str(result).lower() or "offline" in str(result).lower()
 
     def test_response_json_rate_limit_exceeded_error_code(self):
         """Method 1: RATE_LIMIT_EXCEEDED error code → rate limit msg."""
-        from custom_components.electrolux.util import (
-            map_command_error_to_home_assistant_error,
-        )
-
         ex = self._ex_with_response_json({"error": "RATE_LIMIT_EXCEEDED"})
         result = map_command_error_to_home_assistant_error(ex, "attr", self._logger())
         assert "Too many" in str(result)
 
     def test_response_json_command_validation_remote_control_detail(self):
         """Method 1: COMMAND_VALIDATION_ERROR + 'remote control' detail → remote control msg."""
-        from custom_components.electrolux.util import (
-            map_command_error_to_home_assistant_error,
-        )
-
         ex = self._ex_with_response_json(
             {
                 "error": "COMMAND_VALIDATION_ERROR",
@@ -914,10 +831,6 @@ class TestMapCommandError:
 
     def test_response_json_command_validation_with_pattern_detail(self):
         """Method 1: COMMAND_VALIDATION_ERROR + parseable detail → derived message."""
-        from custom_components.electrolux.util import (
-            map_command_error_to_home_assistant_error,
-        )
-
         ex = self._ex_with_response_json(
             {
                 "error": "COMMAND_VALIDATION_ERROR",
@@ -931,10 +844,6 @@ class TestMapCommandError:
 
     def test_response_json_command_validation_generic_detail(self):
         """Method 1: COMMAND_VALIDATION_ERROR + generic non-pattern detail → 'Command not accepted' msg."""
-        from custom_components.electrolux.util import (
-            map_command_error_to_home_assistant_error,
-        )
-
         ex = self._ex_with_response_json(
             {
                 "error": "COMMAND_VALIDATION_ERROR",
@@ -946,11 +855,6 @@ class TestMapCommandError:
 
     def test_response_text_only_no_json_method(self):
         """Method 1: response has .text but no .json() → text branch (elif) executes."""
-        import json
-
-        from custom_components.electrolux.util import (
-            map_command_error_to_home_assistant_error,
-        )
 
         # Response has text but NO json() method → triggers the elif branch
         class _Resp:
@@ -968,42 +872,24 @@ class TestMapCommandError:
 
     def test_response_text_directly(self):
         """Method 1: response.text (no json method) is parsed to get error code."""
-        import json
-
-        from custom_components.electrolux.util import (
-            map_command_error_to_home_assistant_error,
-        )
-
         ex = self._ex_with_response_text(json.dumps({"error": "RC_DISABLED"}))
         result = map_command_error_to_home_assistant_error(ex, "attr", self._logger())
         assert "Remote control" in str(result)
 
     def test_exception_with_error_data_attribute(self):
         """Method 1: exception.error_data dict provides error code."""
-        from custom_components.electrolux.util import (
-            map_command_error_to_home_assistant_error,
-        )
-
         ex = self._ex_with_error_data({"error": "RATE_LIMIT"})
         result = map_command_error_to_home_assistant_error(ex, "attr", self._logger())
         assert "Too many" in str(result)
 
     def test_exception_with_details_attribute(self):
         """Method 1: exception.details dict provides error code."""
-        from custom_components.electrolux.util import (
-            map_command_error_to_home_assistant_error,
-        )
-
         ex = self._ex_with_details({"error": "CONNECTION_LOST"})
         result = map_command_error_to_home_assistant_error(ex, "attr", self._logger())
         assert "disconnected" in str(result).lower() or isinstance(result, Exception)
 
     def test_exception_string_with_embedded_json(self):
         """Method 1: JSON extracted from exception string via regex."""
-        from custom_components.electrolux.util import (
-            map_command_error_to_home_assistant_error,
-        )
-
         # str(ex) will contain message='{"error": "CONNECTION_LOST"}'
         ex = Exception('API Error: message=\'{"error": "CONNECTION_LOST"}\'')
         result = map_command_error_to_home_assistant_error(ex, "attr", self._logger())
@@ -1011,9 +897,6 @@ class TestMapCommandError:
 
     def test_status_code_from_response_status_attr(self):
         """Method 1: status_code extracted from exception.response.status."""
-        from custom_components.electrolux.util import (
-            map_command_error_to_home_assistant_error,
-        )
 
         # exception.status is None, but exception.response.status = 403
         class _Resp:
@@ -1033,9 +916,6 @@ class TestMapCommandError:
 
     def test_status_code_from_status_code_attribute(self):
         """Method 1: status_code extracted from exception.status_code when no .status."""
-        from custom_components.electrolux.util import (
-            map_command_error_to_home_assistant_error,
-        )
 
         class _Ex(Exception):
             status_code: object = None
@@ -1051,10 +931,6 @@ class TestMapCommandError:
 
     def test_type_mismatch_in_exception_string(self):
         """'type mismatch' in exception message → type_mismatch HA error."""
-        from custom_components.electrolux.util import (
-            map_command_error_to_home_assistant_error,
-        )
-
         ex = Exception("Error: type mismatch for cavityLight")
         result = map_command_error_to_home_assistant_error(
             ex, "cavityLight", self._logger()
@@ -1067,9 +943,6 @@ class TestMapCommandError:
 
     def test_http_403_returns_remote_control(self):
         """HTTP 403 → remote control disabled message."""
-        from custom_components.electrolux.util import (
-            map_command_error_to_home_assistant_error,
-        )
 
         class _Ex(Exception):
             status = 403
@@ -1081,9 +954,6 @@ class TestMapCommandError:
 
     def test_http_429_returns_rate_limit(self):
         """HTTP 429 → too many commands message."""
-        from custom_components.electrolux.util import (
-            map_command_error_to_home_assistant_error,
-        )
 
         class _Ex(Exception):
             status = 429
@@ -1095,9 +965,6 @@ class TestMapCommandError:
 
     def test_http_503_returns_disconnected(self):
         """HTTP 503 → appliance disconnected message."""
-        from custom_components.electrolux.util import (
-            map_command_error_to_home_assistant_error,
-        )
 
         class _Ex(Exception):
             status = 503
@@ -1110,10 +977,6 @@ class TestMapCommandError:
     @pytest.mark.parametrize("status", [500, 502, 504])
     def test_http_5xx_transient_returns_service_temporarily_unavailable(self, status):
         """HTTP 500/502/504 → 'service temporarily unavailable' translation key."""
-        from custom_components.electrolux.util import (
-            DOMAIN,
-            map_command_error_to_home_assistant_error,
-        )
 
         class _Ex(Exception):
             def __init__(self, *args, status=None, **kwargs):
@@ -1136,10 +999,6 @@ class TestMapCommandError:
     @pytest.mark.parametrize("status", [500, 502, 504])
     def test_http_5xx_transient_logs_at_warning_not_error(self, status):
         """HTTP 500/502/504 → logger.warning, never logger.error (transient fault)."""
-        from custom_components.electrolux.util import (
-            map_command_error_to_home_assistant_error,
-        )
-
         logger = self._logger()
 
         class _Ex(Exception):
@@ -1156,9 +1015,6 @@ class TestMapCommandError:
 
     def test_http_406_plain_returns_command_not_accepted(self):
         """HTTP 406 without special detail → command not accepted."""
-        from custom_components.electrolux.util import (
-            map_command_error_to_home_assistant_error,
-        )
 
         class _Ex(Exception):
             status = 406
@@ -1170,9 +1026,6 @@ class TestMapCommandError:
 
     def test_http_406_with_remote_control_detail(self):
         """HTTP 406 + error detail has 'remote control' → remote control msg."""
-        from custom_components.electrolux.util import (
-            map_command_error_to_home_assistant_error,
-        )
 
         class _Ex(Exception):
             status = 406
@@ -1185,9 +1038,6 @@ class TestMapCommandError:
 
     def test_http_406_with_parseable_detail(self):
         """HTTP 406 + parseable detail pattern → derived message."""
-        from custom_components.electrolux.util import (
-            map_command_error_to_home_assistant_error,
-        )
 
         class _Ex(Exception):
             status = 406
@@ -1202,9 +1052,6 @@ class TestMapCommandError:
 
     def test_http_406_with_generic_custom_detail(self):
         """HTTP 406 + non-pattern detail → 'Command not accepted: <detail>' msg."""
-        from custom_components.electrolux.util import (
-            map_command_error_to_home_assistant_error,
-        )
 
         class _Ex(Exception):
             status = 406
@@ -1221,50 +1068,30 @@ class TestMapCommandError:
 
     def test_rate_limit_string_pattern(self):
         """Method 3: 'rate limit' substring → rate limit message."""
-        from custom_components.electrolux.util import (
-            map_command_error_to_home_assistant_error,
-        )
-
         ex = Exception("rate limit exceeded for this device")
         result = map_command_error_to_home_assistant_error(ex, "attr", self._logger())
         assert "Too many" in str(result)
 
     def test_throttled_string_pattern(self):
         """Method 3: 'throttled' substring → rate limit message."""
-        from custom_components.electrolux.util import (
-            map_command_error_to_home_assistant_error,
-        )
-
         ex = Exception("request was throttled by the API")
         result = map_command_error_to_home_assistant_error(ex, "attr", self._logger())
         assert "Too many" in str(result)
 
     def test_command_validation_string_pattern(self):
         """Method 3: 'command validation' substring → command not accepted."""
-        from custom_components.electrolux.util import (
-            map_command_error_to_home_assistant_error,
-        )
-
         ex = Exception("command validation failed for operation")
         result = map_command_error_to_home_assistant_error(ex, "attr", self._logger())
         assert isinstance(result, Exception)
 
     def test_not_acceptable_string_pattern(self):
         """Method 3: 'not acceptable' substring → command not accepted."""
-        from custom_components.electrolux.util import (
-            map_command_error_to_home_assistant_error,
-        )
-
         ex = Exception("406 not acceptable returned")
         result = map_command_error_to_home_assistant_error(ex, "attr", self._logger())
         assert isinstance(result, Exception)
 
     def test_generic_default_error(self):
         """No pattern match → generic 'Command failed' error."""
-        from custom_components.electrolux.util import (
-            map_command_error_to_home_assistant_error,
-        )
-
         ex = Exception("completely unknown xyzzy error")
         result = map_command_error_to_home_assistant_error(ex, "attr", self._logger())
         assert "Command failed" in str(result)
@@ -1275,8 +1102,6 @@ class TestFormatCommandEdgeCases:
 
     def test_boolean_type_with_numeric_converts_via_bool(self):
         """Boolean capability with numeric value → bool() conversion (line 791)."""
-        from custom_components.electrolux.util import format_command_for_appliance
-
         cap = {"type": "boolean"}
         assert format_command_for_appliance(cap, "attr", 1) is True
         assert format_command_for_appliance(cap, "attr", 0) is False
@@ -1284,16 +1109,12 @@ class TestFormatCommandEdgeCases:
 
     def test_number_type_with_invalid_string_returns_original(self):
         """ValueError in numeric conversion → original value returned (lines 824-828)."""
-        from custom_components.electrolux.util import format_command_for_appliance
-
         cap = {"type": "number", "min": 0.0, "max": 100.0}
         result = format_command_for_appliance(cap, "targetTemperatureC", "not_a_number")
         assert result == "not_a_number"
 
     def test_number_type_step_without_min(self):
         """Number capability with step but no min → step_base=0 (inner step calc)."""
-        from custom_components.electrolux.util import format_command_for_appliance
-
         cap = {"type": "number", "step": 5.0}
         # 7 → step_base=0, steps=7/5=1.4 → round=1 → 0+5=5.0
         result = format_command_for_appliance(cap, "someAttr", 7)
@@ -1301,24 +1122,18 @@ class TestFormatCommandEdgeCases:
 
     def test_unknown_type_bool_returns_on_off_strings(self):
         """Capability with unknown type + bool value → 'ON'/'OFF' (lines 869-875)."""
-        from custom_components.electrolux.util import format_command_for_appliance
-
         cap = {"type": "custom_weird_type"}
         assert format_command_for_appliance(cap, "someAttr", True) == "ON"
         assert format_command_for_appliance(cap, "someAttr", False) == "OFF"
 
     def test_unknown_type_non_bool_returns_value_as_is(self):
         """Capability with unknown type + non-bool value → value unchanged (line 874)."""
-        from custom_components.electrolux.util import format_command_for_appliance
-
         cap = {"type": "custom_weird_type"}
         assert format_command_for_appliance(cap, "someAttr", "hello") == "hello"
         assert format_command_for_appliance(cap, "someAttr", 99) == 99
 
     def test_string_type_empty_values_returns_str(self):
         """String type with empty values dict → str(value)."""
-        from custom_components.electrolux.util import format_command_for_appliance
-
         cap = {"type": "string", "values": {}}
         assert format_command_for_appliance(cap, "attr", 42) == "42"
         assert format_command_for_appliance(cap, "attr", True) == "True"
@@ -1329,8 +1144,6 @@ class TestFormatCommandEdgeCases:
         Regression test: Electrolux API returns HTTP 500 when a float (e.g. 3.0)
         is sent for an int-typed capability like Fanspeed.
         """
-        from custom_components.electrolux.util import format_command_for_appliance
-
         fanspeed_cap = {"type": "int", "min": 1, "max": 9, "step": 1}
         result = format_command_for_appliance(fanspeed_cap, "Fanspeed", 3)
         assert result == 3
@@ -1349,8 +1162,6 @@ class TestFormatCommandEdgeCases:
         Even if the attr name doesn't contain 'temperature', the type field alone
         is sufficient to trigger integer conversion.
         """
-        from custom_components.electrolux.util import format_command_for_appliance
-
         temp_cap = {"type": "temperature", "min": 1.0, "max": 7.0, "step": 1.0}
         result = format_command_for_appliance(temp_cap, "fridgeSetpoint", 4)
         assert result == 4
@@ -1363,8 +1174,6 @@ class TestFormatCommandEdgeCases:
         guard was unnecessary — no appliance sample has a fractional step, and even if
         it did, sending 2 instead of 2.0 is always safe.
         """
-        from custom_components.electrolux.util import format_command_for_appliance
-
         # Fractional step=0.5, but value is a whole number → must return int
         cap = {"type": "number", "min": 0.0, "max": 10.0, "step": 0.5}
         result = format_command_for_appliance(cap, "someValue", 2.0)
@@ -1380,8 +1189,6 @@ class TestFormatCommandEdgeCases:
         format_command_for_appliance was converting 120 → 120.0 (float), causing
         HTTP 500. The fix detects integer steps and returns int instead of float.
         """
-        from custom_components.electrolux.util import format_command_for_appliance
-
         anti_crease_cap = {"type": "number", "min": 30, "max": 120, "step": 30}
         for val in [30, 60, 90, 120, 30.0, 60.0, 90.0, 120.0]:
             result = format_command_for_appliance(
@@ -1398,8 +1205,6 @@ class TestFormatCommandEdgeCases:
         Only a value that cannot be represented as int (i.e. 24.5 ≠ int(24.5)=24)
         escapes the int-return path. Whole numbers like 24.0 always become 24.
         """
-        from custom_components.electrolux.util import format_command_for_appliance
-
         temp_cap = {"type": "number", "min": 15.56, "max": 32.22, "step": 0.5}
         result = format_command_for_appliance(temp_cap, "targetTemperatureC", 24.5)
         assert isinstance(result, float)
@@ -1409,15 +1214,9 @@ class TestUtilMissingCoverage:
     """Tests targeting the remaining missed lines in util.py."""
 
     def _logger(self):
-        import logging
-
         return MagicMock(spec=logging.Logger)
 
     def _map(self, ex, **kwargs):
-        from custom_components.electrolux.util import (
-            map_command_error_to_home_assistant_error,
-        )
-
         return map_command_error_to_home_assistant_error(
             ex, "attr", self._logger(), **kwargs
         )
@@ -1479,8 +1278,6 @@ class TestUtilMissingCoverage:
 
     def test_outer_parsing_exception_is_swallowed(self):
         """When re.search raises inside the outer parsing try-block, the except swallows it (lines 429-433)."""
-        from unittest.mock import patch
-
         ex = Exception("plain exception no special attrs")
 
         with patch(
@@ -1514,7 +1311,6 @@ class TestUtilMissingCoverage:
 
     def test_command_validation_error_detail_parsing_raises_is_swallowed(self):
         """When _parse_error_detail_for_user_message raises inside COMMAND_VALIDATION_ERROR handler, it's swallowed (lines 512-514)."""
-        from unittest.mock import patch
 
         class _Ex(Exception):
             error_data: object = None
@@ -1537,7 +1333,6 @@ class TestUtilMissingCoverage:
 
     def test_406_detail_parsing_raises_is_swallowed(self):
         """When _parse_error_detail_for_user_message raises in 406 handler, it's swallowed (lines 597-598)."""
-        from unittest.mock import patch
 
         class _Ex(Exception):
             status_code: object = None